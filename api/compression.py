@@ -0,0 +1,294 @@
+"""
+응답 압축 미들웨어
+
+`Accept-Encoding`으로 zstd / brotli / gzip 중 하나를 골라 JSON, NDJSON 등 텍스트 응답을 압축합니다.
+사주/일괄/달력 응답은 같은 키와 값이 반복되므로 압축률이 높습니다.
+
+- 일반 응답: 본문이 `minimum_size` 이상일 때만 압축하고 `Content-Length`를 다시 계산합니다.
+  큰 본문(일괄 계산 등)은 이벤트 루프를 막지 않도록 스레드풀에서 압축합니다.
+- 스트리밍 응답(NDJSON): 전체를 모으지 않고 입력이 `stream_flush_bytes`만큼 쌓일 때마다 압축 + flush해 보냅니다.
+  (줄마다 압축기를 호출하면 CPU 비용이 늘고, brotli 저품질에서는 압축률도 크게 떨어짐)
+- 압축 대상 형식의 응답과 304 응답에는 (실제 압축 여부와 관계없이) 항상 `Vary: Accept-Encoding`을 붙여
+  200과 304의 헤더가 같도록 합니다. ETag는 바꾸지 않으므로, ETag를 붙이는 라우트는 약한 ETag(W/)를 사용해야 합니다.
+- 이미 `Content-Encoding`이 있거나 `Cache-Control: no-transform`인 응답, HEAD 요청은 그대로 보냅니다.
+
+brotli(`brotli`)와 zstd(`zstandard`) 패키지가 없으면 해당 인코딩은 협상에서 제외되고 gzip만 사용합니다.
+
+환경 변수:
+    COMPRESSION_ENABLED=true              응답 압축 사용 여부
+    COMPRESSION_ENCODINGS=zstd,br,gzip    사용할 인코딩 (클라이언트 q값이 같으면 앞쪽 우선)
+    COMPRESSION_MINIMUM_SIZE=1024         이보다 작은 일반 응답은 압축하지 않음 (bytes)
+    COMPRESSION_GZIP_LEVEL=6              gzip 압축 레벨 (1~9)
+    COMPRESSION_BROTLI_QUALITY=4          brotli 품질 (0~11, 높을수록 느림)
+    COMPRESSION_ZSTD_LEVEL=3              zstd 압축 레벨 (1~22)
+    COMPRESSION_STREAM_FLUSH_BYTES=16384  스트리밍 응답에서 압축/전송 단위 (압축 전 bytes, 0이면 청크마다)
+"""
+
+import zlib
+from functools import lru_cache
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성 (없으면 협상에서 제외)
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성 (없으면 협상에서 제외)
+    zstandard = None
+
+
+class CompressionSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="COMPRESSION_", env_file=".env", extra="ignore")
+
+    enabled: bool = True
+    encodings: str = "zstd,br,gzip"
+    minimum_size: int = Field(default=1024, ge=0)
+    gzip_level: int = Field(default=6, ge=1, le=9)
+    brotli_quality: int = Field(default=4, ge=0, le=11)
+    zstd_level: int = Field(default=3, ge=1, le=22)
+    stream_flush_bytes: int = Field(default=16384, ge=0)
+
+
+compression_settings = CompressionSettings()
+
+# 이 크기 이상인 일반 응답은 스레드풀에서 압축 (zlib/brotli/zstd 모두 압축 중 GIL을 놓음)
+_THREADPOOL_MIN_SIZE = 256 * 1024
+
+_COMPRESSIBLE_TYPES = frozenset(
+    ("application/json", "application/x-ndjson", "application/javascript", "application/xml", "image/svg+xml")
+)
+
+
+class _GzipCompressor:
+    def __init__(self, level):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data):
+        return self._compressor.compress(data)
+
+    def flush(self):
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self):
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class _BrotliCompressor:
+    def __init__(self, quality):
+        self._compressor = brotli.Compressor(mode=brotli.MODE_TEXT, quality=quality)
+
+    def compress(self, data):
+        return self._compressor.process(data)
+
+    def flush(self):
+        return self._compressor.flush()
+
+    def finish(self):
+        return self._compressor.finish()
+
+
+class _ZstdCompressor:
+    def __init__(self, level):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data):
+        return self._compressor.compress(data)
+
+    def flush(self):
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self):
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+def available_encodings():
+    """설정된 인코딩 중 현재 환경에서 사용할 수 있는 것 (우선순위 순서)"""
+    installed = {"gzip": True, "br": brotli is not None, "zstd": zstandard is not None}
+    configured = (name.strip() for name in compression_settings.encodings.split(","))
+    return tuple(name for name in configured if installed.get(name))
+
+
+def compressor(encoding, level=None):
+    """
+    인코딩별 스트리밍 압축기 (`compress()` / `flush()` / `finish()`)
+
+    Args:
+        encoding: "gzip", "br", "zstd"
+        level: 압축 레벨 (생략 시 설정값)
+    """
+    if encoding == "gzip":
+        return _GzipCompressor(compression_settings.gzip_level if level is None else level)
+    if encoding == "br":
+        return _BrotliCompressor(compression_settings.brotli_quality if level is None else level)
+    if encoding == "zstd":
+        return _ZstdCompressor(compression_settings.zstd_level if level is None else level)
+    raise ValueError(f"지원하지 않는 인코딩: {encoding}")
+
+
+def compress(data, encoding, level=None):
+    """본문 전체를 한 번에 압축합니다."""
+    encoder = compressor(encoding, level)
+    return encoder.compress(data) + encoder.finish()
+
+
+class StreamCompressor:
+    """
+    스트리밍 응답 압축기
+
+    입력 청크를 `stream_flush_bytes`까지 모았다가 한 번에 압축 + flush합니다. (마지막 청크에서는 finish)
+    """
+
+    def __init__(self, encoding, level=None, flush_bytes=None):
+        self._encoder = compressor(encoding, level)
+        self._flush_bytes = compression_settings.stream_flush_bytes if flush_bytes is None else flush_bytes
+        self._buffer = []
+        self._pending = 0
+
+    def feed(self, chunk, last=False):
+        """청크를 넣고 지금 보낼 압축 데이터를 반환합니다. (아직 모으는 중이면 b"")"""
+        if chunk:
+            self._buffer.append(chunk)
+            self._pending += len(chunk)
+        if not last and self._pending < self._flush_bytes:
+            return b""
+
+        data = b"".join(self._buffer)
+        self._buffer.clear()
+        self._pending = 0
+        compressed = self._encoder.compress(data) if data else b""
+        return compressed + (self._encoder.finish() if last else self._encoder.flush())
+
+
+@lru_cache(maxsize=256)
+def negotiate_encoding(accept_encoding):
+    """
+    `Accept-Encoding` 헤더에서 사용할 인코딩을 고릅니다. (없으면 None = 압축 안 함)
+
+    q값이 가장 높은 인코딩을 고르고, 같으면 `COMPRESSION_ENCODINGS` 순서를 따릅니다.
+    같은 헤더 값이 반복되므로 결과를 캐시합니다.
+    """
+    weights = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.partition(";")
+        name = name.strip()
+        if not name:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[name] = q
+
+    best, best_q = None, 0.0
+    for name in available_encodings():
+        q = weights.get(name, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = name, q
+    return best
+
+
+def _is_compressible(headers):
+    if "content-encoding" in headers or "no-transform" in headers.get("cache-control", ""):
+        return False
+    content_type = headers.get("content-type", "").partition(";")[0].strip().lower()
+    return (
+        content_type.startswith("text/")
+        or content_type in _COMPRESSIBLE_TYPES
+        or content_type.endswith(("+json", "+xml"))
+    )
+
+
+class CompressionMiddleware:
+    """
+    협상된 인코딩(zstd / br / gzip)으로 응답 본문을 압축하는 ASGI 미들웨어
+
+    일반 응답은 한 번에, 스트리밍 응답은 청크 단위로 압축합니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not compression_settings.enabled or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        start_message = None
+        encoder = None
+
+        async def send_compressed(message):
+            nonlocal start_message, encoder
+            message_type = message["type"]
+
+            if message_type == "http.response.start":
+                # 첫 본문 메시지를 보고 일반/스트리밍 응답을 구분할 때까지 보류합니다.
+                start_message = message
+                return
+
+            if message_type != "http.response.body":
+                await send(message)
+                return
+
+            if start_message is not None:
+                start, start_message = start_message, None
+                headers = MutableHeaders(scope=start)
+                body = message.get("body", b"")
+                more_body = message.get("more_body", False)
+
+                # 304는 본문/Content-Type이 없으므로, 재검증 대상인 200 응답과 같은 Vary를 항상 붙입니다.
+                if start["status"] == 304:
+                    headers.add_vary_header("Accept-Encoding")
+                    await send(start)
+                    await send(message)
+                    return
+
+                if not _is_compressible(headers):
+                    await send(start)
+                    await send(message)
+                    return
+
+                # 크기나 협상 결과로 압축하지 않더라도 표현이 Accept-Encoding에 따라 달라질 수 있으므로 Vary를 붙입니다.
+                headers.add_vary_header("Accept-Encoding")
+                if encoding is None or (not more_body and len(body) < compression_settings.minimum_size):
+                    await send(start)
+                    await send(message)
+                    return
+
+                headers["Content-Encoding"] = encoding
+
+                if not more_body:
+                    if len(body) >= _THREADPOOL_MIN_SIZE:
+                        body = await run_in_threadpool(compress, body, encoding)
+                    else:
+                        body = compress(body, encoding)
+                    headers["Content-Length"] = str(len(body))
+                    await send(start)
+                    await send({"type": "http.response.body", "body": body})
+                    return
+
+                # 스트리밍: 길이를 알 수 없으므로 Content-Length를 빼고 stream_flush_bytes 단위로 압축해 보냅니다.
+                del headers["Content-Length"]
+                encoder = StreamCompressor(encoding)
+                await send(start)
+
+            if encoder is None:
+                await send(message)
+                return
+
+            more_body = message.get("more_body", False)
+            chunk = encoder.feed(message.get("body", b""), last=not more_body)
+            if chunk or not more_body:
+                await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
@@ -1,76 +1,47 @@
 import calendar
 import datetime
-from functools import cached_property
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import cached_property, lru_cache, partial
+from typing import Callable, NamedTuple, Optional, Tuple
 from zoneinfo import ZoneInfo
 
-from sqlalchemy import select, extract
-from sqlalchemy.orm import Session
+import orjson
 
-from db.database import sync_engine
-from models.solar_term import SolarTerm, SolarTermKindChoices, SolarTermNameChoices
+from api.v1.solar_terms import (
+    KST,
+    ChartSolarTerms,
+    jeolgi_table,
+    resolve_chart_terms,
+    solar_term_names,
+)
 
 
-def sin_sal(name):
-    """신살 이름을 함수에 저장하는 데코레이터"""
+stem_list = ["갑", "을", "병", "정", "무", "기", "경", "신", "임", "계"]
+branch_list = ["자", "축", "인", "묘", "진", "사", "오", "미", "신", "유", "술", "해"]
 
-    def decorator(func):
-        func.sin_sal = name
-        return func
+# 사주 생성 시 전체 계산 결과를 출력할지 여부 (개발용, 기본값 비활성화)
+SAJU_DEBUG = os.getenv("SAJU_DEBUG", "").lower() in ("1", "true", "yes")
+# 사주 응답 캐시 최대 항목 수 (0이면 비활성화)와 유효 시간(초, 0이면 만료 없음)
+SAJU_CHART_CACHE_SIZE = int(os.getenv("SAJU_CHART_CACHE_SIZE", "8192"))
+SAJU_CHART_CACHE_TTL = float(os.getenv("SAJU_CHART_CACHE_TTL", "0"))
 
-    return decorator
+# 월운 시작/종료 시각 표기용 고정 +09:00 오프셋
+# (ZoneInfo("Asia/Seoul")은 과거 시각에 +08:27:52(LMT) 같은 초 단위 오프셋을 쓰므로 많은 클라이언트가 파싱하지 못함)
+KST_FIXED_OFFSET = datetime.timezone(datetime.timedelta(hours=9))
 
 
-stem_list = ["갑", "을", "병", "정", "무", "기", "경", "신", "임", "계"]
-branch_list = ["자", "축", "인", "묘", "진", "사", "오", "미", "신", "유", "술", "해"]
+def _resolve_chart_terms(birth: datetime.datetime) -> ChartSolarTerms:
+    """사주 1건에 필요한 입춘/직전 절기/직후 절기를 한 번에 반환합니다. (인메모리 인덱스 또는 천문 계산)"""
+    return resolve_chart_terms(birth)
 
 
-def _get_ipchun_for_year(year: int) -> SolarTerm | None:
-    """해당 연도의 입춘(절기) SolarTerm 레코드를 반환합니다."""
-    if sync_engine is None:
-        raise Exception("동기 데이터베이스 엔진이 초기화되지 않았습니다. psycopg2-binary를 설치하세요.")
-    with Session(sync_engine) as session:
-        stmt = (
-            select(SolarTerm)
-            .where(
-                SolarTerm.name == SolarTermNameChoices.IPCHUN.value,
-                extract("year", SolarTerm.at) == year,
-                SolarTerm.kind == SolarTermKindChoices.JEOLGI.value,
-            )
-            .order_by(SolarTerm.at.asc())
-        )
-        return session.execute(stmt).scalars().first()
-
-
-def _get_previous_jeolgi(before_dt: datetime.datetime) -> SolarTerm | None:
-    """특정 시각 이전의 가장 가까운 절기 SolarTerm 레코드를 반환합니다."""
-    if sync_engine is None:
-        raise Exception("동기 데이터베이스 엔진이 초기화되지 않았습니다. psycopg2-binary를 설치하세요.")
-    with Session(sync_engine) as session:
-        stmt = (
-            select(SolarTerm)
-            .where(
-                SolarTerm.kind == SolarTermKindChoices.JEOLGI.value,
-                SolarTerm.at < before_dt,
-            )
-            .order_by(SolarTerm.at.desc())
-        )
-        return session.execute(stmt).scalars().first()
-
-
-def _get_next_jeolgi(after_dt: datetime.datetime) -> SolarTerm | None:
-    """특정 시각 이후의 가장 가까운 절기 SolarTerm 레코드를 반환합니다."""
-    if sync_engine is None:
-        raise Exception("동기 데이터베이스 엔진이 초기화되지 않았습니다. psycopg2-binary를 설치하세요.")
-    with Session(sync_engine) as session:
-        stmt = (
-            select(SolarTerm)
-            .where(
-                SolarTerm.kind == SolarTermKindChoices.JEOLGI.value,
-                SolarTerm.at > after_dt,
-            )
-            .order_by(SolarTerm.at.asc())
-        )
-        return session.execute(stmt).scalars().first()
+def _get_jeolgi_table(first_year: int, last_year: int) -> tuple[list, list]:
+    """first_year~last_year 구간의 절기를 (epoch 초 목록, 절기 코드 목록)으로 한 번에 반환합니다."""
+    return jeolgi_table(first_year, last_year)
 
 # stem_to_color = {
 #     "甲": "green",
@@ -555,40 +526,1360 @@ twelve_sin_sal_map = {
     },
 }
 
+# 일간과 월지 조합에 따른 D/R 매핑 테이블
+dr_mapping = {
+    "갑": {
+        "인": "D",
+        "묘": "D",
+        "진": "D",
+        "사": "D",
+        "오": "D",
+        "미": "D",
+        "신": "D",
+        "유": "D",
+        "술": "D",
+        "해": "R",
+        "자": "R",
+        "축": "D",
+    },
+    "을": {
+        "인": "D",
+        "묘": "D",
+        "진": "R",
+        "사": "R",
+        "오": "R",
+        "미": "R",
+        "신": "R",
+        "유": "R",
+        "술": "R",
+        "해": "R",
+        "자": "R",
+        "축": "R",
+    },
+    "병": {
+        "인": "D",
+        "묘": "D",
+        "진": "D",
+        "사": "D",
+        "오": "D",
+        "미": "D",
+        "신": "R",
+        "유": "R",
+        "술": "D",
+        "해": "R",
+        "자": "R",
+        "축": "D",
+    },
+    "정": {
+        "인": "R",
+        "묘": "R",
+        "진": "R",
+        "사": "D",
+        "오": "D",
+        "미": "D",
+        "신": "R",
+        "유": "R",
+        "술": "R",
+        "해": "R",
+        "자": "R",
+        "축": "R",
+    },
+    "무": {
+        "인": "R",
+        "묘": "R",
+        "진": "D",
+        "사": "D",
+        "오": "D",
+        "미": "D",
+        "신": "D",
+        "유": "D",
+        "술": "D",
+        "해": "R",
+        "자": "R",
+        "축": "D",
+    },
+    "기": {
+        "인": "R",
+        "묘": "R",
+        "진": "D",
+        "사": "D",
+        "오": "D",
+        "미": "D",
+        "신": "R",
+        "유": "R",
+        "술": "D",
+        "해": "R",
+        "자": "R",
+        "축": "D",
+    },
+    "경": {
+        "인": "D",
+        "묘": "D",
+        "진": "D",
+        "사": "D",
+        "오": "D",
+        "미": "R",
+        "신": "D",
+        "유": "D",
+        "술": "D",
+        "해": "D",
+        "자": "D",
+        "축": "D",
+    },
+    "신": {
+        "인": "D",
+        "묘": "D",
+        "진": "R",
+        "사": "R",
+        "오": "R",
+        "미": "R",
+        "신": "D",
+        "유": "D",
+        "술": "D",
+        "해": "D",
+        "자": "D",
+        "축": "D",
+    },
+    "임": {
+        "인": "D",
+        "묘": "D",
+        "진": "D",
+        "사": "D",
+        "오": "D",
+        "미": "D",
+        "신": "D",
+        "유": "R",
+        "술": "D",
+        "해": "D",
+        "자": "D",
+        "축": "D",
+    },
+    "계": {
+        "인": "R",
+        "묘": "R",
+        "진": "R",
+        "사": "R",
+        "오": "R",
+        "미": "R",
+        "신": "R",
+        "유": "R",
+        "술": "R",
+        "해": "D",
+        "자": "D",
+        "축": "R",
+    },
+}
+
+# 일간과 월지 조합에 따른 F/T 매핑 테이블
+ft_mapping = {
+    "갑": {
+        "인": "F",
+        "묘": "F",
+        "진": "F",
+        "사": "F",
+        "오": "F",
+        "미": "F",
+        "신": "T",
+        "유": "T",
+        "술": "F",
+        "해": "T",
+        "자": "T",
+        "축": "F",
+    },
+    "을": {
+        "인": "F",
+        "묘": "F",
+        "진": "F",
+        "사": "F",
+        "오": "F",
+        "미": "F",
+        "신": "T",
+        "유": "T",
+        "술": "F",
+        "해": "T",
+        "자": "T",
+        "축": "T",
+    },
+    "병": {
+        "인": "F",
+        "묘": "F",
+        "진": "F",
+        "사": "F",
+        "오": "F",
+        "미": "F",
+        "신": "T",
+        "유": "T",
+        "술": "F",
+        "해": "T",
+        "자": "T",
+        "축": "T",
+    },
+    "정": {
+        "인": "F",
+        "묘": "F",
+        "진": "F",
+        "사": "F",
+        "오": "F",
+        "미": "F",
+        "신": "T",
+        "유": "T",
+        "술": "F",
+        "해": "T",
+        "자": "T",
+        "축": "T",
+    },
+    "무": {
+        "인": "F",
+        "묘": "F",
+        "진": "F",
+        "사": "F",
+        "오": "F",
+        "미": "F",
+        "신": "T",
+        "유": "T",
+        "술": "F",
+        "해": "T",
+        "자": "T",
+        "축": "T",
+    },
+    "기": {
+        "인": "F",
+        "묘": "F",
+        "진": "F",
+        "사": "F",
+        "오": "F",
+        "미": "F",
+        "신": "T",
+        "유": "T",
+        "술": "F",
+        "해": "T",
+        "자": "T",
+        "축": "T",
+    },
+    "경": {
+        "인": "T",
+        "묘": "T",
+        "진": "T",
+        "사": "T",
+        "오": "T",
+        "미": "T",
+        "신": "T",
+        "유": "T",
+        "술": "T",
+        "해": "T",
+        "자": "T",
+        "축": "T",
+    },
+    "신": {
+        "인": "T",
+        "묘": "T",
+        "진": "T",
+        "사": "T",
+        "오": "T",
+        "미": "T",
+        "신": "T",
+        "유": "T",
+        "술": "T",
+        "해": "T",
+        "자": "T",
+        "축": "T",
+    },
+    "임": {
+        "인": "F",
+        "묘": "F",
+        "진": "T",
+        "사": "F",
+        "오": "F",
+        "미": "T",
+        "신": "T",
+        "유": "T",
+        "술": "T",
+        "해": "T",
+        "자": "T",
+        "축": "T",
+    },
+    "계": {
+        "인": "F",
+        "묘": "F",
+        "진": "T",
+        "사": "F",
+        "오": "F",
+        "미": "F",
+        "신": "T",
+        "유": "T",
+        "술": "T",
+        "해": "T",
+        "자": "T",
+        "축": "T",
+    },
+}
+
+# 일간과 월지 조합에 따른 P/O 매핑 테이블
+po_mapping = {
+    "갑": {
+        "인": "O",
+        "묘": "O",
+        "진": "O",
+        "사": "P",
+        "오": "P",
+        "미": "O",
+        "신": "O",
+        "유": "O",
+        "술": "O",
+        "해": "P",
+        "자": "P",
+        "축": "O",
+    },
+    "을": {
+        "인": "O",
+        "묘": "O",
+        "진": "O",
+        "사": "P",
+        "오": "P",
+        "미": "O",
+        "신": "O",
+        "유": "O",
+        "술": "O",
+        "해": "P",
+        "자": "P",
+        "축": "O",
+    },
+    "병": {
+        "인": "P",
+        "묘": "P",
+        "진": "P",
+        "사": "O",
+        "오": "O",
+        "미": "P",
+        "신": "O",
+        "유": "O",
+        "술": "P",
+        "해": "O",
+        "자": "O",
+        "축": "P",
+    },
+    "정": {
+        "인": "P",
+        "묘": "P",
+        "진": "P",
+        "사": "O",
+        "오": "O",
+        "미": "P",
+        "신": "O",
+        "유": "O",
+        "술": "P",
+        "해": "O",
+        "자": "O",
+        "축": "P",
+    },
+    "무": {
+        "인": "O",
+        "묘": "O",
+        "진": "O",
+        "사": "P",
+        "오": "P",
+        "미": "O",
+        "신": "P",
+        "유": "P",
+        "술": "O",
+        "해": "O",
+        "자": "O",
+        "축": "O",
+    },
+    "기": {
+        "인": "O",
+        "묘": "O",
+        "진": "O",
+        "사": "P",
+        "오": "P",
+        "미": "O",
+        "신": "P",
+        "유": "P",
+        "술": "O",
+        "해": "O",
+        "자": "O",
+        "축": "O",
+    },
+    "경": {
+        "인": "O",
+        "묘": "O",
+        "진": "P",
+        "사": "O",
+        "오": "O",
+        "미": "P",
+        "신": "O",
+        "유": "O",
+        "술": "P",
+        "해": "P",
+        "자": "P",
+        "축": "P",
+    },
+    "신": {
+        "인": "O",
+        "묘": "O",
+        "진": "P",
+        "사": "O",
+        "오": "O",
+        "미": "P",
+        "신": "O",
+        "유": "O",
+        "술": "P",
+        "해": "P",
+        "자": "P",
+        "축": "P",
+    },
+    "임": {
+        "인": "P",
+        "묘": "P",
+        "진": "O",
+        "사": "O",
+        "오": "O",
+        "미": "O",
+        "신": "P",
+        "유": "P",
+        "술": "O",
+        "해": "O",
+        "자": "O",
+        "축": "O",
+    },
+    "계": {
+        "인": "P",
+        "묘": "P",
+        "진": "O",
+        "사": "O",
+        "오": "O",
+        "미": "O",
+        "신": "P",
+        "유": "P",
+        "술": "O",
+        "해": "O",
+        "자": "O",
+        "축": "O",
+    },
+}
+
+# 일간과 월지 조합에 따른 W/H 매핑 테이블
+wh_mapping = {
+    "갑": {
+        "인": "W",
+        "묘": "W",
+        "진": "W",
+        "사": "W",
+        "오": "W",
+        "미": "W",
+        "신": "H",
+        "유": "H",
+        "술": "W",
+        "해": "H",
+        "자": "H",
+        "축": "W",
+    },
+    "을": {
+        "인": "W",
+        "묘": "W",
+        "진": "W",
+        "사": "W",
+        "오": "W",
+        "미": "W",
+        "신": "H",
+        "유": "H",
+        "술": "W",
+        "해": "H",
+        "자": "H",
+        "축": "W",
+    },
+    "병": {
+        "인": "H",
+        "묘": "H",
+        "진": "W",
+        "사": "W",
+        "오": "W",
+        "미": "W",
+        "신": "W",
+        "유": "W",
+        "술": "W",
+        "해": "H",
+        "자": "H",
+        "축": "W",
+    },
+    "정": {
+        "인": "H",
+        "묘": "H",
+        "진": "W",
+        "사": "W",
+        "오": "W",
+        "미": "W",
+        "신": "W",
+        "유": "W",
+        "술": "W",
+        "해": "H",
+        "자": "H",
+        "축": "W",
+    },
+    "무": {
+        "인": "H",
+        "묘": "H",
+        "진": "W",
+        "사": "W",
+        "오": "W",
+        "미": "W",
+        "신": "W",
+        "유": "W",
+        "술": "W",
+        "해": "W",
+        "자": "W",
+        "축": "W",
+    },
+    "기": {
+        "인": "H",
+        "묘": "H",
+        "진": "W",
+        "사": "H",
+        "오": "H",
+        "미": "W",
+        "신": "W",
+        "유": "W",
+        "술": "W",
+        "해": "W",
+        "자": "W",
+        "축": "W",
+    },
+    "경": {
+        "인": "W",
+        "묘": "W",
+        "진": "H",
+        "사": "H",
+        "오": "H",
+        "미": "H",
+        "신": "W",
+        "유": "W",
+        "술": "H",
+        "해": "W",
+        "자": "W",
+        "축": "H",
+    },
+    "신": {
+        "인": "W",
+        "묘": "W",
+        "진": "H",
+        "사": "H",
+        "오": "H",
+        "미": "H",
+        "신": "W",
+        "유": "W",
+        "술": "H",
+        "해": "W",
+        "자": "W",
+        "축": "H",
+    },
+    "임": {
+        "인": "W",
+        "묘": "W",
+        "진": "H",
+        "사": "W",
+        "오": "W",
+        "미": "H",
+        "신": "W",
+        "유": "W",
+        "술": "H",
+        "해": "W",
+        "자": "W",
+        "축": "H",
+    },
+    "계": {
+        "인": "W",
+        "묘": "W",
+        "진": "H",
+        "사": "W",
+        "오": "W",
+        "미": "H",
+        "신": "W",
+        "유": "W",
+        "술": "H",
+        "해": "W",
+        "자": "W",
+        "축": "H",
+    },
+}
+
+
+def _compute_ten_god(day_stem, target_stem):
+    """
+    일간과 다른 간지를 비교하여 십성을 구합니다. (정수 테이블 생성용)
+
+    Args:
+        day_stem (str): 일간 (예: "갑")
+        target_stem (str): 비교할 간지 (예: "을")
+
+    Returns:
+        str: 십성 (예: "겁재")
+    """
+
+    day_five_elements = stem_to_five_elements[day_stem]
+    day_yin_yang = stem_to_yin_yang[day_stem]
+    target_five_elements = stem_to_five_elements[target_stem]
+    target_yin_yang = stem_to_yin_yang[target_stem]
+
+    # 같은 오행인 경우
+    if day_five_elements == target_five_elements:
+        if day_yin_yang == target_yin_yang:
+            return "비견"  # 같은 음양
+        else:
+            return "겁재"  # 다른 음양
+
+    # 일간이 생하는 오행 (식상)
+    elif target_five_elements == five_elements_relations[day_five_elements]["생"]:
+        if day_yin_yang == target_yin_yang:
+            return "식신"  # 같은 음양
+        else:
+            return "상관"  # 다른 음양
+
+    # 일간을 생하는 오행 (인성)
+    elif target_five_elements == five_elements_relations[day_five_elements]["피생"]:
+        if day_yin_yang == target_yin_yang:
+            return "편인"  # 같은 음양
+        else:
+            return "정인"  # 다른 음양
+
+    # 일간이 극하는 오행 (재성)
+    elif target_five_elements == five_elements_relations[day_five_elements]["극"]:
+        if day_yin_yang == target_yin_yang:
+            return "편재"  # 같은 음양
+        else:
+            return "정재"  # 다른 음양
+
+    # 일간을 극하는 오행 (관성)
+    elif target_five_elements == five_elements_relations[day_five_elements]["피극"]:
+        if day_yin_yang == target_yin_yang:
+            return "편관"  # 같은 음양 (칠살)
+        else:
+            return "정관"  # 다른 음양
+
+    return "알 수 없음"
+
+
+def _compute_twelve_sin_sal(from_branch, target_branch):
+    for group, mapping in twelve_sin_sal_map.items():
+        if from_branch in group:
+            return mapping[target_branch]
+    return None
+
+
+# 응답 구조체
+# - orjson이 dataclass를 중간 dict 없이 바로 직렬화합니다. (필드 순서 = JSON 키 순서)
+#   __slots__ dataclass는 orjson 직렬화가 느린 경로를 타므로 사용하지 않습니다.
+# - 천간/지지/지장간 항목(frozen)은 (일간, 코드, ...) 조합별로 한 번만 만들어 모든 사주가 공유합니다.
+# - 기둥/대운/연운/월운/일진 항목은 요청마다 만들므로 생성 비용이 적은 일반 dataclass를 사용합니다.
+@dataclass(frozen=True)
+class HiddenStem:
+    name: str
+    value: int
+
+
+@dataclass(frozen=True)
+class HiddenStems:
+    """지장간 (여기/중기/정기, 중기가 없는 지지는 middle=None)"""
+
+    residual: HiddenStem
+    middle: Optional[HiddenStem]
+    primary: HiddenStem
+
+
+@dataclass(frozen=True)
+class LuckStem:
+    """대운/연운/월운/일진의 천간"""
+
+    name: str
+    five_elements: str
+    yin_yang: str
+    ten_god: str
+
+
+@dataclass(frozen=True)
+class LuckBranch:
+    """대운/연운/월운/일진의 지지"""
+
+    name: str
+    five_elements: str
+    yin_yang: str
+    ten_god: str
+    twelve_stage: str
+    twelve_sin_sal: Optional[str]
+
+
+@dataclass(frozen=True)
+class PillarStem:
+    """사주 기둥의 천간"""
+
+    name: str
+    five_elements: str
+    yin_yang: str
+    ten_god: str
+    sin_sal: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class PillarBranch:
+    """사주 기둥의 지지"""
+
+    name: str
+    five_elements: str
+    yin_yang: str
+    ten_god: str
+    hidden_stem: HiddenStems
+    twelve_stage: str
+    twelve_sin_sal: Optional[str]
+    sin_sal: Tuple[str, ...]
+
+
+@dataclass
+class Pillar:
+    stem: PillarStem
+    branch: PillarBranch
+
+
+@dataclass
+class StemBranch:
+    """사주 네 기둥 (응답 키 순서: 시, 일, 월, 년)"""
+
+    hour: Pillar
+    day: Pillar
+    month: Pillar
+    year: Pillar
+
+
+@dataclass
+class MajorLuck:
+    age: int
+    stem: LuckStem
+    branch: LuckBranch
+
+
+@dataclass
+class AnnualLuck:
+    year: int
+    stem: LuckStem
+    branch: LuckBranch
+
+
+@dataclass
+class MonthlyLuck:
+    year: int
+    month: int
+    jeolgi: str
+    start_at: str
+    end_at: str
+    stem: LuckStem
+    branch: LuckBranch
+
+
+@dataclass
+class DailyPillar:
+    day: int
+    date: str
+    stem: LuckStem
+    branch: LuckBranch
+
+
+def _hidden_stems(mapping):
+    return HiddenStems(**{position: HiddenStem(**stem) if stem else None for position, stem in mapping.items()})
+
+
+# 정수 코드 테이블 (import 시 한 번만 생성)
+# - 천간 0~9 (갑~계), 지지 0~11 (자~해), 60갑자 0~59 (갑자~계해)
+# - 문자열은 응답을 만들 때 아래 테이블에서 꺼내 씁니다.
+stem_cn_table = tuple(stem_ko_cn_map[s] for s in stem_list)
+branch_cn_table = tuple(branch_ko_cn_map[b] for b in branch_list)
+stem_five_elements_table = tuple(stem_to_five_elements[s] for s in stem_list)
+stem_yin_yang_table = tuple(stem_to_yin_yang[s] for s in stem_list)
+branch_five_elements_table = tuple(branch_to_five_elements[b] for b in branch_list)
+branch_yin_yang_table = tuple(branch_to_yin_yang[b] for b in branch_list)
+branch_main_stem_table = tuple(stem_list.index(branch_main_stem[b]) for b in branch_list)
+hidden_stem_table = tuple(_hidden_stems(hidden_stem_map[b]) for b in branch_list)
+# [일간][대상 천간] -> 십성
+ten_god_table = tuple(tuple(_compute_ten_god(d, t) for t in stem_list) for d in stem_list)
+# [일간][대상 지지] -> 12운성
+twelve_stage_table = tuple(tuple(twelve_stage_map[s][b] for b in branch_list) for s in stem_list)
+# [기준 지지][대상 지지] -> 12신살
+twelve_sin_sal_table = tuple(tuple(_compute_twelve_sin_sal(f, t) for t in branch_list) for f in branch_list)
+# 절기 이름 -> 월지, 년간 -> 정월(인월) 월간, 일간 -> 자시 시간
+jeolgi_branch_table = {name: branch_list.index(b) for name, b in jeolgi_to_branch.items()}
+first_month_stem_table = tuple(stem_list.index(year_stem_to_first_month_stem[s]) for s in stem_list)
+ja_stem_table = tuple(stem_list.index(day_stem_to_ja_stem[s]) for s in stem_list)
+hour_branch_table = tuple(branch_list.index(hour_to_branch[h]) for h in range(24))
+# [일간][월지] -> SPTI 각 자리 분류 (D/R, F/T, P/O, W/H)
+dr_table = tuple(tuple(dr_mapping[s][b] for b in branch_list) for s in stem_list)
+ft_table = tuple(tuple(ft_mapping[s][b] for b in branch_list) for s in stem_list)
+po_table = tuple(tuple(po_mapping[s][b] for b in branch_list) for s in stem_list)
+wh_table = tuple(tuple(wh_mapping[s][b] for b in branch_list) for s in stem_list)
+# 일(1~31) -> 두 자리 문자열 (일진 날짜 포맷용)
+_day_of_month_strings = tuple(f"{d:02d}" for d in range(32))
+# 60갑자 -> 이름 (예: 0 -> "갑자")
+pillar_name_table = tuple(stem_list[p % 10] + branch_list[p % 12] for p in range(60))
+
+
+def pillar_of(stem, branch):
+    """천간/지지 코드로 60갑자 코드를 구합니다. (천간과 지지의 음양이 같아야 합니다)"""
+    return (6 * stem - 5 * branch) % 60
+
+
+def _compute_spti(day_stem, month_branch, sun_moon):
+    return (
+        f"{sun_moon}{dr_table[day_stem][month_branch]}{ft_table[day_stem][month_branch]}"
+        f"{po_table[day_stem][month_branch]}-{wh_table[day_stem][month_branch]}"
+    )
+
+
+# [일간 * 12 + 월지] -> SPTI (S/M은 일간의 음양으로 결정: 양간=S, 음간=M)
+spti_table = tuple(
+    _compute_spti(s, b, "S" if stem_yin_yang_table[s] == "양" else "M") for s in range(10) for b in range(12)
+)
+# 丁巳일은 음간이지만 예외적으로 S로 분류합니다. [월지] -> SPTI
+JEONG_STEM = stem_list.index("정")
+SA_BRANCH = branch_list.index("사")
+jeong_sa_spti_table = tuple(_compute_spti(JEONG_STEM, b, "S") for b in range(12))
+
+
+def spti_for(day_stem, month_branch, day_branch):
+    """
+    일간/월지(및 丁巳일 예외 판정을 위한 일지) 코드로 SPTI 문자열을 구합니다.
+
+    Args:
+        day_stem (int): 일간 코드
+        month_branch (int): 월지 코드
+        day_branch (int): 일지 코드
+
+    Returns:
+        str: SPTI (예: "SDFO-W")
+    """
+    if day_stem == JEONG_STEM and day_branch == SA_BRANCH:
+        return jeong_sa_spti_table[month_branch]
+    return spti_table[day_stem * 12 + month_branch]
+
+
+# 신살 자리 코드: (년, 월, 일, 시) x (천간, 지지) 8칸, 코드 = 기둥 순서 * 2 + (지지이면 1)
+sin_sal_kinds = (
+    "year_stem",
+    "year_branch",
+    "month_stem",
+    "month_branch",
+    "day_stem",
+    "day_branch",
+    "hour_stem",
+    "hour_branch",
+)
+sin_sal_kind_codes = {kind: code for code, kind in enumerate(sin_sal_kinds)}
+STEM_KINDS = tuple(range(0, 8, 2))
+BRANCH_KINDS = tuple(range(1, 8, 2))
+ALL_KINDS = tuple(range(8))
+
+
+class SinSalRule(NamedTuple):
+    """
+    신살 규칙
+
+    - kinds: 규칙을 적용할 자리 코드
+    - func(pillars, kind, target) -> bool: pillars는 (년주, 월주, 일주, 시주) 60갑자 코드, target은 해당 자리의 천간/지지 코드
+    """
+
+    name: str
+    kinds: tuple
+    func: Callable
+
+
+# 등록 순서가 곧 응답의 신살 나열 순서이자 비트마스크의 비트 순서입니다.
+sin_sal_rules = []
+
+
+def sin_sal(name, kinds=ALL_KINDS, **tables):
+    """신살 규칙을 레지스트리에 등록하는 데코레이터 (tables는 규칙 함수에 키워드 인자로 묶어 전달됩니다)"""
+
+    def decorator(func):
+        sin_sal_rules.append(SinSalRule(name, tuple(kinds), partial(func, **tables) if tables else func))
+        return func
+
+    return decorator
+
+
+def _sin_sal_table(mapping, keys, targets):
+    """
+    문자열 매핑을 코드 테이블로 변환합니다.
+
+    Returns:
+        tuple: [기준 코드] -> 매핑 값에 해당하는 대상 코드 집합 (매핑에 없는 기준은 빈 집합)
+    """
+    return tuple(
+        frozenset(code for code, name in enumerate(targets) if name in mapping.get(key, ())) for key in keys
+    )
+
+
+def _pillar_set(names):
+    return frozenset(pillar_name_table.index(name) for name in names)
+
+
+def _other_branches(pillars, kind):
+    """자기 자리를 제외한 나머지 세 기둥의 지지 코드"""
+    own = kind >> 1
+    return [pillar % 12 for i, pillar in enumerate(pillars) if i != own]
+
+
+# 천을귀인 (일간별 지지)
+heavenly_noble_map = {
+    "갑": ["축", "미"],
+    "을": ["자", "신"],
+    "병": ["해", "유"],
+    "정": ["해", "유"],
+    "무": ["축", "미"],
+    "기": ["자", "신"],
+    "경": ["축", "미"],
+    "신": ["인", "오"],
+    "임": ["묘", "사"],
+    "계": ["인", "오"],
+}
+# 천덕귀인 (월지별 천간 또는 지지)
+heavenly_virtue_map = {
+    "자": "사",
+    "축": "경",
+    "인": "정",
+    "묘": "신",
+    "진": "임",
+    "사": "신",
+    "오": "해",
+    "미": "갑",
+    "신": "계",
+    "유": "인",
+    "술": "병",
+    "해": "을",
+}
+# 월덕귀인 (월지별 천간)
+monthly_virtue_map = {
+    "자": "임",  # 자월 → 임수
+    "축": "경",  # 축월 → 경금
+    "인": "병",  # 인월 → 병화
+    "묘": "갑",  # 묘월 → 갑목
+    "진": "임",  # 진월 → 임수
+    "사": "경",  # 사월 → 경금
+    "오": "병",  # 오월 → 병화
+    "미": "갑",  # 미월 → 갑목
+    "신": "임",  # 신월 → 임수
+    "유": "경",  # 유월 → 경금
+    "술": "병",  # 술월 → 병화
+    "해": "갑",  # 해월 → 갑목
+}
+# 월공귀인 (월지별 천간)
+monthly_kong_map = {
+    "자": "병",  # 자월 → 병화
+    "축": "갑",  # 축월 → 갑목
+    "인": "임",  # 인월 → 임수
+    "묘": "경",  # 묘월 → 경금
+    "진": "병",  # 진월 → 병화
+    "사": "갑",  # 사월 → 갑목
+    "오": "임",  # 오월 → 임수
+    "미": "경",  # 미월 → 경금
+    "신": "병",  # 신월 → 병화
+    "유": "갑",  # 유월 → 갑목
+    "술": "임",  # 술월 → 임수
+    "해": "경",  # 해월 → 경금
+}
+# 문창귀인 (일간별 지지)
+moon_chang_map = {
+    "갑": "사",  # 갑목 → 사화
+    "을": "오",  # 을목 → 오화
+    "병": "신",  # 병화 → 신금
+    "정": "유",  # 정화 → 유금
+    "무": "신",  # 무토 → 신금 (화토동법)
+    "기": "유",  # 기토 → 유금 (화토동법)
+    "경": "해",  # 경금 → 해수
+    "신": "자",  # 신금 → 자수
+    "임": "인",  # 임수 → 인목
+    "계": "묘",  # 계수 → 묘목
+}
+# 천의귀인, 천의성 (월지별 지지)
+heavenly_doctor_map = {
+    "자": "해",  # 자월 → 해지
+    "축": "자",  # 축월 → 자지
+    "인": "축",  # 인월 → 축지
+    "묘": "인",  # 묘월 → 인지
+    "진": "묘",  # 진월 → 묘지
+    "사": "진",  # 사월 → 진지
+    "오": "사",  # 오월 → 사지
+    "미": "오",  # 미월 → 오지
+    "신": "미",  # 신월 → 미지
+    "유": "신",  # 유월 → 신지
+    "술": "유",  # 술월 → 유지
+    "해": "술",  # 해월 → 술지
+}
+# 암록귀인 (일간별 지지)
+hidden_fortune_map = {
+    "갑": "해",  # 갑목 → 해지
+    "을": "술",  # 을목 → 술지
+    "병": "신",  # 병화 → 신지
+    "정": "미",  # 정화 → 미지
+    "무": "신",  # 무토 → 신지 (화토동법)
+    "기": "미",  # 기토 → 미지 (화토동법)
+    "경": "사",  # 경금 → 사지
+    "신": "진",  # 신금 → 진지
+    "임": "인",  # 임수 → 인지
+    "계": "축",  # 계수 → 축지
+}
+# 학당귀인 (일간별 지지)
+academic_hall_map = {
+    "갑": "사",
+    "을": "오",
+    "병": "인",
+    "정": "유",
+    "무": "인",
+    "기": "유",
+    "경": "사",
+    "신": "자",
+    "임": "신",
+    "계": "묘",
+}
+# 역마살 (삼합별 역마살 해당 지지)
+post_horse_map = {
+    "사": ["해", "묘", "미"],  # 목국 삼합 → 사화 역마살
+    "신": ["인", "오", "술"],  # 화국 삼합 → 신금 역마살
+    "해": ["사", "유", "축"],  # 금국 삼합 → 해수 역마살
+    "인": ["신", "자", "진"],  # 수국 삼합 → 인목 역마살
+}
+# 도화살 (삼합별 도화살 해당 지지)
+peach_blossom_map = {
+    "자": ["해", "묘", "미"],
+    "묘": ["인", "오", "술"],
+    "오": ["사", "유", "축"],
+    "유": ["신", "자", "진"],
+}
+# 화개살 (삼합별 화개살 해당 지지)
+fire_canopy_map = {
+    "미": ["해", "묘", "미"],  # 목국 삼합 → 미토 화개살
+    "술": ["인", "오", "술"],  # 화국 삼합 → 술토 화개살
+    "축": ["사", "유", "축"],  # 금국 삼합 → 축토 화개살
+    "진": ["신", "자", "진"],  # 수국 삼합 → 진토 화개살
+}
+# 귀문관살
+ghost_gate_map = {
+    "진": "해",
+    "해": "진",
+    "오": "축",
+    "축": "오",
+    "사": "술",
+    "술": "사",
+    "묘": "신",
+    "신": "묘",
+    "인": "미",
+    "미": "인",
+    "자": "유",
+    "유": "자",
+}
+# 원진살
+hostile_opposition_map = {
+    "진": "해",
+    "해": "진",
+    "오": "축",
+    "축": "오",
+    "사": "술",
+    "술": "사",
+    "묘": "신",
+    "신": "묘",
+    "인": "유",
+    "유": "인",
+    "자": "미",
+    "미": "자",
+}
+# 양인살 (양간만 해당)
+yang_blade_map = {
+    "갑": "모",
+    "병": "오",
+    "무": "오",
+    "경": "유",
+    "임": "자",
+}
+# 천라지망살
+heaven_net_earth_snare_map = {
+    "술": "해",
+    "해": "술",
+    "진": "사",
+    "사": "진",
+}
+# 현침살 (천간, 지지 모두 신 존재)
+hanging_needle_names = {"갑", "신", "묘", "오", "미"}
+
+# 아래 규칙은 기존 응답의 신살 순서(메서드 이름순)를 유지하도록 정의 순서를 맞춰 두었습니다.
+
+
+@sin_sal("학당귀인", BRANCH_KINDS, table=_sin_sal_table(academic_hall_map, stem_list, branch_list))
+def _academic_hall(pillars, kind, target, table):
+    return target in table[pillars[2] % 10]
+
+
+@sin_sal(
+    "공망살",
+    BRANCH_KINDS,
+    # 60갑자를 10개씩 6그룹(갑자~계유, 갑술~계미, ...)으로 나누면, 그룹의 갑(甲)이 놓인 지지 바로 앞 두 지지가 공망지입니다.
+    # (예: 갑자~계유 = 술해 공망, 갑인~계해 = 자축 공망)
+    table=tuple(frozenset({(p - p % 10 + 10) % 12, (p - p % 10 + 11) % 12}) for p in range(60)),
+)
+def _empty_void(pillars, kind, target, table):
+    return target in table[pillars[2]]
+
+
+@sin_sal("화개살", BRANCH_KINDS, table=_sin_sal_table(fire_canopy_map, branch_list, branch_list))
+def _fire_canopy(pillars, kind, target, table):
+    return not table[target].isdisjoint(_other_branches(pillars, kind))
+
+
+@sin_sal(
+    "귀문관살",
+    (sin_sal_kind_codes["month_branch"], sin_sal_kind_codes["hour_branch"]),
+    table=_sin_sal_table(ghost_gate_map, branch_list, branch_list),
+)
+def _ghost_gate(pillars, kind, target, table):
+    return pillars[2] % 12 in table[target]
+
+
+@sin_sal(
+    "현침살",
+    tables=(
+        frozenset(code for code, name in enumerate(stem_list) if name in hanging_needle_names),
+        frozenset(code for code, name in enumerate(branch_list) if name in hanging_needle_names),
+    ),
+)
+def _hanging_needle(pillars, kind, target, tables):
+    return target in tables[kind & 1]
+
+
+@sin_sal(
+    "천라지망살", BRANCH_KINDS, table=_sin_sal_table(heaven_net_earth_snare_map, branch_list, branch_list)
+)
+def _heaven_net_earth_snare(pillars, kind, target, table):
+    return not table[target].isdisjoint(_other_branches(pillars, kind))
+
+
+@sin_sal("천의귀인", BRANCH_KINDS, table=_sin_sal_table(heavenly_doctor_map, branch_list, branch_list))
+def _heavenly_doctor(pillars, kind, target, table):
+    return target in table[pillars[1] % 12]
+
+
+@sin_sal(
+    "천의성",
+    tuple(k for k in BRANCH_KINDS if k != sin_sal_kind_codes["month_branch"]),
+    table=_sin_sal_table(heavenly_doctor_map, branch_list, branch_list),
+)
+def _heavenly_fortress(pillars, kind, target, table):
+    return target in table[pillars[1] % 12]
+
+
+@sin_sal("천을귀인", BRANCH_KINDS, table=_sin_sal_table(heavenly_noble_map, stem_list, branch_list))
+def _heavenly_noble(pillars, kind, target, table):
+    return target in table[pillars[2] % 10]
+
+
+@sin_sal(
+    "천덕귀인",
+    tuple(k for k in ALL_KINDS if k != sin_sal_kind_codes["month_branch"]),
+    # 월지에 따라 천간 또는 지지가 대상이 되므로 천간/지지 테이블을 따로 둡니다.
+    tables=(
+        _sin_sal_table(heavenly_virtue_map, branch_list, stem_list),
+        _sin_sal_table(heavenly_virtue_map, branch_list, branch_list),
+    ),
+)
+def _heavenly_virtue(pillars, kind, target, tables):
+    return target in tables[kind & 1][pillars[1] % 12]
+
+
+@sin_sal("암록귀인", BRANCH_KINDS, table=_sin_sal_table(hidden_fortune_map, stem_list, branch_list))
+def _hidden_fortune(pillars, kind, target, table):
+    return target in table[pillars[2] % 10]
+
+
+@sin_sal("원진살", BRANCH_KINDS, table=_sin_sal_table(hostile_opposition_map, branch_list, branch_list))
+def _hostile_opposition(pillars, kind, target, table):
+    return not table[target].isdisjoint(_other_branches(pillars, kind))
+
+
+@sin_sal("월공귀인", STEM_KINDS, table=_sin_sal_table(monthly_kong_map, branch_list, stem_list))
+def _monthly_kong(pillars, kind, target, table):
+    return target in table[pillars[1] % 12]
+
+
+@sin_sal("월덕귀인", STEM_KINDS, table=_sin_sal_table(monthly_virtue_map, branch_list, stem_list))
+def _monthly_virtue(pillars, kind, target, table):
+    return target in table[pillars[1] % 12]
+
+
+@sin_sal("문창귀인", BRANCH_KINDS, table=_sin_sal_table(moon_chang_map, stem_list, branch_list))
+def _moon_chang(pillars, kind, target, table):
+    return target in table[pillars[2] % 10]
+
+
+@sin_sal("도화살", BRANCH_KINDS, table=_sin_sal_table(peach_blossom_map, branch_list, branch_list))
+def _peach_blossom(pillars, kind, target, table):
+    return not table[target].isdisjoint(_other_branches(pillars, kind))
+
+
+@sin_sal("역마살", BRANCH_KINDS, table=_sin_sal_table(post_horse_map, branch_list, branch_list))
+def _post_horse(pillars, kind, target, table):
+    return not table[target].isdisjoint(_other_branches(pillars, kind))
+
+
+@sin_sal("괴강살", pillar_set=_pillar_set({"임진", "경진", "경술", "무술"}))
+def _strange_strong(pillars, kind, target, pillar_set):
+    return pillars[2] in pillar_set and pillars[kind >> 1] in pillar_set
+
+
+@sin_sal("백호대살", pillar_set=_pillar_set({"갑진", "을미", "병술", "정축", "무진", "임술", "계축"}))
+def _white_tiger_great(pillars, kind, target, pillar_set):
+    return pillars[2] in pillar_set and pillars[kind >> 1] in pillar_set
+
+
+@sin_sal("양인살", BRANCH_KINDS, table=_sin_sal_table(yang_blade_map, stem_list, branch_list))
+def _yang_blade(pillars, kind, target, table):
+    return target in table[pillars[2] % 10]
+
+
+def evaluate_sin_sal(pillars):
+    """
+    사주 네 기둥의 신살을 규칙 레지스트리 한 번 순회로 계산합니다.
+
+    Args:
+        pillars (tuple): (년주, 월주, 일주, 시주) 60갑자 코드
+
+    Returns:
+        tuple: 자리 코드(`sin_sal_kinds`) 순서의 비트마스크 (bit i = `sin_sal_rules[i]`)
+    """
+    targets = tuple(pillars[kind >> 1] % (12 if kind & 1 else 10) for kind in ALL_KINDS)
+    masks = [0] * len(ALL_KINDS)
+    for bit, rule in enumerate(sin_sal_rules):
+        func = rule.func
+        for kind in rule.kinds:
+            if func(pillars, kind, targets[kind]):
+                masks[kind] |= 1 << bit
+    return tuple(masks)
+
+
+def sin_sal_names(mask):
+    """비트마스크를 신살 이름 목록으로 변환합니다."""
+    return [rule.name for bit, rule in enumerate(sin_sal_rules) if mask >> bit & 1]
+
+
+@lru_cache(maxsize=None)
+def _sin_sal_name_tuple(mask):
+    return tuple(sin_sal_names(mask))
+
+
+# [일간][대상 천간] -> 운의 천간 항목 (공유 객체)
+luck_stem_table = tuple(
+    tuple(
+        LuckStem(
+            name=stem_list[stem],
+            five_elements=stem_five_elements_table[stem],
+            yin_yang=stem_yin_yang_table[stem],
+            ten_god=ten_god_table[day_stem][stem],
+        )
+        for stem in range(10)
+    )
+    for day_stem in range(10)
+)
+
+
+@lru_cache(maxsize=None)
+def luck_branch(day_stem, branch, twelve_sin_sal):
+    """운의 지지 항목 (일간/지지/12신살 조합별 공유 객체)"""
+    return LuckBranch(
+        name=branch_list[branch],
+        five_elements=branch_five_elements_table[branch],
+        yin_yang=branch_yin_yang_table[branch],
+        ten_god=ten_god_table[day_stem][branch_main_stem_table[branch]],
+        twelve_stage=twelve_stage_table[day_stem][branch],
+        twelve_sin_sal=twelve_sin_sal,
+    )
+
+
+@lru_cache(maxsize=4096)
+def pillar_stem(day_stem, stem, sin_sal_mask):
+    """사주 기둥의 천간 항목 (일간/천간/신살 조합별 공유 객체)"""
+    return PillarStem(
+        name=stem_cn_table[stem],
+        five_elements=stem_five_elements_table[stem],
+        yin_yang=stem_yin_yang_table[stem],
+        ten_god=ten_god_table[day_stem][stem],
+        sin_sal=_sin_sal_name_tuple(sin_sal_mask),
+    )
+
+
+@lru_cache(maxsize=8192)
+def pillar_branch(day_stem, branch, twelve_sin_sal, sin_sal_mask):
+    """사주 기둥의 지지 항목 (일간/지지/12신살/신살 조합별 공유 객체)"""
+    return PillarBranch(
+        name=branch_cn_table[branch],
+        five_elements=branch_five_elements_table[branch],
+        yin_yang=branch_yin_yang_table[branch],
+        ten_god=ten_god_table[day_stem][branch_main_stem_table[branch]],
+        hidden_stem=hidden_stem_table[branch],
+        twelve_stage=twelve_stage_table[day_stem][branch],
+        twelve_sin_sal=twelve_sin_sal,
+        sin_sal=_sin_sal_name_tuple(sin_sal_mask),
+    )
+
+
+# 응답 필드 그룹 (요청 순서와 관계없이 이 순서로 응답 키를 만듭니다)
+# - spti: "spti" / pillars: 네 기둥 이름 / stem_branch: 기둥별 상세(지장간, 12운성, 신살 등)
+# - five_elements, yin_yang: 오행/음양 분포 / major_luck: "major_luck_start_age", "major_luck_set"
+SAJU_RESPONSE_FIELDS = ("spti", "pillars", "stem_branch", "five_elements", "yin_yang", "major_luck")
+# fields를 지정하지 않은 요청의 기본 응답
+SAJU_DEFAULT_FIELDS = frozenset(("spti", "stem_branch", "five_elements", "yin_yang", "major_luck"))
+
+
+class UnsupportedYearError(ValueError):
+    """사주 계산이 지원하지 않는 출생 연도 (1000~2999년 밖)"""
+
 
 class Saju:
-    def __init__(self, birth, gender, birth_longitude):
+    def __init__(self, birth, gender, birth_longitude, debug=SAJU_DEBUG):
+        """
+        각 항목은 처음 접근할 때 계산됩니다. (생성 시에는 연도 검증만 수행)
+
+        Args:
+            debug (bool): True이면 생성 시 전체 계산 결과를 구조화된 JSON 한 줄로 출력합니다. (기본값: SAJU_DEBUG 환경 변수)
+        """
         self._validate_year(birth)
         self.birth = birth
         self.gender = gender
         self.birth_longitude = round(birth_longitude)
-        print("표준시: ", self.standard_longitude)
-        print("출생지 경도: ", self.birth_longitude)
-        print("경도조정: ", int(self.offset_minutes.total_seconds() / 60))
-        print("기준시각", self.birth - self._get_dst_offset() + self.offset_minutes)
-        print("사주: ")
-        for k, v in self.stem_branch.items():
-            print(k)
-            print(v)
-        print("대운 방향: ", "순행" if self.is_forward else "역행")
-        print("대운: ")
-        for ml in self.major_luck_set:
-            print(ml)
-        print("연운: ")
-        for al in self.get_annual_luck_set(1997, 10):
-            print(al)
-        print("월운: ")
-        for ml in self.get_monthly_luck_set(1997):
-            print(ml)
-        print("일진: ")
-        for dp in self.get_daily_pillar_set(2024, 1):
-            print(dp)
+        if debug:
+            print(orjson.dumps(self.debug_dump(), default=str).decode())
+
+    def debug_dump(self):
+        """
+        디버깅용 전체 계산 결과를 반환합니다. (연운/월운은 출생 연도, 일진은 출생 월 기준)
+
+        Returns:
+            dict: 표준시/경도 보정/기준시각, 사주, 대운, 연운, 월운, 일진
+        """
+        return {
+            "event": "saju.debug",
+            "birth": self.birth.isoformat(),
+            "standard_longitude": self.standard_longitude,
+            "birth_longitude": self.birth_longitude,
+            "offset_minutes": int(self.offset_minutes.total_seconds() / 60),
+            "solar_time": (self.birth - self._get_dst_offset() + self.offset_minutes).isoformat(),
+            "pillars": [self.year_stem_branch, self.month_stem_branch, self.day_stem_branch, self.hour_stem_branch],
+            "stem_branch": self.stem_branch,
+            "spti": self.spti,
+            "is_forward": self.is_forward,
+            "major_luck_start_age": self.major_luck_start_age,
+            "major_luck_set": self.major_luck_set,
+            "annual_luck_set": self.get_annual_luck_set(self.birth.year, 10),
+            "monthly_luck_set": self.get_monthly_luck_set(self.birth.year),
+            "daily_pillar_set": self.get_daily_pillar_set(self.birth.year, self.birth.month),
+        }
 
     def _validate_year(self, birth):
-        start_at = datetime.datetime(year=1900, month=1, day=5, hour=8, minute=36, tzinfo=ZoneInfo("UTC"))
-        end_at = datetime.datetime(year=2100, month=12, day=21, hour=19, minute=50, tzinfo=ZoneInfo("UTC"))
+        # 절기 테이블(1900~2100) 범위 밖은 천문 계산으로 절기를 구하므로, ΔT 근사가 유효한 범위로만 제한합니다.
+        start_at = datetime.datetime(year=1000, month=1, day=1, tzinfo=ZoneInfo("UTC"))
+        end_at = datetime.datetime(year=2999, month=12, day=31, tzinfo=ZoneInfo("UTC"))
         if start_at > birth or birth > end_at:
-            raise Exception("지원하지 않는 연도입니다.")
+            raise UnsupportedYearError("지원하지 않는 연도입니다.")
 
     def _get_dst_offset(self):
         """DST 오프셋을 안전하게 반환 (None이면 timedelta(0) 반환)"""
@@ -608,92 +1899,118 @@ class Saju:
 
     @cached_property
     def spti(self):
-        return f"{self.sun_moon}{self.dominant_receptiveness}{self.feeling_thinking}{self.process_outcome}-{self.wealth_honor}"
+        return spti_for(self.day_pillar % 10, self.month_pillar % 12, self.day_pillar % 12)
 
     @cached_property
     def stem_branch(self):
+        year_branch = self.year_pillar % 12
+        day_branch = self.day_pillar % 12
+        return StemBranch(
+            hour=self._pillar_payload("hour", self.hour_pillar, year_branch),
+            day=self._pillar_payload("day", self.day_pillar, year_branch),
+            month=self._pillar_payload("month", self.month_pillar, year_branch),
+            year=self._pillar_payload("year", self.year_pillar, day_branch),
+        )
+
+    def _pillar_payload(self, name, pillar, sin_sal_from_branch):
+        day_stem = self.day_pillar % 10
+        branch = pillar % 12
+        masks = self.sin_sal_masks
+        return Pillar(
+            stem=pillar_stem(day_stem, pillar % 10, masks[sin_sal_kind_codes[f"{name}_stem"]]),
+            branch=pillar_branch(
+                day_stem,
+                branch,
+                self._get_twelve_sin_sal(sin_sal_from_branch, branch),
+                masks[sin_sal_kind_codes[f"{name}_branch"]],
+            ),
+        )
+
+    def response_payload(self, fields=SAJU_DEFAULT_FIELDS):
+        """
+        요청한 필드 그룹만 담은 응답 dict를 만듭니다.
+
+        요청하지 않은 그룹의 속성(신살 평가, 대운 목록 등)은 접근하지 않으므로 계산되지 않습니다.
+
+        Args:
+            fields: `SAJU_RESPONSE_FIELDS` 중 응답에 포함할 그룹
+        """
+        payload = {}
+        for field in SAJU_RESPONSE_FIELDS:
+            if field not in fields:
+                continue
+            if field == "major_luck":
+                payload["major_luck_start_age"] = self.major_luck_start_age
+                payload["major_luck_set"] = self.major_luck_set
+            elif field == "pillars":
+                payload["pillars"] = self.pillar_names
+            else:
+                payload[field] = getattr(self, field)
+        return payload
+
+    def response_key(self, fields=SAJU_DEFAULT_FIELDS):
+        """
+        응답 캐시 키: (네 기둥, 필드 그룹[, 순행 여부, 대운 시작 나이])
+
+        대운 관련 값은 major_luck을 요청한 경우에만 키에 넣습니다.
+        """
+        if "major_luck" in fields:
+            return (*self.chart_key, fields)
+        return (*self.pillars, fields)
+
+    @cached_property
+    def pillar_names(self):
+        """네 기둥 간지 이름 (예: {"year": "경오", "month": "경진", "day": "경오", "hour": "신사"})"""
         return {
-            "hour": {
-                "stem": {
-                    "name": stem_ko_cn_map[self.hour_stem_branch[0]],
-                    "five_elements": stem_to_five_elements[self.hour_stem_branch[0]],
-                    "yin_yang": stem_to_yin_yang[self.hour_stem_branch[0]],
-                    "ten_god": self._get_ten_god(self.hour_stem_branch[0]),
-                    "sin_sal": self._get_sin_sal("hour_stem"),
-                },
-                "branch": {
-                    "name": branch_ko_cn_map[self.hour_stem_branch[1]],
-                    "five_elements": branch_to_five_elements[self.hour_stem_branch[1]],
-                    "yin_yang": branch_to_yin_yang[self.hour_stem_branch[1]],
-                    "ten_god": self._get_ten_god(branch_main_stem[self.hour_stem_branch[1]]),
-                    "hidden_stem": self._get_hidden_stems(self.hour_stem_branch[1]),
-                    "twelve_stage": self._get_twelve_stage(self.hour_stem_branch[1]),
-                    "twelve_sin_sal": self._get_twelve_sin_sal(self.year_stem_branch[1], self.hour_stem_branch[1]),
-                    "sin_sal": self._get_sin_sal("hour_branch"),
-                },
-            },
-            "day": {
-                "stem": {
-                    "name": stem_ko_cn_map[self.day_stem_branch[0]],
-                    "five_elements": stem_to_five_elements[self.day_stem_branch[0]],
-                    "yin_yang": stem_to_yin_yang[self.day_stem_branch[0]],
-                    "ten_god": self._get_ten_god(self.day_stem_branch[0]),
-                    "sin_sal": self._get_sin_sal("day_stem"),
-                },
-                "branch": {
-                    "name": branch_ko_cn_map[self.day_stem_branch[1]],
-                    "five_elements": branch_to_five_elements[self.day_stem_branch[1]],
-                    "yin_yang": branch_to_yin_yang[self.day_stem_branch[1]],
-                    "ten_god": self._get_ten_god(branch_main_stem[self.day_stem_branch[1]]),
-                    "hidden_stem": self._get_hidden_stems(self.day_stem_branch[1]),
-                    "twelve_stage": self._get_twelve_stage(self.day_stem_branch[1]),
-                    "twelve_sin_sal": self._get_twelve_sin_sal(self.year_stem_branch[1], self.day_stem_branch[1]),
-                    "sin_sal": self._get_sin_sal("day_branch"),
-                },
-            },
-            "month": {
-                "stem": {
-                    "name": stem_ko_cn_map[self.month_stem_branch[0]],
-                    "five_elements": stem_to_five_elements[self.month_stem_branch[0]],
-                    "yin_yang": stem_to_yin_yang[self.month_stem_branch[0]],
-                    "ten_god": self._get_ten_god(self.month_stem_branch[0]),
-                    "sin_sal": self._get_sin_sal("month_stem"),
-                },
-                "branch": {
-                    "name": branch_ko_cn_map[self.month_stem_branch[1]],
-                    "five_elements": branch_to_five_elements[self.month_stem_branch[1]],
-                    "yin_yang": branch_to_yin_yang[self.month_stem_branch[1]],
-                    "ten_god": self._get_ten_god(branch_main_stem[self.month_stem_branch[1]]),
-                    "hidden_stem": self._get_hidden_stems(self.month_stem_branch[1]),
-                    "twelve_stage": self._get_twelve_stage(self.month_stem_branch[1]),
-                    "twelve_sin_sal": self._get_twelve_sin_sal(self.year_stem_branch[1], self.month_stem_branch[1]),
-                    "sin_sal": self._get_sin_sal("month_branch"),
-                },
-            },
-            "year": {
-                "stem": {
-                    "name": stem_ko_cn_map[self.year_stem_branch[0]],
-                    "five_elements": stem_to_five_elements[self.year_stem_branch[0]],
-                    "yin_yang": stem_to_yin_yang[self.year_stem_branch[0]],
-                    "ten_god": self._get_ten_god(self.year_stem_branch[0]),
-                    "sin_sal": self._get_sin_sal("year_stem"),
-                },
-                "branch": {
-                    "name": branch_ko_cn_map[self.year_stem_branch[1]],
-                    "five_elements": branch_to_five_elements[self.year_stem_branch[1]],
-                    "yin_yang": branch_to_yin_yang[self.year_stem_branch[1]],
-                    "ten_god": self._get_ten_god(branch_main_stem[self.year_stem_branch[1]]),
-                    "hidden_stem": self._get_hidden_stems(self.year_stem_branch[1]),
-                    "twelve_stage": self._get_twelve_stage(self.year_stem_branch[1]),
-                    "twelve_sin_sal": self._get_twelve_sin_sal(self.day_stem_branch[1], self.year_stem_branch[1]),
-                    "sin_sal": self._get_sin_sal("year_branch"),
-                },
-            },
+            "year": self.year_stem_branch,
+            "month": self.month_stem_branch,
+            "day": self.day_stem_branch,
+            "hour": self.hour_stem_branch,
         }
 
+    @cached_property
+    def chart_key(self):
+        """
+        응답 캐시 키: (년주, 월주, 일주, 시주, 순행 여부, 대운 시작 나이)
+
+        사주 응답은 이 값들만으로 결정되므로 같은 키의 출생은 같은 응답을 갖습니다.
+        """
+        return (*self.pillars, self.is_forward, self.major_luck_start_age)
+
+    @cached_property
+    def pillars(self):
+        """(년주, 월주, 일주, 시주) 60갑자 코드"""
+        return (self.year_pillar, self.month_pillar, self.day_pillar, self.hour_pillar)
+
+    @cached_property
+    def sin_sal_masks(self):
+        """자리별 신살 비트마스크 (`sin_sal_kinds` 순서)"""
+        return evaluate_sin_sal(self.pillars)
+
     @cached_property
     def year_stem_branch(self):
-        solar_term = _get_ipchun_for_year(self.birth.year)
+        return pillar_name_table[self.year_pillar]
+
+    @cached_property
+    def month_stem_branch(self):
+        return pillar_name_table[self.month_pillar]
+
+    @cached_property
+    def day_stem_branch(self):
+        return pillar_name_table[self.day_pillar]
+
+    @cached_property
+    def hour_stem_branch(self):
+        return pillar_name_table[self.hour_pillar]
+
+    @cached_property
+    def chart_terms(self):
+        """출생 연도의 입춘과 출생 직전/직후 절기 (한 번만 조회)"""
+        return _resolve_chart_terms(self.birth)
+
+    @cached_property
+    def year_pillar(self):
+        solar_term = self.chart_terms.ipchun
         if solar_term is None:
             raise Exception(f"{self.birth.year}년 입춘 절기 데이터를 찾을 수 없습니다.")
         birth_year = self.birth.year
@@ -701,48 +2018,36 @@ class Saju:
             birth_year -= 1
 
         base_year = 1924  # 갑자년
-        year_diff = birth_year - base_year
-
-        stem_index = year_diff % 10
-        branch_index = year_diff % 12
-
-        return stem_list[stem_index] + branch_list[branch_index]
+        return (birth_year - base_year) % 60
 
     @cached_property
-    def month_stem_branch(self):
+    def month_pillar(self):
         """
         월주(月柱)를 구합니다. 절기를 기준으로 월이 바뀝니다.
 
         Returns:
-            str: 월주 간지 (예: "정묘")
+            int: 월주 60갑자 코드 (예: 정묘 -> 3)
         """
         # 생일 이전의 가장 가까운 절기 찾기(표준시, 써머타임 적용)
-        previous_jeolgi = _get_previous_jeolgi(self.birth)
+        previous_jeolgi = self.chart_terms.previous
         if previous_jeolgi is None:
             raise Exception("생일 이전 절기 데이터를 찾을 수 없습니다.")
 
-        month_branch = jeolgi_to_branch[previous_jeolgi.name]
-        if not month_branch:
+        month_branch = jeolgi_branch_table.get(previous_jeolgi.name)
+        if month_branch is None:
             raise Exception(f"알 수 없는 절기: {previous_jeolgi.name}")
 
         # 월간(月干) 계산: 년간에 따라 결정
-        year_stem = self.year_stem_branch[0]
-
-        first_month_stem = year_stem_to_first_month_stem[year_stem]
-        first_month_stem_index = stem_list.index(first_month_stem)
+        first_month_stem = first_month_stem_table[self.year_pillar % 10]
 
-        # 월 지지에 따른 월간 계산 (인월=0, 묘월=1, ...)
-        month_branch_index = branch_list.index(month_branch)
         # 인월부터 시작하므로 인월을 0으로 맞춤
-        month_order = (month_branch_index - 2) % 12  # 인=0, 묘=1, 진=2, ...
-
-        month_stem_index = (first_month_stem_index + month_order) % 10
-        month_stem = stem_list[month_stem_index]
+        month_order = (month_branch - 2) % 12  # 인=0, 묘=1, 진=2, ...
 
-        return month_stem + month_branch
+        month_stem = (first_month_stem + month_order) % 10
+        return pillar_of(month_stem, month_branch)
 
     @cached_property
-    def day_stem_branch(self):
+    def day_pillar(self):
         base_date = datetime.date(1924, 2, 15)  # 갑자일
         birth = self.birth - self._get_dst_offset() + self.offset_minutes
         # 23시인 경우 다음날로 처리 (자시는 23시-01시이므로 23시는 다음날 자시로 계산)
@@ -750,42 +2055,26 @@ class Saju:
             birth += datetime.timedelta(days=1)
         birth_date = birth.date()
 
-        # 기준일로부터 경과 일수 계산
-        days_diff = (birth_date - base_date).days
-
-        # 60갑자 순환으로 일주 계산
-        stem_index = days_diff % 10
-        branch_index = days_diff % 12
-
-        return stem_list[stem_index] + branch_list[branch_index]
+        # 기준일로부터 경과 일수로 60갑자 순환 계산
+        return (birth_date - base_date).days % 60
 
     @cached_property
-    def hour_stem_branch(self):
+    def hour_pillar(self):
         """
         시주(時柱)를 구합니다. 일간과 시간에 따라 결정됩니다.
 
         Returns:
-            str: 시주 간지 (예: "갑자")
+            int: 시주 60갑자 코드 (예: 갑자 -> 0)
         """
         # 시간에 따른 지지 결정 (2시간씩, 써머타임 조정)
         hour = (self.birth - self._get_dst_offset() + self.offset_minutes).hour
-
-        hour_branch = hour_to_branch[hour]
+        hour_branch = hour_branch_table[hour]
 
         # 일간에 따른 시간의 천간 계산
-        day_stem = self.day_stem_branch[0]
-
-        ja_stem = day_stem_to_ja_stem[day_stem]
-        ja_stem_index = stem_list.index(ja_stem)
-
-        # 시지에 따른 시간 계산 (자시=0, 축시=1, ...)
-        hour_branch_index = branch_list.index(hour_branch)
+        ja_stem = ja_stem_table[self.day_pillar % 10]
+        hour_stem = (ja_stem + hour_branch) % 10
 
-        # 시간의 천간 계산
-        hour_stem_index = (ja_stem_index + hour_branch_index) % 10
-        hour_stem = stem_list[hour_stem_index]
-
-        return hour_stem + hour_branch
+        return pillar_of(hour_stem, hour_branch)
 
     @cached_property
     def five_elements(self):
@@ -800,25 +2089,10 @@ class Saju:
         # 카운트 초기화
         five_elements_count = {"목": 0, "화": 0, "토": 0, "금": 0, "수": 0}
 
-        # 사주팔자 각 자리별 오행 계산
-        pillars = [
-            ("hour", self.hour_stem_branch),
-            ("day", self.day_stem_branch),
-            ("month", self.month_stem_branch),
-            ("year", self.year_stem_branch),
-        ]
-
-        for pillar_name, stem_branch_str in pillars:
-            stem = stem_branch_str[0]  # 천간
-            branch = stem_branch_str[1]  # 지지
-
-            # 천간 오행 추가
-            if stem in stem_to_five_elements:
-                five_elements_count[stem_to_five_elements[stem]] += 1
-
-            # 지지 오행 추가
-            if branch in branch_to_five_elements:
-                five_elements_count[branch_to_five_elements[branch]] += 1
+        # 사주팔자 각 자리별 천간/지지 오행 추가
+        for pillar in self.pillars:
+            five_elements_count[stem_five_elements_table[pillar % 10]] += 1
+            five_elements_count[branch_five_elements_table[pillar % 12]] += 1
 
         return five_elements_count
 
@@ -835,25 +2109,10 @@ class Saju:
         # 카운트 초기화
         yin_yang_count = {"양": 0, "음": 0}
 
-        # 사주팔자 각 자리별 음양 계산
-        pillars = [
-            ("hour", self.hour_stem_branch),
-            ("day", self.day_stem_branch),
-            ("month", self.month_stem_branch),
-            ("year", self.year_stem_branch),
-        ]
-
-        for pillar_name, stem_branch_str in pillars:
-            stem = stem_branch_str[0]  # 천간
-            branch = stem_branch_str[1]  # 지지
-
-            # 천간 음양 추가
-            if stem in stem_to_yin_yang:
-                yin_yang_count[stem_to_yin_yang[stem]] += 1
-
-            # 지지 음양 추가
-            if branch in branch_to_yin_yang:
-                yin_yang_count[branch_to_yin_yang[branch]] += 1
+        # 사주팔자 각 자리별 천간/지지 음양 추가
+        for pillar in self.pillars:
+            yin_yang_count[stem_yin_yang_table[pillar % 10]] += 1
+            yin_yang_count[branch_yin_yang_table[pillar % 12]] += 1
 
         return yin_yang_count
 
@@ -866,16 +2125,7 @@ class Saju:
         Returns:
             str: "S" 또는 "M"
         """
-        day_stem = self.day_stem_branch[0]
-        day_branch = self.day_stem_branch[1]
-
-        if day_stem == "정" and day_branch == "사":
-            return "S"
-
-        if stem_to_yin_yang[day_stem] == "양":
-            return "S"
-        else:
-            return "M"
+        return self.spti[0]
 
     @cached_property
     def dominant_receptiveness(self):
@@ -885,154 +2135,7 @@ class Saju:
         Returns:
             str: "D" 또는 "R"
         """
-        day_stem = self.day_stem_branch[0]
-        month_branch = self.month_stem_branch[1]
-
-        # 일간과 월지 조합에 따른 J/P 매핑 테이블
-        dr_mapping = {
-            "갑": {
-                "인": "D",
-                "묘": "D",
-                "진": "D",
-                "사": "D",
-                "오": "D",
-                "미": "D",
-                "신": "D",
-                "유": "D",
-                "술": "D",
-                "해": "R",
-                "자": "R",
-                "축": "D",
-            },
-            "을": {
-                "인": "D",
-                "묘": "D",
-                "진": "R",
-                "사": "R",
-                "오": "R",
-                "미": "R",
-                "신": "R",
-                "유": "R",
-                "술": "R",
-                "해": "R",
-                "자": "R",
-                "축": "R",
-            },
-            "병": {
-                "인": "D",
-                "묘": "D",
-                "진": "D",
-                "사": "D",
-                "오": "D",
-                "미": "D",
-                "신": "R",
-                "유": "R",
-                "술": "D",
-                "해": "R",
-                "자": "R",
-                "축": "D",
-            },
-            "정": {
-                "인": "R",
-                "묘": "R",
-                "진": "R",
-                "사": "D",
-                "오": "D",
-                "미": "D",
-                "신": "R",
-                "유": "R",
-                "술": "R",
-                "해": "R",
-                "자": "R",
-                "축": "R",
-            },
-            "무": {
-                "인": "R",
-                "묘": "R",
-                "진": "D",
-                "사": "D",
-                "오": "D",
-                "미": "D",
-                "신": "D",
-                "유": "D",
-                "술": "D",
-                "해": "R",
-                "자": "R",
-                "축": "D",
-            },
-            "기": {
-                "인": "R",
-                "묘": "R",
-                "진": "D",
-                "사": "D",
-                "오": "D",
-                "미": "D",
-                "신": "R",
-                "유": "R",
-                "술": "D",
-                "해": "R",
-                "자": "R",
-                "축": "D",
-            },
-            "경": {
-                "인": "D",
-                "묘": "D",
-                "진": "D",
-                "사": "D",
-                "오": "D",
-                "미": "R",
-                "신": "D",
-                "유": "D",
-                "술": "D",
-                "해": "D",
-                "자": "D",
-                "축": "D",
-            },
-            "신": {
-                "인": "D",
-                "묘": "D",
-                "진": "R",
-                "사": "R",
-                "오": "R",
-                "미": "R",
-                "신": "D",
-                "유": "D",
-                "술": "D",
-                "해": "D",
-                "자": "D",
-                "축": "D",
-            },
-            "임": {
-                "인": "D",
-                "묘": "D",
-                "진": "D",
-                "사": "D",
-                "오": "D",
-                "미": "D",
-                "신": "D",
-                "유": "R",
-                "술": "D",
-                "해": "D",
-                "자": "D",
-                "축": "D",
-            },
-            "계": {
-                "인": "R",
-                "묘": "R",
-                "진": "R",
-                "사": "R",
-                "오": "R",
-                "미": "R",
-                "신": "R",
-                "유": "R",
-                "술": "R",
-                "해": "D",
-                "자": "D",
-                "축": "R",
-            },
-        }
-
-        return dr_mapping[day_stem][month_branch]
+        return dr_table[self.day_pillar % 10][self.month_pillar % 12]
 
     @cached_property
     def feeling_thinking(self):
@@ -1042,154 +2145,7 @@ class Saju:
         Returns:
             str: "F" 또는 "T"
         """
-        day_stem = self.day_stem_branch[0]
-        month_branch = self.month_stem_branch[1]
-
-        # 일간과 월지 조합에 따른 F/T 매핑 테이블
-        ft_mapping = {
-            "갑": {
-                "인": "F",
-                "묘": "F",
-                "진": "F",
-                "사": "F",
-                "오": "F",
-                "미": "F",
-                "신": "T",
-                "유": "T",
-                "술": "F",
-                "해": "T",
-                "자": "T",
-                "축": "F",
-            },
-            "을": {
-                "인": "F",
-                "묘": "F",
-                "진": "F",
-                "사": "F",
-                "오": "F",
-                "미": "F",
-                "신": "T",
-                "유": "T",
-                "술": "F",
-                "해": "T",
-                "자": "T",
-                "축": "T",
-            },
-            "병": {
-                "인": "F",
-                "묘": "F",
-                "진": "F",
-                "사": "F",
-                "오": "F",
-                "미": "F",
-                "신": "T",
-                "유": "T",
-                "술": "F",
-                "해": "T",
-                "자": "T",
-                "축": "T",
-            },
-            "정": {
-                "인": "F",
-                "묘": "F",
-                "진": "F",
-                "사": "F",
-                "오": "F",
-                "미": "F",
-                "신": "T",
-                "유": "T",
-                "술": "F",
-                "해": "T",
-                "자": "T",
-                "축": "T",
-            },
-            "무": {
-                "인": "F",
-                "묘": "F",
-                "진": "F",
-                "사": "F",
-                "오": "F",
-                "미": "F",
-                "신": "T",
-                "유": "T",
-                "술": "F",
-                "해": "T",
-                "자": "T",
-                "축": "T",
-            },
-            "기": {
-                "인": "F",
-                "묘": "F",
-                "진": "F",
-                "사": "F",
-                "오": "F",
-                "미": "F",
-                "신": "T",
-                "유": "T",
-                "술": "F",
-                "해": "T",
-                "자": "T",
-                "축": "T",
-            },
-            "경": {
-                "인": "T",
-                "묘": "T",
-                "진": "T",
-                "사": "T",
-                "오": "T",
-                "미": "T",
-                "신": "T",
-                "유": "T",
-                "술": "T",
-                "해": "T",
-                "자": "T",
-                "축": "T",
-            },
-            "신": {
-                "인": "T",
-                "묘": "T",
-                "진": "T",
-                "사": "T",
-                "오": "T",
-                "미": "T",
-                "신": "T",
-                "유": "T",
-                "술": "T",
-                "해": "T",
-                "자": "T",
-                "축": "T",
-            },
-            "임": {
-                "인": "F",
-                "묘": "F",
-                "진": "T",
-                "사": "F",
-                "오": "F",
-                "미": "T",
-                "신": "T",
-                "유": "T",
-                "술": "T",
-                "해": "T",
-                "자": "T",
-                "축": "T",
-            },
-            "계": {
-                "인": "F",
-                "묘": "F",
-                "진": "T",
-                "사": "F",
-                "오": "F",
-                "미": "F",
-                "신": "T",
-                "유": "T",
-                "술": "T",
-                "해": "T",
-                "자": "T",
-                "축": "T",
-            },
-        }
-
-        return ft_mapping[day_stem][month_branch]
+        return ft_table[self.day_pillar % 10][self.month_pillar % 12]
 
     @cached_property
     def process_outcome(self):
@@ -1199,154 +2155,7 @@ class Saju:
         Returns:
             str: "P" 또는 "O"
         """
-        day_stem = self.day_stem_branch[0]
-        month_branch = self.month_stem_branch[1]
-
-        # 일간과 월지 조합에 따른 W/H 매핑 테이블
-        po_mapping = {
-            "갑": {
-                "인": "O",
-                "묘": "O",
-                "진": "O",
-                "사": "P",
-                "오": "P",
-                "미": "O",
-                "신": "O",
-                "유": "O",
-                "술": "O",
-                "해": "P",
-                "자": "P",
-                "축": "O",
-            },
-            "을": {
-                "인": "O",
-                "묘": "O",
-                "진": "O",
-                "사": "P",
-                "오": "P",
-                "미": "O",
-                "신": "O",
-                "유": "O",
-                "술": "O",
-                "해": "P",
-                "자": "P",
-                "축": "O",
-            },
-            "병": {
-                "인": "P",
-                "묘": "P",
-                "진": "P",
-                "사": "O",
-                "오": "O",
-                "미": "P",
-                "신": "O",
-                "유": "O",
-                "술": "P",
-                "해": "O",
-                "자": "O",
-                "축": "P",
-            },
-            "정": {
-                "인": "P",
-                "묘": "P",
-                "진": "P",
-                "사": "O",
-                "오": "O",
-                "미": "P",
-                "신": "O",
-                "유": "O",
-                "술": "P",
-                "해": "O",
-                "자": "O",
-                "축": "P",
-            },
-            "무": {
-                "인": "O",
-                "묘": "O",
-                "진": "O",
-                "사": "P",
-                "오": "P",
-                "미": "O",
-                "신": "P",
-                "유": "P",
-                "술": "O",
-                "해": "O",
-                "자": "O",
-                "축": "O",
-            },
-            "기": {
-                "인": "O",
-                "묘": "O",
-                "진": "O",
-                "사": "P",
-                "오": "P",
-                "미": "O",
-                "신": "P",
-                "유": "P",
-                "술": "O",
-                "해": "O",
-                "자": "O",
-                "축": "O",
-            },
-            "경": {
-                "인": "O",
-                "묘": "O",
-                "진": "P",
-                "사": "O",
-                "오": "O",
-                "미": "P",
-                "신": "O",
-                "유": "O",
-                "술": "P",
-                "해": "P",
-                "자": "P",
-                "축": "P",
-            },
-            "신": {
-                "인": "O",
-                "묘": "O",
-                "진": "P",
-                "사": "O",
-                "오": "O",
-                "미": "P",
-                "신": "O",
-                "유": "O",
-                "술": "P",
-                "해": "P",
-                "자": "P",
-                "축": "P",
-            },
-            "임": {
-                "인": "P",
-                "묘": "P",
-                "진": "O",
-                "사": "O",
-                "오": "O",
-                "미": "O",
-                "신": "P",
-                "유": "P",
-                "술": "O",
-                "해": "O",
-                "자": "O",
-                "축": "O",
-            },
-            "계": {
-                "인": "P",
-                "묘": "P",
-                "진": "O",
-                "사": "O",
-                "오": "O",
-                "미": "O",
-                "신": "P",
-                "유": "P",
-                "술": "O",
-                "해": "O",
-                "자": "O",
-                "축": "O",
-            },
-        }
-
-        return po_mapping[day_stem][month_branch]
+        return po_table[self.day_pillar % 10][self.month_pillar % 12]
 
     @cached_property
     def wealth_honor(self):
@@ -1356,162 +2165,12 @@ class Saju:
         Returns:
             str: "W" 또는 "H"
         """
-        day_stem = self.day_stem_branch[0]
-        month_branch = self.month_stem_branch[1]
-
-        # 일간과 월지 조합에 따른 W/H 매핑 테이블
-        wh_mapping = {
-            "갑": {
-                "인": "W",
-                "묘": "W",
-                "진": "W",
-                "사": "W",
-                "오": "W",
-                "미": "W",
-                "신": "H",
-                "유": "H",
-                "술": "W",
-                "해": "H",
-                "자": "H",
-                "축": "W",
-            },
-            "을": {
-                "인": "W",
-                "묘": "W",
-                "진": "W",
-                "사": "W",
-                "오": "W",
-                "미": "W",
-                "신": "H",
-                "유": "H",
-                "술": "W",
-                "해": "H",
-                "자": "H",
-                "축": "W",
-            },
-            "병": {
-                "인": "H",
-                "묘": "H",
-                "진": "W",
-                "사": "W",
-                "오": "W",
-                "미": "W",
-                "신": "W",
-                "유": "W",
-                "술": "W",
-                "해": "H",
-                "자": "H",
-                "축": "W",
-            },
-            "정": {
-                "인": "H",
-                "묘": "H",
-                "진": "W",
-                "사": "W",
-                "오": "W",
-                "미": "W",
-                "신": "W",
-                "유": "W",
-                "술": "W",
-                "해": "H",
-                "자": "H",
-                "축": "W",
-            },
-            "무": {
-                "인": "H",
-                "묘": "H",
-                "진": "W",
-                "사": "W",
-                "오": "W",
-                "미": "W",
-                "신": "W",
-                "유": "W",
-                "술": "W",
-                "해": "W",
-                "자": "W",
-                "축": "W",
-            },
-            "기": {
-                "인": "H",
-                "묘": "H",
-                "진": "W",
-                "사": "H",
-                "오": "H",
-                "미": "W",
-                "신": "W",
-                "유": "W",
-                "술": "W",
-                "해": "W",
-                "자": "W",
-                "축": "W",
-            },
-            "경": {
-                "인": "W",
-                "묘": "W",
-                "진": "H",
-                "사": "H",
-                "오": "H",
-                "미": "H",
-                "신": "W",
-                "유": "W",
-                "술": "H",
-                "해": "W",
-                "자": "W",
-                "축": "H",
-            },
-            "신": {
-                "인": "W",
-                "묘": "W",
-                "진": "H",
-                "사": "H",
-                "오": "H",
-                "미": "H",
-                "신": "W",
-                "유": "W",
-                "술": "H",
-                "해": "W",
-                "자": "W",
-                "축": "H",
-            },
-            "임": {
-                "인": "W",
-                "묘": "W",
-                "진": "H",
-                "사": "W",
-                "오": "W",
-                "미": "H",
-                "신": "W",
-                "유": "W",
-                "술": "H",
-                "해": "W",
-                "자": "W",
-                "축": "H",
-            },
-            "계": {
-                "인": "W",
-                "묘": "W",
-                "진": "H",
-                "사": "W",
-                "오": "W",
-                "미": "H",
-                "신": "W",
-                "유": "W",
-                "술": "H",
-                "해": "W",
-                "자": "W",
-                "축": "H",
-            },
-        }
-
-        return wh_mapping[day_stem][month_branch]
+        return wh_table[self.day_pillar % 10][self.month_pillar % 12]
 
     @cached_property
     def is_forward(self):
-        year_stem = self.year_stem_branch[0]
-
-        # 양간: 갑, 병, 무, 경, 임 / 음간: 을, 정, 기, 신, 계
-        yang_stem = ["갑", "병", "무", "경", "임"]
-        is_yang_year = year_stem in yang_stem
+        # 양간: 갑, 병, 무, 경, 임 (짝수 코드) / 음간: 을, 정, 기, 신, 계 (홀수 코드)
+        is_yang_year = self.year_pillar % 2 == 0
 
         # 대운 진행 방향 결정
         is_male = self.gender == "male"
@@ -1530,14 +2189,14 @@ class Saju:
         """
         if self.is_forward:
             # 순행: 생일 이후 첫 번째 절기까지의 일수
-            next_solar_term = _get_next_jeolgi(self.birth)
+            next_solar_term = self.chart_terms.next
             if next_solar_term is None:
                 raise Exception("생일 이후 절기 데이터를 찾을 수 없습니다.")
 
             days_diff = (next_solar_term.at.date() - self.birth.date()).days
         else:
             # 역행: 생일 이전 가장 가까운 절기부터의 일수
-            prev_solar_term = _get_previous_jeolgi(self.birth)
+            prev_solar_term = self.chart_terms.previous
             if prev_solar_term is None:
                 raise Exception("생일 이전 절기 데이터를 찾을 수 없습니다.")
 
@@ -1559,54 +2218,21 @@ class Saju:
         각 대운 나이별 대운 간지를 구합니다.
 
         Returns:
-            list: 대운 간지 목록 (예: [{"age": 3, "stem": {"name": "무진", "ten_god": "..."}, "branch": ...}, ...])
+            list: 대운 목록 `MajorLuck` (JSON 예: [{"age": 3, "stem": {"name": "무", "ten_god": "..."}, "branch": ...}, ...])
         """
+        # 순행은 월주의 다음 간지부터, 역행은 월주의 이전 간지부터 순차적으로 진행
+        step = 1 if self.is_forward else -1
+        day_branch = self.day_pillar % 12
 
         major_luck_list = []
-        ages = []
         for i in range(10):
-            ages.append(self.major_luck_start_age + (i * 10))
-
-        for i, age in enumerate(ages):
-            if self.is_forward:
-                # 순행: 월주에서 다음 간지들
-                if i == 0:
-                    # 첫 번째 대운은 월주의 다음 간지
-                    current_stem = self._next_stem(self.month_stem_branch[0])
-                    current_branch = self._next_branch(self.month_stem_branch[1])
-                else:
-                    # 이후 대운들은 순차적으로 다음 간지
-                    current_stem = self._next_stem(major_luck_list[i - 1]["stem"]["name"])
-                    current_branch = self._next_branch(major_luck_list[i - 1]["branch"]["name"])
-            else:
-                # 역행: 월주에서 이전 간지들
-                if i == 0:
-                    # 첫 번째 대운은 월주의 이전 간지
-                    current_stem = self._prev_stem(self.month_stem_branch[0])
-                    current_branch = self._prev_branch(self.month_stem_branch[1])
-                else:
-                    # 이후 대운들은 순차적으로 이전 간지
-                    current_stem = self._prev_stem(major_luck_list[i - 1]["stem"]["name"])
-                    current_branch = self._prev_branch(major_luck_list[i - 1]["branch"]["name"])
-
+            pillar = (self.month_pillar + step * (i + 1)) % 60
             major_luck_list.append(
-                {
-                    "age": age,
-                    "stem": {
-                        "name": current_stem,
-                        "five_elements": stem_to_five_elements[current_stem],
-                        "yin_yang": stem_to_yin_yang[current_stem],
-                        "ten_god": self._get_ten_god(current_stem),
-                    },
-                    "branch": {
-                        "name": current_branch,
-                        "five_elements": branch_to_five_elements[current_branch],
-                        "yin_yang": branch_to_yin_yang[current_branch],
-                        "ten_god": self._get_ten_god(branch_main_stem[current_branch]),
-                        "twelve_stage": self._get_twelve_stage(current_branch),
-                        "twelve_sin_sal": self._get_twelve_sin_sal(self.day_stem_branch[1], current_branch),
-                    },
-                }
+                MajorLuck(
+                    age=self.major_luck_start_age + (i * 10),
+                    stem=self._luck_stem_payload(pillar % 10),
+                    branch=self._luck_branch_payload(pillar % 12, self._get_twelve_sin_sal(day_branch, pillar % 12)),
+                )
             )
 
         return major_luck_list
@@ -1616,45 +2242,26 @@ class Saju:
         연운(年運)을 계산합니다. 각 연도별 연간 간지를 구합니다.
 
         Returns:
-            list: 연운 간지 목록 (예: [{"year": 2024, "stem": {"name": "갑", "ten_god": "..."}, "branch": {"name": "진", "ten_god": "...", "twelve_stage": "..."}}, ...])
+            list: 연운 목록 `AnnualLuck` (JSON 예: [{"year": 2024, "stem": {"name": "갑", "ten_god": "..."}, "branch": {"name": "진", "ten_god": "...", "twelve_stage": "..."}}, ...])
         """
-        annual_luck_list = []
+        return list(self.iter_annual_luck(start_year, start_year + limit - 1))
 
-        # 향후 20년간의 연운 계산
-        for i in range(limit):
-            target_year = start_year + i
+    def iter_annual_luck(self, start_year, end_year):
+        """
+        start_year~end_year(포함) 연운을 순서대로 생성합니다. (`get_annual_luck_set`과 같은 항목)
+        """
+        day_branch = self.day_pillar % 12
 
+        for target_year in range(start_year, end_year + 1):
             # 해당 연도의 간지 계산 (1924년 갑자년 기준)
             base_year = 1924  # 갑자년
-            year_diff = target_year - base_year
-
-            stem_index = year_diff % 10
-            branch_index = year_diff % 12
-
-            year_stem = stem_list[stem_index]
-            year_branch = branch_list[branch_index]
-
-            annual_luck_list.append(
-                {
-                    "year": target_year,
-                    "stem": {
-                        "name": year_stem,
-                        "five_elements": stem_to_five_elements[year_stem],
-                        "yin_yang": stem_to_yin_yang[year_stem],
-                        "ten_god": self._get_ten_god(year_stem),
-                    },
-                    "branch": {
-                        "name": year_branch,
-                        "five_elements": branch_to_five_elements[year_branch],
-                        "yin_yang": branch_to_yin_yang[year_branch],
-                        "ten_god": self._get_ten_god(branch_main_stem[year_branch]),
-                        "twelve_stage": self._get_twelve_stage(year_branch),
-                        "twelve_sin_sal": self._get_twelve_sin_sal(self.day_stem_branch[1], self.day_stem_branch[1]),
-                    },
-                }
-            )
+            pillar = (target_year - base_year) % 60
 
-        return annual_luck_list
+            yield AnnualLuck(
+                year=target_year,
+                stem=self._luck_stem_payload(pillar % 10),
+                branch=self._luck_branch_payload(pillar % 12, self._get_twelve_sin_sal(day_branch, day_branch)),
+            )
 
     def get_monthly_luck_set(self, year):
         """
@@ -1664,50 +2271,47 @@ class Saju:
             year (int): 연도
 
         Returns:
-            list: 월운 간지 목록 (예: [{"jeolgi": "입춘", "start_date": "2024-02-04", "stem": {"name": "병", "ten_god": "..."}, "branch": {"name": "인", "ten_god": "...", "twelve_stage": "..."}}, ...])
+            list: 월운 목록 `MonthlyLuck` (JSON 예: [{"year": 2024, "month": 2, "jeolgi": "입춘", "start_at": "2024-02-04T17:27:00+09:00", "end_at": "...", "stem": {"name": "병", "ten_god": "..."}, "branch": {"name": "인", "ten_god": "...", "twelve_stage": "..."}}, ...])
+        """
+        return list(self.iter_monthly_luck(year))
+
+    def iter_monthly_luck(self, year, end_year=None):
         """
-        monthly_luck_list = []
+        year~end_year(포함, 기본값 year) 월운을 순서대로 생성합니다. (연도별 소한~대설 12개월)
 
-        # 해당 연도의 년간 구하기
+        - 각 달에는 절기 이름과 시작/종료 시각(다음 절기 시각, +09:00 고정 오프셋)을 붙입니다. 절기는 전체 기간을 한 번에 조회합니다.
+        - 월간은 입춘 기준 년간으로 구합니다. (소한 달은 입춘 이전이므로 전년도 년간 기준)
+        """
+        end_year = year if end_year is None else end_year
+        day_branch = self.day_pillar % 12
         base_year = 1924  # 갑자년
-        year_diff = year - base_year
-        year_stem_index = year_diff % 10
-        year_stem = stem_list[year_stem_index]
-
-        # 년간에 따른 정월(인월)의 월간 구하기
-        first_month_stem = year_stem_to_first_month_stem[year_stem]
-        first_month_stem_index = stem_list.index(first_month_stem)
-
-        # 절기별 월운 계산
-        for i, (jeolgi, month_branch) in enumerate(jeolgi_to_branch.items()):
-            # 월간 계산 (인월=0부터 시작)
-            month_branch_index = branch_list.index(month_branch)
-            month_order = (month_branch_index - 2) % 12  # 인=0, 묘=1, 진=2, ...
-
-            month_stem_index = (first_month_stem_index + month_order) % 10
-            month_stem = stem_list[month_stem_index]
-
-            monthly_luck_list.append(
-                {
-                    "month": i + 1,
-                    "stem": {
-                        "name": month_stem,
-                        "five_elements": stem_to_five_elements[month_stem],
-                        "yin_yang": stem_to_yin_yang[month_stem],
-                        "ten_god": self._get_ten_god(month_stem),
-                    },
-                    "branch": {
-                        "name": month_branch,
-                        "five_elements": branch_to_five_elements[month_branch],
-                        "yin_yang": branch_to_yin_yang[month_branch],
-                        "ten_god": self._get_ten_god(branch_main_stem[month_branch]),
-                        "twelve_stage": self._get_twelve_stage(month_branch),
-                        "twelve_sin_sal": self._get_twelve_sin_sal(self.day_stem_branch[1], month_branch),
-                    },
-                }
-            )
 
-        return monthly_luck_list
+        # 대설 달의 종료 시각(다음 해 소한)까지 필요하므로 한 해 더 조회
+        epochs, codes = _get_jeolgi_table(year, end_year + 1)
+        for i in range(len(epochs) - 1):
+            start_at = datetime.datetime.fromtimestamp(epochs[i], KST)
+            if start_at.year < year:
+                continue
+            if start_at.year > end_year:
+                break
+
+            name = solar_term_names[codes[i]]
+            month_branch = jeolgi_branch_table[name]
+            # 월간 계산: 해당 달이 속한 (입춘 기준) 해의 정월(인월) 월간에서 인월=0 기준 순서만큼 진행
+            saju_year = start_at.year - 1 if month_branch == 1 else start_at.year  # 소한(축월)은 전년도
+            first_month_stem = first_month_stem_table[(saju_year - base_year) % 10]
+            month_order = (month_branch - 2) % 12  # 인=0, 묘=1, 진=2, ...
+            month_stem = (first_month_stem + month_order) % 10
+
+            yield MonthlyLuck(
+                year=start_at.year,
+                month=codes[i] // 2 + 1,  # 소한=1, 입춘=2, ..., 대설=12
+                jeolgi=name,
+                start_at=datetime.datetime.fromtimestamp(epochs[i], KST_FIXED_OFFSET).isoformat(),
+                end_at=datetime.datetime.fromtimestamp(epochs[i + 1], KST_FIXED_OFFSET).isoformat(),
+                stem=self._luck_stem_payload(month_stem),
+                branch=self._luck_branch_payload(month_branch, self._get_twelve_sin_sal(day_branch, month_branch)),
+            )
 
     def get_daily_pillar_set(self, year, month):
         """
@@ -1718,820 +2322,166 @@ class Saju:
             month (int): 월 (1-12)
 
         Returns:
-            list: 일진 달력 목록 (예: [{"day": 1, "date": "2024-01-01", "stem": "갑", "branch": "자", "stem_branch": "갑자"}, ...])
+            list: 일진 달력 목록 `DailyPillar` (JSON 예: [{"day": 1, "date": "2024-01-01", "stem": "갑", "branch": "자", "stem_branch": "갑자"}, ...])
         """
-
-        daily_calendar = []
-
         # 해당 월의 마지막 날 구하기
         last_day = calendar.monthrange(year, month)[1]
 
-        # 기준일 (1924년 2월 15일 갑자일)
-        base_date = datetime.date(1924, 2, 15)
-
-        for day in range(1, last_day + 1):
-            target_date = datetime.date(year, month, day)
-
-            # 기준일로부터 경과 일수 계산
-            days_diff = (target_date - base_date).days
-
-            # 60갑자 순환으로 일진 계산
-            stem_index = days_diff % 10
-            branch_index = days_diff % 12
-
-            day_stem = stem_list[stem_index]
-            day_branch = branch_list[branch_index]
-
-            daily_calendar.append(
-                {
-                    "day": day,
-                    "date": target_date.strftime("%Y-%m-%d"),
-                    "stem": {
-                        "name": day_stem,
-                        "five_elements": stem_to_five_elements[day_stem],
-                        "yin_yang": stem_to_yin_yang[day_stem],
-                        "ten_god": self._get_ten_god(day_stem),
-                    },
-                    "branch": {
-                        "name": day_branch,
-                        "five_elements": branch_to_five_elements[day_branch],
-                        "yin_yang": branch_to_yin_yang[day_branch],
-                        "ten_god": self._get_ten_god(branch_main_stem[day_branch]),
-                        "twelve_stage": self._get_twelve_stage(day_branch),
-                        "twelve_sin_sal": self._get_twelve_sin_sal(self.day_stem_branch[1], day_branch),
-                    },
-                }
+        return list(self.iter_daily_pillars(datetime.date(year, month, 1), datetime.date(year, month, last_day)))
+
+    def iter_daily_pillars(self, start, end):
+        """
+        start~end(포함) 날짜의 일진을 순서대로 생성합니다. (`get_daily_pillar_set`과 같은 항목)
+
+        60갑자 코드와 날짜를 하루씩 증가시키며, stem/branch 값은 60갑자별로 미리 만든 공유 객체를 사용합니다.
+
+        Args:
+            start (datetime.date): 시작 날짜
+            end (datetime.date): 종료 날짜
+        """
+        payloads = self._daily_pillar_payloads
+
+        # 기준일(1924년 2월 15일 갑자일)로부터 경과 일수로 시작일의 60갑자 코드를 구하고, 이후는 하루씩 증가
+        pillar = (start - datetime.date(1924, 2, 15)).days % 60
+        year, month, day = start.year, start.month, start.day
+        remaining = (end - start).days + 1
+
+        while remaining > 0:
+            prefix = f"{year:04d}-{month:02d}-"
+            last_day = min(calendar.monthrange(year, month)[1], day + remaining - 1)
+            for d in range(day, last_day + 1):
+                stem, branch = payloads[pillar]
+                yield DailyPillar(d, prefix + _day_of_month_strings[d], stem, branch)
+                pillar = pillar + 1 if pillar < 59 else 0
+
+            remaining -= last_day - day + 1
+            day = 1
+            month += 1
+            if month > 12:
+                year, month = year + 1, 1
+
+    @cached_property
+    def _daily_pillar_payloads(self):
+        """60갑자 코드 -> 일진 (stem, branch) 항목 (일간/일지 기준이므로 사주마다 60개만 만듭니다)"""
+        day_branch = self.day_pillar % 12
+        return tuple(
+            (
+                self._luck_stem_payload(pillar % 10),
+                self._luck_branch_payload(pillar % 12, self._get_twelve_sin_sal(day_branch, pillar % 12)),
             )
+            for pillar in range(60)
+        )
 
-        return daily_calendar
-
-    @staticmethod
-    def _prev_stem(stem):
-        stem_index = (stem_list.index(stem) - 1) % 10
-        return stem_list[stem_index]
-
-    @staticmethod
-    def _next_stem(stem):
-        stem_index = (stem_list.index(stem) + 1) % 10
-        return stem_list[stem_index]
-
-    @staticmethod
-    def _prev_branch(branch):
-        branch_index = (branch_list.index(branch) - 1) % 12
-        return branch_list[branch_index]
-
-    @staticmethod
-    def _next_branch(branch):
-        branch_index = (branch_list.index(branch) + 1) % 12
-        return branch_list[branch_index]
-
-    def _get_target(self, kind):
-        if kind == "hour_stem":
-            return self.hour_stem_branch[0]
-        if kind == "hour_branch":
-            return self.hour_stem_branch[1]
-        if kind == "day_stem":
-            return self.day_stem_branch[0]
-        if kind == "day_branch":
-            return self.day_stem_branch[1]
-        if kind == "month_stem":
-            return self.month_stem_branch[0]
-        if kind == "month_branch":
-            return self.month_stem_branch[1]
-        if kind == "year_stem":
-            return self.year_stem_branch[0]
-        if kind == "year_branch":
-            return self.year_stem_branch[1]
-        return None
+    def _luck_stem_payload(self, stem):
+        return luck_stem_table[self.day_pillar % 10][stem]
+
+    def _luck_branch_payload(self, branch, twelve_sin_sal):
+        return luck_branch(self.day_pillar % 10, branch, twelve_sin_sal)
 
     def _get_ten_god(self, target_stem):
         """
-        일간과 다른 간지를 비교하여 십성을 구합니다.
+        일간과 다른 천간을 비교하여 십성을 구합니다.
 
         Args:
-            target_stem (str): 비교할 간지 (예: "을")
+            target_stem (int): 비교할 천간 코드 (예: 을 -> 1)
 
         Returns:
             str: 십성 (예: "겁재")
         """
-
-        day_five_elements = stem_to_five_elements[self.day_stem_branch[0]]
-        day_yin_yang = stem_to_yin_yang[self.day_stem_branch[0]]
-        target_five_elements = stem_to_five_elements[target_stem]
-        target_yin_yang = stem_to_yin_yang[target_stem]
-
-        # 같은 오행인 경우
-        if day_five_elements == target_five_elements:
-            if day_yin_yang == target_yin_yang:
-                return "비견"  # 같은 음양
-            else:
-                return "겁재"  # 다른 음양
-
-        # 일간이 생하는 오행 (식상)
-        elif target_five_elements == five_elements_relations[day_five_elements]["생"]:
-            if day_yin_yang == target_yin_yang:
-                return "식신"  # 같은 음양
-            else:
-                return "상관"  # 다른 음양
-
-        # 일간을 생하는 오행 (인성)
-        elif target_five_elements == five_elements_relations[day_five_elements]["피생"]:
-            if day_yin_yang == target_yin_yang:
-                return "편인"  # 같은 음양
-            else:
-                return "정인"  # 다른 음양
-
-        # 일간이 극하는 오행 (재성)
-        elif target_five_elements == five_elements_relations[day_five_elements]["극"]:
-            if day_yin_yang == target_yin_yang:
-                return "편재"  # 같은 음양
-            else:
-                return "정재"  # 다른 음양
-
-        # 일간을 극하는 오행 (관성)
-        elif target_five_elements == five_elements_relations[day_five_elements]["피극"]:
-            if day_yin_yang == target_yin_yang:
-                return "편관"  # 같은 음양 (칠살)
-            else:
-                return "정관"  # 다른 음양
-
-        return "알 수 없음"
+        return ten_god_table[self.day_pillar % 10][target_stem]
 
     def _get_hidden_stems(self, target_branch):
-        return hidden_stem_map[target_branch]
+        return hidden_stem_table[target_branch]
 
     def _get_twelve_stage(self, target_branch):
         """
         일간과 지지를 비교하여 12운성을 구합니다.
 
         Args:
-            target_branch (str): 지지 (예: "자")
+            target_branch (int): 지지 코드 (예: 자 -> 0)
 
         Returns:
             str: 12운성 (예: "장생")
         """
-        # 천간별 12운성 매핑
-        return twelve_stage_map[self.day_stem_branch[0]][target_branch]
+        return twelve_stage_table[self.day_pillar % 10][target_branch]
 
     def _get_twelve_sin_sal(self, from_branch, target_branch):
         """
         일지와 연지, 연지와 월지, 일지, 시지
-        일지와 대상 지지를 비교하여 12신살을 구합니다.
+        기준 지지와 대상 지지를 비교하여 12신살을 구합니다.
 
         Args:
-            target_branch (str): 대상 지지
+            from_branch (int): 기준 지지 코드
+            target_branch (int): 대상 지지 코드
 
         Returns:
             str: 12신살 (예: "역마", "도화", "공망") 또는 None
         """
-        for group, mapping in twelve_sin_sal_map.items():
-            if from_branch in group:
-                return mapping[target_branch]
-        return None
+        return twelve_sin_sal_table[from_branch][target_branch]
 
     def _get_sin_sal(self, kind):
-        # sin_sal 속성을 가진 모든 메소드를 자동으로 찾기
-        sin_sal_functions = []
-
-        # 클래스의 모든 메소드를 검사 (인스턴스가 아닌 클래스에서)
-        for attr_name in dir(self.__class__):
-            if attr_name.startswith("_get_"):
-                method = getattr(self.__class__, attr_name)
-                if hasattr(method, "sin_sal"):
-                    # 인스턴스 메소드로 바인딩
-                    bound_method = getattr(self, attr_name)
-                    sin_sal_functions.append(bound_method)
-
-        return [func.sin_sal for func in sin_sal_functions if func(kind)]
-
-    @sin_sal("천을귀인")
-    def _get_heavenly_noble(self, kind):
-        """
-        천을귀인을 구합니다.
-        """
-        if not kind.endswith("branch"):
-            return False
-
-        day_stem = self.day_stem_branch[0]
-        target = self._get_target(kind)
-
-        # 천을귀인 매핑
-        heavenly_noble_map = {
-            "갑": ["축", "미"],
-            "을": ["자", "신"],
-            "병": ["해", "유"],
-            "정": ["해", "유"],
-            "무": ["축", "미"],
-            "기": ["자", "신"],
-            "경": ["축", "미"],
-            "신": ["인", "오"],
-            "임": ["묘", "사"],
-            "계": ["인", "오"],
-        }
-
-        return target in heavenly_noble_map[day_stem]
-
-    @sin_sal("천덕귀인")
-    def _get_heavenly_virtue(self, kind):
-        """
-        천덕귀인을 구합니다.
-        """
-        if kind == "month_branch":
-            return False
-
-        month_branch = self.month_stem_branch[1]
-        target = self._get_target(kind)
-
-        # 천덕귀인 매핑 (월지별)
-        heavenly_virtue_map = {
-            "자": "사",
-            "축": "경",
-            "인": "정",
-            "묘": "신",
-            "진": "임",
-            "사": "신",
-            "오": "해",
-            "미": "갑",
-            "신": "계",
-            "유": "인",
-            "술": "병",
-            "해": "을",
-        }
-
-        return target == heavenly_virtue_map[month_branch]
-
-    @sin_sal("월덕귀인")
-    def _get_monthly_virtue(self, kind):
-        """
-        월덕귀인을 구합니다.
-        """
-        if not kind.endswith("stem"):
-            return False
-
-        month_branch = self.month_stem_branch[1]
-        target = self._get_target(kind)
-
-        # 월덕귀인 매핑 (월지별 해당하는 천간)
-        monthly_virtue_map = {
-            "자": "임",  # 자월 → 임수
-            "축": "경",  # 축월 → 경금
-            "인": "병",  # 인월 → 병화
-            "묘": "갑",  # 묘월 → 갑목
-            "진": "임",  # 진월 → 임수
-            "사": "경",  # 사월 → 경금
-            "오": "병",  # 오월 → 병화
-            "미": "갑",  # 미월 → 갑목
-            "신": "임",  # 신월 → 임수
-            "유": "경",  # 유월 → 경금
-            "술": "병",  # 술월 → 병화
-            "해": "갑",  # 해월 → 갑목
-        }
-
-        return target == monthly_virtue_map[month_branch]
-
-    @sin_sal("월공귀인")
-    def _get_monthly_kong(self, kind):
-        """
-        월공귀인을 구합니다.
-        """
-        if not kind.endswith("stem"):
-            return False
-
-        month_branch = self.month_stem_branch[1]
-        target = self._get_target(kind)
-
-        # 월공귀인 매핑 (월지별 해당하는 천간)
-        monthly_kong_map = {
-            "자": "병",  # 자월 → 병화
-            "축": "갑",  # 축월 → 갑목
-            "인": "임",  # 인월 → 임수
-            "묘": "경",  # 묘월 → 경금
-            "진": "병",  # 진월 → 병화
-            "사": "갑",  # 사월 → 갑목
-            "오": "임",  # 오월 → 임수
-            "미": "경",  # 미월 → 경금
-            "신": "병",  # 신월 → 병화
-            "유": "갑",  # 유월 → 갑목
-            "술": "임",  # 술월 → 임수
-            "해": "경",  # 해월 → 경금
-        }
-
-        return target == monthly_kong_map[month_branch]
-
-    @sin_sal("문창귀인")
-    def _get_moon_chang(self, kind):
-        """
-        문창귀인을 구합니다.
-        """
-        if not kind.endswith("branch"):
-            return False
-
-        day_stem = self.day_stem_branch[0]
-        target = self._get_target(kind)
-
-        # 문창귀인 매핑 (일간별 해당하는 지지)
-        moon_chang_map = {
-            "갑": "사",  # 갑목 → 사화
-            "을": "오",  # 을목 → 오화
-            "병": "신",  # 병화 → 신금
-            "정": "유",  # 정화 → 유금
-            "무": "신",  # 무토 → 신금 (화토동법)
-            "기": "유",  # 기토 → 유금 (화토동법)
-            "경": "해",  # 경금 → 해수
-            "신": "자",  # 신금 → 자수
-            "임": "인",  # 임수 → 인목
-            "계": "묘",  # 계수 → 묘목
-        }
-
-        return target == moon_chang_map[day_stem]
-
-    @sin_sal("천의귀인")
-    def _get_heavenly_doctor(self, kind):
-        """
-        천의귀인을 구합니다.
-        """
-        if not kind.endswith("branch"):
-            return False
-
-        month_branch = self.month_stem_branch[1]
-        target = self._get_target(kind)
-
-        # 천의귀인 매핑 (월지별 해당하는 지지)
-        heavenly_doctor_map = {
-            "자": "해",  # 자월 → 해지
-            "축": "자",  # 축월 → 자지
-            "인": "축",  # 인월 → 축지
-            "묘": "인",  # 묘월 → 인지
-            "진": "묘",  # 진월 → 묘지
-            "사": "진",  # 사월 → 진지
-            "오": "사",  # 오월 → 사지
-            "미": "오",  # 미월 → 오지
-            "신": "미",  # 신월 → 미지
-            "유": "신",  # 유월 → 신지
-            "술": "유",  # 술월 → 유지
-            "해": "술",  # 해월 → 술지
-        }
-
-        return target == heavenly_doctor_map[month_branch]
-
-    @sin_sal("암록귀인")
-    def _get_hidden_fortune(self, kind):
-        """
-        암록귀인을 구합니다.
-        """
-        if not kind.endswith("branch"):
-            return False
-
-        day_stem = self.day_stem_branch[0]
-        target = self._get_target(kind)
-
-        # 암록귀인 매핑 (일간별 해당하는 지지)
-        hidden_fortune_map = {
-            "갑": "해",  # 갑목 → 해지
-            "을": "술",  # 을목 → 술지
-            "병": "신",  # 병화 → 신지
-            "정": "미",  # 정화 → 미지
-            "무": "신",  # 무토 → 신지 (화토동법)
-            "기": "미",  # 기토 → 미지 (화토동법)
-            "경": "사",  # 경금 → 사지
-            "신": "진",  # 신금 → 진지
-            "임": "인",  # 임수 → 인지
-            "계": "축",  # 계수 → 축지
-        }
-
-        return target == hidden_fortune_map[day_stem]
-
-    @sin_sal("학당귀인")
-    def _get_academic_hall(self, kind):
-        """
-        학당귀인을 구합니다.
-        """
-        if not kind.endswith("branch"):
-            return False
-
-        target = self._get_target(kind)
-        day_stem = self.day_stem_branch[0]
-
-        academic_hall_map = {
-            "갑": "사",
-            "을": "오",
-            "병": "인",
-            "정": "유",
-            "무": "인",
-            "기": "유",
-            "경": "사",
-            "신": "자",
-            "임": "신",
-            "계": "묘",
-        }
-
-        return academic_hall_map[day_stem] == target
-
-    @sin_sal("천의성")
-    def _get_heavenly_fortress(self, kind):
-        """
-        천의성을 구합니다.
-        """
-        if not kind.endswith("branch") or kind == "month_branch":
-            return False
-
-        target = self._get_target(kind)
-        month_branch = self.month_stem_branch[1]
-
-        heavenly_fortress_map = {
-            "자": "해",
-            "축": "자",
-            "인": "축",
-            "묘": "인",
-            "진": "묘",
-            "사": "진",
-            "오": "사",
-            "미": "오",
-            "신": "미",
-            "유": "신",
-            "술": "유",
-            "해": "술",
-        }
-
-        return heavenly_fortress_map[month_branch] == target
-
-    @sin_sal("역마살")
-    def _get_post_horse(self, kind):
-        """
-        역마살을 구합니다.
-        삼합 기준으로 판단합니다.
-        """
-        if not kind.endswith("branch"):
-            return False
-
-        target = self._get_target(kind)
-
-        # 역마살 매핑 (삼합별 역마살 해당 지지)
-        post_horse_map = {
-            "사": ["해", "묘", "미"],  # 목국 삼합 → 사화 역마살
-            "신": ["인", "오", "술"],  # 화국 삼합 → 신금 역마살
-            "해": ["사", "유", "축"],  # 금국 삼합 → 해수 역마살
-            "인": ["신", "자", "진"],  # 수국 삼합 → 인목 역마살
-        }
-
-        # 역마살이 될 수 있는 지지인지 확인 (사, 신, 해, 인만 가능)
-        if target not in post_horse_map:
-            return False
-
-        # 모든 지지 수집 (자기 자신 제외)
-        all_branches = []
-        if kind != "year_branch":
-            all_branches.append(self.year_stem_branch[1])
-        if kind != "month_branch":
-            all_branches.append(self.month_stem_branch[1])
-        if kind != "day_branch":
-            all_branches.append(self.day_stem_branch[1])
-        if kind != "hour_branch":
-            all_branches.append(self.hour_stem_branch[1])
-
-        return any(branch in post_horse_map[target] for branch in all_branches)
-
-    @sin_sal("도화살")
-    def _get_peach_blossom(self, kind):
-        """
-        도화살을 구합니다.
-        삼합 기준으로 판단합니다.
-        """
-        if not kind.endswith("branch"):
-            return False
-
-        target = self._get_target(kind)
-
-        # 도화살 맵핑
-        peach_blossom_map = {
-            "자": ["해", "묘", "미"],
-            "묘": ["인", "오", "술"],
-            "오": ["사", "유", "축"],
-            "유": ["신", "자", "진"],
-        }
-
-        # 도화살이 될 수 있는 지지인지 확인 (자, 묘, 오, 유만 가능)
-        if target not in peach_blossom_map:
-            return False
-
-        # 모든 지지 수집 (자기 자신 제외)
-        all_branches = []
-        if kind != "year_branch":
-            all_branches.append(self.year_stem_branch[1])
-        if kind != "month_branch":
-            all_branches.append(self.month_stem_branch[1])
-        if kind != "day_branch":
-            all_branches.append(self.day_stem_branch[1])
-        if kind != "hour_branch":
-            all_branches.append(self.hour_stem_branch[1])
-
-        return any(branch in peach_blossom_map[target] for branch in all_branches)
-
-    @sin_sal("화개살")
-    def _get_fire_canopy(self, kind):
-        """
-        화개살을 구합니다.
-        삼합 기준으로 판단합니다.
-        """
-        if not kind.endswith("branch"):
-            return False
-
-        target = self._get_target(kind)
-
-        # 화개살 매핑 (삼합별 화개살 해당 지지)
-        fire_canopy_map = {
-            "미": ["해", "묘", "미"],  # 목국 삼합 → 미토 화개살
-            "술": ["인", "오", "술"],  # 화국 삼합 → 술토 화개살
-            "축": ["사", "유", "축"],  # 금국 삼합 → 축토 화개살
-            "진": ["신", "자", "진"],  # 수국 삼합 → 진토 화개살
-        }
-
-        # 화개살이 될 수 있는 지지인지 확인 (미, 술, 축, 진만 가능)
-        if target not in fire_canopy_map:
-            return False
-
-        # 모든 지지 수집 (자기 자신 제외)
-        all_branches = []
-        if kind != "year_branch":
-            all_branches.append(self.year_stem_branch[1])
-        if kind != "month_branch":
-            all_branches.append(self.month_stem_branch[1])
-        if kind != "day_branch":
-            all_branches.append(self.day_stem_branch[1])
-        if kind != "hour_branch":
-            all_branches.append(self.hour_stem_branch[1])
-
-        return any(branch in fire_canopy_map[target] for branch in all_branches)
-
-    @sin_sal("귀문관살")
-    def _get_ghost_gate(self, kind):
-        """
-        귀문관살을 구합니다.
-        """
-        if kind not in ["hour_branch", "month_branch"]:
-            return False
-
-        target = self._get_target(kind)
-        day_branch = self.day_stem_branch[1]
-
-        ghost_gate_map = {
-            "진": "해",
-            "해": "진",
-            "오": "축",
-            "축": "오",
-            "사": "술",
-            "술": "사",
-            "묘": "신",
-            "신": "묘",
-            "인": "미",
-            "미": "인",
-            "자": "유",
-            "유": "자",
-        }
-
-        if day_branch not in ghost_gate_map:
-            return False
-
-        return ghost_gate_map[target] == day_branch
-
-    @sin_sal("원진살")
-    def _get_hostile_opposition(self, kind):
-        """
-        원진살을 구합니다.
-        """
-        if not kind.endswith("branch"):
-            return False
-
-        target = self._get_target(kind)
-
-        hostile_opposition_map = {
-            "진": "해",
-            "해": "진",
-            "오": "축",
-            "축": "오",
-            "사": "술",
-            "술": "사",
-            "묘": "신",
-            "신": "묘",
-            "인": "유",
-            "유": "인",
-            "자": "미",
-            "미": "자",
-        }
-
-        if target not in hostile_opposition_map:
-            return False
-
-        # 모든 지지 수집 (자기 자신 제외)
-        all_branches = []
-        if kind != "year_branch":
-            all_branches.append(self.year_stem_branch[1])
-        if kind != "month_branch":
-            all_branches.append(self.month_stem_branch[1])
-        if kind != "day_branch":
-            all_branches.append(self.day_stem_branch[1])
-        if kind != "hour_branch":
-            all_branches.append(self.hour_stem_branch[1])
-
-        return any(hostile_opposition_map[target] == branch for branch in all_branches)
-
-    @sin_sal("양인살")
-    def _get_yang_blade(self, kind):
-        """
-        양인살을 구합니다.
-        """
-        if not kind.endswith("branch"):
-            return False
-
-        day_stem = self.day_stem_branch[0]
-        if stem_to_yin_yang[day_stem] != "양":
-            return False
-
-        target = self._get_target(kind)
-        yang_blade_map = {
-            "갑": "모",
-            "병": "오",
-            "무": "오",
-            "경": "유",
-            "임": "자",
-        }
-
-        return yang_blade_map[day_stem] == target
-
-    @sin_sal("괴강살")
-    def _get_strange_strong(self, kind):
-        """
-        괴강살을 구합니다.
-        """
-        strange_strong_map = {"임진", "경진", "경술", "무술"}
-        if self.day_stem_branch not in strange_strong_map:
-            return False
-        return getattr(self, f"{kind.split('_')[0]}_stem_branch") in strange_strong_map
-
-    @sin_sal("백호대살")
-    def _get_white_tiger_great(self, kind):
-        """
-        백호대살을 구합니다.
-        """
-        white_tiger_great_map = {"갑진", "을미", "병술", "정축", "무진", "임술", "계축"}
-        if self.day_stem_branch not in white_tiger_great_map:
-            return False
-        return getattr(self, f"{kind.split('_')[0]}_stem_branch") in white_tiger_great_map
-
-    @sin_sal("공망살")
-    def _get_empty_void(self, kind):
-        """
-        공망살을 구합니다.
-        60갑자를 10개씩 6그룹으로 나누어 각 그룹별 공망지가 결정됩니다.
-        """
-        if not kind.endswith("branch"):
-            return False
-
-        target = self._get_target(kind)
-        day_stem, day_branch = self.day_stem_branch
-
-        # 60갑자 그룹별 공망지 매핑
-        # 갑자~계유 = 술해 공망
-        group1 = [
-            ("갑", "자"),
-            ("을", "축"),
-            ("병", "인"),
-            ("정", "묘"),
-            ("무", "진"),
-            ("기", "사"),
-            ("경", "오"),
-            ("신", "미"),
-            ("임", "신"),
-            ("계", "유"),
-        ]
-
-        # 갑술~계미 = 신유 공망
-        group2 = [
-            ("갑", "술"),
-            ("을", "해"),
-            ("병", "자"),
-            ("정", "축"),
-            ("무", "인"),
-            ("기", "묘"),
-            ("경", "진"),
-            ("신", "사"),
-            ("임", "오"),
-            ("계", "미"),
-        ]
-
-        # 갑신~계사 = 오미 공망
-        group3 = [
-            ("갑", "신"),
-            ("을", "유"),
-            ("병", "술"),
-            ("정", "해"),
-            ("무", "자"),
-            ("기", "축"),
-            ("경", "인"),
-            ("신", "묘"),
-            ("임", "진"),
-            ("계", "사"),
-        ]
-
-        # 갑오~계묘 = 진사 공망
-        group4 = [
-            ("갑", "오"),
-            ("을", "미"),
-            ("병", "신"),
-            ("정", "유"),
-            ("무", "술"),
-            ("기", "해"),
-            ("경", "자"),
-            ("신", "축"),
-            ("임", "인"),
-            ("계", "묘"),
-        ]
-
-        # 갑진~계축 = 인묘 공망
-        group5 = [
-            ("갑", "진"),
-            ("을", "사"),
-            ("병", "오"),
-            ("정", "미"),
-            ("무", "신"),
-            ("기", "유"),
-            ("경", "술"),
-            ("신", "해"),
-            ("임", "자"),
-            ("계", "축"),
-        ]
-
-        # 갑인~계해 = 자축 공망
-        group6 = [
-            ("갑", "인"),
-            ("을", "묘"),
-            ("병", "진"),
-            ("정", "사"),
-            ("무", "오"),
-            ("기", "미"),
-            ("경", "신"),
-            ("신", "유"),
-            ("임", "술"),
-            ("계", "해"),
-        ]
-
-        day_pillar = (day_stem, day_branch)
-
-        if day_pillar in group1:
-            return target in ["술", "해"]
-        elif day_pillar in group2:
-            return target in ["신", "유"]
-        elif day_pillar in group3:
-            return target in ["오", "미"]
-        elif day_pillar in group4:
-            return target in ["진", "사"]
-        elif day_pillar in group5:
-            return target in ["인", "묘"]
-        elif day_pillar in group6:
-            return target in ["자", "축"]
-
-        return False
-
-    @sin_sal("천라지망살")
-    def _get_heaven_net_earth_snare(self, kind):
-        """
-        천라지망살을 구합니다.
-        """
-        if not kind.endswith("branch"):
-            return False
-
-        target = self._get_target(kind)
-
-        heaven_net_earth_snare_map = {
-            "술": "해",
-            "해": "술",
-            "진": "사",
-            "사": "진",
-        }
-
-        if target not in heaven_net_earth_snare_map:
-            return False
-
-        # 모든 지지 수집 (자기 자신 제외)
-        all_branches = []
-        if kind != "year_branch":
-            all_branches.append(self.year_stem_branch[1])
-        if kind != "month_branch":
-            all_branches.append(self.month_stem_branch[1])
-        if kind != "day_branch":
-            all_branches.append(self.day_stem_branch[1])
-        if kind != "hour_branch":
-            all_branches.append(self.hour_stem_branch[1])
-
-        return any(heaven_net_earth_snare_map[target] == branch for branch in all_branches)
-
-    @sin_sal("현침살")
-    def _get_hanging_needle(self, kind):
-        """
-        현침살을 구합니다.
-        """
-
-        target = self._get_target(kind)
-        hanging_needle_map = {"갑", "신", "신", "묘", "오", "미"}  # stem, branch 모두 신 존재
-
-        return target in hanging_needle_map
\ No newline at end of file
+        return sin_sal_names(self.sin_sal_masks[sin_sal_kind_codes[kind]])
+
+
+class ChartCache:
+    """
+    사주 응답을 `Saju.response_key()`로 캐시하는 스레드 안전 LRU
+
+    - maxsize를 넘으면 가장 오래 사용하지 않은 항목부터 제거합니다. (0이면 저장하지 않음)
+    - ttl(초)이 0보다 크면 저장 후 ttl이 지난 항목은 미스로 처리합니다.
+    """
+
+    def __init__(self, maxsize=SAJU_CHART_CACHE_SIZE, ttl=SAJU_CHART_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """캐시된 값을 반환합니다. 없거나 만료되었으면 None을 반환합니다."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None:
+                value, expires_at = item
+                if not expires_at or time.monotonic() < expires_at:
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        if self.maxsize <= 0:
+            return
+        expires_at = time.monotonic() + self.ttl if self.ttl > 0 else 0
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """캐시 크기와 적중/미스 횟수를 반환합니다."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+
+# 사주 응답(직렬화된 JSON 바이트) 캐시
+chart_cache = ChartCache()
@@ -1,32 +1,314 @@
-from fastapi import APIRouter
+import hashlib
+import os
+from datetime import datetime
+from typing import Annotated, List, Literal, Optional
+from urllib.parse import parse_qsl, urlencode
 
-from api.v1.saju import Saju
-from schemas.saju import SajuRequest, SajuResponse
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi.responses import RedirectResponse, Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+
+from api.v1.saju import SAJU_DEFAULT_FIELDS, SAJU_RESPONSE_FIELDS, Saju, UnsupportedYearError, chart_cache
+from api.v1.solar_terms import ensure_solar_term_index, solar_term_dataset_version
+from schemas.saju import (
+    SajuAnnualLuckRequest,
+    SajuBatchResponse,
+    SajuDailyPillarRequest,
+    SajuMonthlyLuckRequest,
+    SajuRequest,
+    SajuResponse,
+)
 
 
 router = APIRouter(prefix="/saju", tags=["saju"])
 
+# 일괄 계산 요청 1회당 최대 건수
+SAJU_BATCH_MAX_ITEMS = int(os.getenv("SAJU_BATCH_MAX_ITEMS", "10000"))
+
+# GET 사주 응답의 HTTP 캐시 수명 (초): 브라우저(max-age) / CDN(s-maxage)
+SAJU_HTTP_MAX_AGE = int(os.getenv("SAJU_HTTP_MAX_AGE", "86400"))
+SAJU_HTTP_S_MAXAGE = int(os.getenv("SAJU_HTTP_S_MAXAGE", "2592000"))
+SAJU_CACHE_CONTROL = f"public, max-age={SAJU_HTTP_MAX_AGE}, s-maxage={SAJU_HTTP_S_MAXAGE}"
+# 절기 인덱스 없이 천문 계산으로 대체한 응답은 캐시하지 않습니다. (인덱스 로드 후 결과가 달라질 수 있음)
+SAJU_FALLBACK_CACHE_CONTROL = "no-store"
+# 응답 형식/계산 규칙이 바뀌면 올립니다. (ETag가 바뀌어 이전 캐시를 재사용하지 않음)
+SAJU_RESPONSE_VERSION = "1"
+
+
+def _build_saju(payload: SajuRequest) -> Saju:
+    try:
+        return Saju(
+            birth=payload.birth,
+            gender=payload.gender,
+            birth_longitude=payload.birth_longitude,
+        )
+    except Exception as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
 
-@router.post("/", response_model=SajuResponse)
-def calculate_saju(payload: SajuRequest) -> SajuResponse:
+def _ndjson(items):
+    """항목을 한 줄씩 JSON으로 직렬화해 스트리밍합니다. (목록을 메모리에 만들지 않음)"""
+    for item in items:
+        yield orjson.dumps(item, option=orjson.OPT_APPEND_NEWLINE)
+
+
+def saju_response_json(saju: Saju, fields=SAJU_DEFAULT_FIELDS) -> bytes:
     """
-    사주 계산 API
+    계산된 사주를 `SajuResponse` 형태의 JSON bytes로 바로 직렬화합니다.
+
+    결과는 `SajuResponse(...).model_dump_json(exclude_unset=True)`과 같지만, 이미 계산된 값을 pydantic 모델로 다시 검증하지 않습니다.
+    (`SajuResponse`는 OpenAPI 스키마 용도로만 사용)
+    """
+    return orjson.dumps(saju.response_payload(fields))
 
-    요청으로 받은 출생 시각/성별/경도를 기반으로 사주 전체 정보를 계산합니다.
+
+def _parse_fields(fields):
+    """
+    `fields` 쿼리 파라미터(쉼표 구분)를 필드 그룹 집합으로 바꿉니다. (생략 시 기본 응답)
+
+    Raises:
+        HTTPException: 알 수 없는 필드가 포함된 경우 (422)
+    """
+    if fields is None:
+        return SAJU_DEFAULT_FIELDS
+    selected = frozenset(field.strip() for field in fields.split(",") if field.strip())
+    unknown = selected.difference(SAJU_RESPONSE_FIELDS)
+    if unknown or not selected:
+        raise HTTPException(
+            status_code=422,
+            detail=f"fields는 {', '.join(SAJU_RESPONSE_FIELDS)} 중에서 쉼표로 구분해 지정하세요.",
+        )
+    return selected
+
+
+# 단건/일괄 계산 API의 fields 쿼리 파라미터
+FieldsQuery = Annotated[
+    Optional[str],
+    Query(
+        description=f"응답에 포함할 필드 (쉼표 구분: {', '.join(SAJU_RESPONSE_FIELDS)}). "
+        "생략하면 pillars를 제외한 전체를 반환합니다.",
+        examples=["spti,pillars,five_elements,major_luck"],
+    ),
+]
+
+
+def _render_saju(payload: SajuRequest, fields=SAJU_DEFAULT_FIELDS):
+    """
+    요청 1건의 사주 응답 JSON을 만듭니다.
+
+    같은 사주(네 기둥, 대운 방향, 대운 시작 나이)와 필드 조합의 응답은 직렬화된 JSON으로 캐시해 재사용합니다.
+
+    Returns:
+        tuple: (응답 JSON bytes, 캐시 적중 여부)
     """
     saju = Saju(
         birth=payload.birth,
         gender=payload.gender,
         birth_longitude=payload.birth_longitude,
     )
+    key = saju.response_key(fields)
+    body = chart_cache.get(key)
+    if body is not None:
+        return body, True
+
+    body = saju_response_json(saju, fields)
+    chart_cache.put(key, body)
+    return body, False
+
+
+def _render_saju_or_422(payload: SajuRequest, fields):
+    # 지원하지 않는 연도는 스트리밍 API(`_build_saju`)와 같이 422로 응답합니다.
+    try:
+        return _render_saju(payload, fields)
+    except UnsupportedYearError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+
+@router.post("/", response_model=SajuResponse, response_model_exclude_unset=True)
+async def calculate_saju(payload: SajuRequest, fields: FieldsQuery = None) -> Response:
+    """
+    사주 계산 API
+
+    요청으로 받은 출생 시각/성별/경도를 기반으로 사주 정보를 계산합니다.
+    - `fields`로 필요한 항목만 요청하면 나머지 항목은 계산하지 않고 응답에서도 빠집니다. (예: `?fields=spti,pillars`)
+    - 절기는 인메모리 인덱스(없으면 비동기 엔진으로 한 번 로드)에서 구하므로, 계산은 스레드풀 없이 바로 수행합니다.
+    """
+    selected = _parse_fields(fields)
+    await ensure_solar_term_index()
+    body, hit = _render_saju_or_422(payload, selected)
+    return Response(content=body, media_type="application/json", headers={"X-Saju-Cache": "HIT" if hit else "MISS"})
+
+
+def _canonical_params(payload: SajuRequest, fields):
+    """
+    GET 사주 요청의 정규화된 쿼리 파라미터
+
+    - 결과가 같은 입력은 같은 URL이 되도록 경도는 계산에 쓰는 정수로 반올림하고, 파라미터 순서를 고정합니다.
+    - fields는 기본 응답이면 생략하고, 아니면 응답 키 순서로 정렬합니다.
+    """
+    params = [
+        ("birth", payload.birth.isoformat()),
+        ("gender", payload.gender),
+        ("birth_longitude", str(round(payload.birth_longitude))),
+    ]
+    if fields != SAJU_DEFAULT_FIELDS:
+        params.append(("fields", ",".join(field for field in SAJU_RESPONSE_FIELDS if field in fields)))
+    return params
+
+
+def _etag(params, dataset_version):
+    """
+    정규화된 입력 + 응답 버전 + 절기 데이터 버전으로 만든 약한 ETag
+
+    응답 압축(`CompressionMiddleware`) 여부에 따라 바이트가 달라지므로 강한 ETag 대신 약한 ETag를 사용합니다.
+    (200과 304가 인코딩과 관계없이 같은 ETag를 갖습니다.)
+    """
+    source = f"{SAJU_RESPONSE_VERSION}|{dataset_version}|{urlencode(params)}"
+    return 'W/"' + hashlib.sha256(source.encode()).hexdigest()[:32] + '"'
+
+
+def _etag_matches(if_none_match, etag):
+    # If-None-Match는 약한 비교(W/ 접두사 무시)를 사용합니다.
+    if not if_none_match:
+        return False
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag == "*" or tag.removeprefix("W/") == etag.removeprefix("W/") for tag in candidates)
+
+
+@router.get("/", response_model=SajuResponse, response_model_exclude_unset=True)
+async def get_saju(
+    request: Request,
+    birth: Annotated[datetime, Query(description="출생 시각 (타임존 포함)")],
+    gender: Annotated[Literal["male", "female"], Query(description="성별")],
+    birth_longitude: Annotated[float, Query(description="출생지 경도 (도 단위)")],
+    fields: FieldsQuery = None,
+) -> Response:
+    """
+    사주 계산 API (GET, HTTP 캐시 가능)
+
+    결과는 입력(출생 시각/성별/경도)과 절기 데이터만으로 결정되므로 CDN/브라우저가 캐시할 수 있도록 반환합니다.
+    - 쿼리가 정규화된 형태(파라미터 순서, 정수 경도, fields 순서)가 아니면 정규화된 URL로 308 리다이렉트합니다.
+    - `ETag`(입력 + 절기 데이터 버전)와 `Cache-Control`(max-age, s-maxage)을 붙이고, `If-None-Match`가 일치하면 304를 반환합니다.
+    - 절기 인덱스가 로드되지 않아 천문 계산으로 대체한 응답은 ETag 없이 `Cache-Control: no-store`로 반환합니다.
+    """
+    payload = SajuRequest(birth=birth, gender=gender, birth_longitude=birth_longitude)
+    selected = _parse_fields(fields)
+    params = _canonical_params(payload, selected)
+    if parse_qsl(request.url.query, keep_blank_values=True) != params:
+        url = f"{request.url.path}?{urlencode(params, safe=':,')}"
+        return RedirectResponse(url, status_code=308, headers={"Cache-Control": SAJU_CACHE_CONTROL})
+
+    await ensure_solar_term_index()
+    dataset_version = solar_term_dataset_version()
+    if dataset_version is None:
+        headers = {"Cache-Control": SAJU_FALLBACK_CACHE_CONTROL}
+    else:
+        headers = {"ETag": _etag(params, dataset_version), "Cache-Control": SAJU_CACHE_CONTROL}
+        if _etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+
+    body, hit = _render_saju_or_422(payload, selected)
+    headers["X-Saju-Cache"] = "HIT" if hit else "MISS"
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@router.post("/batch", response_model=SajuBatchResponse)
+async def calculate_saju_batch(payloads: List[SajuRequest], fields: FieldsQuery = None) -> Response:
+    """
+    일괄 사주 계산 API
+
+    여러 건의 요청을 한 번에 계산해 요청 순서대로 반환합니다.
+    - 계산에 실패한 항목은 `error`에 사유를 담고, 나머지 항목은 정상적으로 반환합니다.
+    - 같은 입력(출생 시각/UTC·DST 오프셋/성별/경도)은 한 번만 계산합니다.
+    - `fields`는 단건 API와 같으며 모든 항목에 적용됩니다.
+    """
+    selected = _parse_fields(fields)
+    if len(payloads) > SAJU_BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"한 번에 최대 {SAJU_BATCH_MAX_ITEMS}건까지 계산할 수 있습니다.",
+        )
+
+    await ensure_solar_term_index()
+    # 건수가 많으면 계산 시간이 길어지므로 이벤트 루프를 막지 않도록 스레드풀에서 계산합니다.
+    body = await run_in_threadpool(_render_batch, payloads, selected)
+    return Response(content=body, media_type="application/json")
+
+
+def _render_batch(payloads, fields=SAJU_DEFAULT_FIELDS):
+    rendered = {}
+    parts = []
+    for index, payload in enumerate(payloads):
+        birth = payload.birth
+        key = (birth, birth.utcoffset(), birth.dst(), payload.gender, round(payload.birth_longitude))
+        item = rendered.get(key)
+        if item is None:
+            try:
+                item = b'"result":' + _render_saju(payload, fields)[0] + b',"error":null'
+            except Exception as e:
+                item = b'"result":null,"error":' + orjson.dumps(str(e))
+            rendered[key] = item
+        parts.append(b'{"index":%d,%s}' % (index, item))
+
+    return b'{"items":[' + b",".join(parts) + b"]}"
+
+
+@router.get("/annual-luck")
+async def stream_annual_luck(payload: Annotated[SajuAnnualLuckRequest, Query()]) -> StreamingResponse:
+    """
+    연운 조회 API (NDJSON 스트리밍)
+
+    start_year~end_year 연운을 한 줄에 한 연도씩 반환합니다.
+    """
+    await ensure_solar_term_index()
+    saju = _build_saju(payload)
+    return StreamingResponse(
+        _ndjson(saju.iter_annual_luck(payload.start_year, payload.end_year)), media_type="application/x-ndjson"
+    )
+
+
+@router.post("/annual-luck")
+async def stream_annual_luck_post(payload: SajuAnnualLuckRequest) -> StreamingResponse:
+    """연운 조회 API (POST, NDJSON 스트리밍)"""
+    return await stream_annual_luck(payload)
+
+
+@router.get("/monthly-luck")
+async def stream_monthly_luck(payload: Annotated[SajuMonthlyLuckRequest, Query()]) -> StreamingResponse:
+    """
+    월운 조회 API (NDJSON 스트리밍)
 
-    return SajuResponse(
-        spti=saju.spti,
-        stem_branch=saju.stem_branch,
-        five_elements=saju.five_elements,
-        yin_yang=saju.yin_yang,
-        major_luck_start_age=saju.major_luck_start_age,
-        major_luck_set=saju.major_luck_set,
+    year~end_year 월운을 한 줄에 한 달씩 절기 시작/종료 시각과 함께 반환합니다.
+    """
+    await ensure_solar_term_index()
+    saju = _build_saju(payload)
+    return StreamingResponse(
+        _ndjson(saju.iter_monthly_luck(payload.year, payload.end_year)), media_type="application/x-ndjson"
+    )
+
+
+@router.post("/monthly-luck")
+async def stream_monthly_luck_post(payload: SajuMonthlyLuckRequest) -> StreamingResponse:
+    """월운 조회 API (POST, NDJSON 스트리밍)"""
+    return await stream_monthly_luck(payload)
+
+
+@router.get("/daily-pillars")
+async def stream_daily_pillars(payload: Annotated[SajuDailyPillarRequest, Query()]) -> StreamingResponse:
+    """
+    일진 조회 API (NDJSON 스트리밍)
+
+    start_date~end_date 일진을 한 줄에 하루씩 생성하면서 반환하므로, 긴 기간도 메모리에 모아두지 않습니다.
+    """
+    await ensure_solar_term_index()
+    saju = _build_saju(payload)
+    return StreamingResponse(
+        _ndjson(saju.iter_daily_pillars(payload.start_date, payload.end_date)), media_type="application/x-ndjson"
     )
 
 
+@router.post("/daily-pillars")
+async def stream_daily_pillars_post(payload: SajuDailyPillarRequest) -> StreamingResponse:
+    """일진 조회 API (POST, NDJSON 스트리밍)"""
+    return await stream_daily_pillars(payload)
@@ -0,0 +1,139 @@
+"""
+NumPy 벡터화 사주 기둥 계산기 (일괄 계산 / 오프라인 분석용)
+
+`Saju`의 년주/월주/일주/시주, 대운 방향, 대운 시작 나이를 배열 단위로 한 번에 계산합니다.
+정수 나머지 연산과 절기 시각 배열에 대한 `np.searchsorted`만 사용하며, 결과는 `Saju`와 같습니다.
+(`python -m scripts.benchmark_saju_vectorized`로 `Saju`와 교차 검증)
+
+numpy가 필요합니다. API 경로에서는 import하지 않으므로 requirements.txt에는 포함하지 않았습니다.
+"""
+
+import datetime
+from functools import lru_cache
+from typing import NamedTuple
+
+import numpy as np
+
+from api.v1.saju import first_month_stem_table, hour_branch_table, ja_stem_table
+from api.v1.solar_terms import get_ipchun_for_year, jeolgi_table
+
+_DAY_BASE = (datetime.date(1924, 2, 15) - datetime.date(1970, 1, 1)).days  # 갑자일
+_YEAR_BASE = 1924  # 갑자년
+_MIN_YEAR = 1000
+_MAX_YEAR = 2999
+
+_first_month_stem = np.array(first_month_stem_table, dtype=np.int64)
+_ja_stem = np.array(ja_stem_table, dtype=np.int64)
+_hour_branch = np.array(hour_branch_table, dtype=np.int64)
+
+
+class PillarArrays(NamedTuple):
+    """
+    벡터화 계산 결과 (모두 int8 배열)
+
+    - year/month/day/hour: 60갑자 코드 (갑자=0 ~ 계해=59)
+    - is_forward: 대운 순행이면 1, 역행이면 0
+    - major_luck_start_age: 대운 시작 나이
+    """
+
+    year: np.ndarray
+    month: np.ndarray
+    day: np.ndarray
+    hour: np.ndarray
+    is_forward: np.ndarray
+    major_luck_start_age: np.ndarray
+
+
+class _TermArrays(NamedTuple):
+    first_year: int
+    jeolgi_epochs: np.ndarray
+    jeolgi_branches: np.ndarray
+    ipchun_epochs: np.ndarray
+
+
+@lru_cache(maxsize=16)
+def _term_arrays(first_year, last_year):
+    """first_year~last_year 구간의 절기 시각/월지 배열과 연도별 입춘 시각 배열"""
+    epochs, codes = jeolgi_table(first_year, last_year)
+    ipchun = [get_ipchun_for_year(year).at.timestamp() for year in range(first_year, last_year + 1)]
+    return _TermArrays(
+        first_year=first_year,
+        jeolgi_epochs=np.array(epochs, dtype=np.float64),
+        # 절기 코드 0(소한)=축월, 2(입춘)=인월, ... 22(대설)=자월
+        jeolgi_branches=(np.array(codes, dtype=np.int64) // 2 + 1) % 12,
+        ipchun_epochs=np.array(ipchun, dtype=np.float64),
+    )
+
+
+def _pillar_of(stem, branch):
+    return (6 * stem - 5 * branch) % 60
+
+
+def compute_pillars(epochs, utc_offsets, dst_offsets, longitudes, is_male):
+    """
+    출생 정보 배열로 사주 기둥을 계산합니다.
+
+    Args:
+        epochs: 출생 시각 (UTC epoch 초)
+        utc_offsets: 출생 시각의 UTC 오프셋 (초, DST 포함. `birth.utcoffset()`)
+        dst_offsets: 출생 시각의 DST 오프셋 (초, 없으면 0. `birth.dst()`)
+        longitudes: 출생지 경도 (도)
+        is_male: 남성이면 True
+
+    Returns:
+        PillarArrays: 입력 순서와 같은 int8 배열들
+
+    Raises:
+        ValueError: 지원하지 않는 연도(1000~2999년 밖)가 포함된 경우
+    """
+    epochs = np.asarray(epochs, dtype=np.float64)
+    utc_offsets = np.asarray(utc_offsets, dtype=np.float64)
+    dst_offsets = np.asarray(dst_offsets, dtype=np.float64)
+    is_male = np.asarray(is_male, dtype=bool)
+
+    # 출생지 벽시계 시각 (년주의 연도, 대운 시작 나이의 생일 날짜에 사용)
+    wall = epochs + utc_offsets
+    wall_days = np.floor_divide(wall, 86400)
+    wall_years = wall_days.astype("datetime64[D]").astype("datetime64[Y]").astype(np.int64) + 1970
+    if len(epochs) and (wall_years.min() < _MIN_YEAR or wall_years.max() > _MAX_YEAR):
+        raise ValueError("지원하지 않는 연도입니다.")
+    first_year = int(wall_years.min(initial=_YEAR_BASE)) - 1
+    terms = _term_arrays(first_year, int(wall_years.max(initial=_YEAR_BASE)) + 1)
+
+    # 년주: 해당 연도 입춘 이전(포함)이면 전년도
+    ipchun = terms.ipchun_epochs[wall_years - terms.first_year]
+    year_pillar = (wall_years - (ipchun >= epochs) - _YEAR_BASE) % 60
+    year_stem = year_pillar % 10
+
+    # 월주: 출생 이전(미포함) 가장 가까운 절기의 월지
+    previous = np.searchsorted(terms.jeolgi_epochs, epochs, side="left") - 1
+    month_branch = terms.jeolgi_branches[previous]
+    month_stem = (_first_month_stem[year_stem] + (month_branch - 2) % 12) % 10
+    month_pillar = _pillar_of(month_stem, month_branch)
+
+    # 일주/시주: 경도 보정한 진태양시 기준, 23시는 다음날 자시
+    standard_longitudes = (utc_offsets - dst_offsets) / 3600 * 15
+    solar = wall - dst_offsets + (np.round(np.asarray(longitudes, dtype=np.float64)) - standard_longitudes) * 240
+    hours = np.floor_divide(solar, 3600).astype(np.int64) % 24
+    day_pillar = (np.floor_divide(solar, 86400).astype(np.int64) + (hours == 23) - _DAY_BASE) % 60
+    hour_branch = _hour_branch[hours]
+    hour_pillar = _pillar_of((_ja_stem[day_pillar % 10] + hour_branch) % 10, hour_branch)
+
+    # 대운 방향: 양간년 남성, 음간년 여성은 순행
+    is_forward = (year_stem % 2 == 0) == is_male
+
+    # 대운 시작 나이: 순행은 다음 절기까지, 역행은 이전 절기부터의 일수 (절기 날짜는 UTC 기준)
+    following = np.searchsorted(terms.jeolgi_epochs, epochs, side="right")
+    term_days = np.floor_divide(terms.jeolgi_epochs[np.where(is_forward, following, previous)], 86400)
+    days_diff = np.where(is_forward, term_days - wall_days, wall_days - term_days).astype(np.int64)
+    # 3일 = 1년, 나머지 일수 x 4개월이 6개월 이상이면 올림
+    start_age = days_diff // 3 + (days_diff % 3 == 2)
+
+    return PillarArrays(
+        year=year_pillar.astype(np.int8),
+        month=month_pillar.astype(np.int8),
+        day=day_pillar.astype(np.int8),
+        hour=hour_pillar.astype(np.int8),
+        is_forward=is_forward.astype(np.int8),
+        major_luck_start_age=start_age.astype(np.int8),
+    )
@@ -0,0 +1,295 @@
+"""
+천문 계산 기반 절기 시각 계산기 (DB 불필요)
+
+태양의 시황경(apparent solar longitude)이 15° 배수를 지나는 순간을 구합니다.
+
+- 지구 일심 황경/거리: VSOP87 축약 급수 (Meeus, Astronomical Algorithms 32장 / 부록 III)
+- 장동(Δψ): Meeus 22장 저정밀 식, 광행차: -20.4898" / R
+- ΔT(TT-UT): Espenak & Meeus 다항식
+- 교차 시각: 뉴턴 반복 (태양의 평균 각속도로 보정량 계산)
+
+정밀도는 1900~2100년 구간에서 천문연 발표값 대비 대략 1분 이내입니다.
+"""
+
+import datetime
+import math
+from functools import lru_cache
+
+# (A, B, C): A * cos(B + C * tau), 단위 1e-8 rad
+_L0 = (
+    (175347046, 0, 0),
+    (3341656, 4.6692568, 6283.07585),
+    (34894, 4.6261, 12566.1517),
+    (3497, 2.7441, 5753.3849),
+    (3418, 2.8289, 3.5231),
+    (3136, 3.6277, 77713.7715),
+    (2676, 4.4181, 7860.4194),
+    (2343, 6.1352, 3930.2097),
+    (1324, 0.7425, 11506.7698),
+    (1273, 2.0371, 529.691),
+    (1199, 1.1096, 1577.3435),
+    (990, 5.233, 5884.927),
+    (902, 2.045, 26.298),
+    (857, 3.508, 398.149),
+    (780, 1.179, 5223.694),
+    (753, 2.533, 5507.553),
+    (505, 4.583, 18849.228),
+    (492, 4.205, 775.523),
+    (357, 2.92, 0.067),
+    (317, 5.849, 11790.629),
+    (284, 1.899, 796.298),
+    (271, 0.315, 10977.079),
+    (243, 0.345, 5486.778),
+    (206, 4.806, 2544.314),
+    (205, 1.869, 5573.143),
+    (202, 2.458, 6069.777),
+    (156, 0.833, 213.299),
+    (132, 3.411, 2942.463),
+    (126, 1.083, 20.775),
+    (115, 0.645, 0.98),
+    (103, 0.636, 4694.003),
+    (102, 0.976, 15720.839),
+    (102, 4.267, 7.114),
+    (99, 6.21, 2146.17),
+    (98, 0.68, 155.42),
+    (86, 5.98, 161000.69),
+    (85, 1.3, 6275.96),
+    (85, 3.67, 71430.7),
+    (80, 1.81, 17260.15),
+    (79, 3.04, 12036.46),
+    (75, 1.76, 5088.63),
+    (74, 3.5, 3154.69),
+    (74, 4.68, 801.82),
+    (70, 0.83, 9437.76),
+    (62, 3.98, 8827.39),
+    (61, 1.82, 7084.9),
+    (57, 2.78, 6286.6),
+    (56, 4.39, 14143.5),
+    (56, 3.47, 6279.55),
+    (52, 0.19, 12139.55),
+    (52, 1.33, 1748.02),
+    (51, 0.28, 5856.48),
+    (49, 0.49, 1194.45),
+    (41, 5.37, 8429.24),
+    (41, 2.4, 19651.05),
+    (39, 6.17, 10447.39),
+    (37, 6.04, 10213.29),
+    (37, 2.57, 1059.38),
+    (36, 1.71, 2352.87),
+    (36, 1.78, 6812.77),
+    (33, 0.59, 17789.85),
+    (30, 0.44, 83996.85),
+    (30, 2.74, 1349.87),
+    (25, 3.16, 4690.48),
+)
+_L1 = (
+    (628331966747, 0, 0),
+    (206059, 2.678235, 6283.07585),
+    (4303, 2.6351, 12566.1517),
+    (425, 1.59, 3.523),
+    (119, 5.796, 26.298),
+    (109, 2.966, 1577.344),
+    (93, 2.59, 18849.23),
+    (72, 1.14, 529.69),
+    (68, 1.87, 398.15),
+    (67, 4.41, 5507.55),
+    (59, 2.89, 5223.69),
+    (56, 2.17, 155.42),
+    (45, 0.4, 796.3),
+    (36, 0.47, 775.52),
+    (29, 2.65, 7.11),
+    (21, 5.34, 0.98),
+    (19, 1.85, 5486.78),
+    (19, 4.97, 213.3),
+    (17, 2.99, 6275.96),
+    (16, 0.03, 2544.31),
+    (16, 1.43, 2146.17),
+    (15, 1.21, 10977.08),
+    (12, 2.83, 1748.02),
+    (12, 3.26, 5088.63),
+    (12, 5.27, 1194.45),
+    (12, 2.08, 4694.0),
+    (11, 0.77, 553.57),
+    (10, 1.3, 6286.6),
+    (10, 4.24, 1349.87),
+    (9, 2.7, 242.73),
+    (9, 5.64, 951.72),
+    (8, 5.3, 2352.87),
+    (6, 2.65, 9437.76),
+    (6, 4.67, 4690.48),
+)
+_L2 = (
+    (52919, 0, 0),
+    (8720, 1.0721, 6283.0758),
+    (309, 0.867, 12566.152),
+    (27, 0.05, 3.52),
+    (16, 5.19, 26.3),
+    (16, 3.68, 155.42),
+    (10, 0.76, 18849.23),
+    (9, 2.06, 77713.77),
+    (7, 0.83, 775.52),
+    (5, 4.66, 1577.34),
+    (4, 1.03, 7.11),
+    (4, 3.44, 5573.14),
+    (3, 5.14, 796.3),
+    (3, 6.05, 5507.55),
+    (3, 1.19, 242.73),
+    (3, 6.12, 529.69),
+    (3, 0.31, 398.15),
+    (3, 2.28, 553.57),
+    (2, 4.38, 5223.69),
+    (2, 3.75, 0.98),
+)
+_L3 = (
+    (289, 5.844, 6283.076),
+    (35, 0, 0),
+    (17, 5.49, 12566.15),
+    (3, 5.2, 155.42),
+    (1, 4.72, 3.52),
+    (1, 5.3, 18849.23),
+    (1, 5.97, 242.73),
+)
+_L4 = (
+    (114, 3.142, 0),
+    (8, 4.13, 6283.08),
+    (1, 3.84, 12566.15),
+)
+_L5 = ((1, 3.14, 0),)
+_R0 = (
+    (100013989, 0, 0),
+    (1670700, 3.0984635, 6283.07585),
+    (13956, 3.05525, 12566.1517),
+    (3084, 5.1985, 77713.7715),
+    (1628, 1.1739, 5753.3849),
+    (1576, 2.8469, 7860.4194),
+)
+_R1 = (
+    (103019, 1.10749, 6283.07585),
+    (1721, 1.0644, 12566.1517),
+)
+
+_L_SERIES = (_L0, _L1, _L2, _L3, _L4, _L5)
+_R_SERIES = (_R0, _R1)
+
+_J2000 = 2451545.0
+_UNIX_EPOCH_JD = 2440587.5
+_TROPICAL_YEAR_DAYS = 365.242189
+_ARCSEC = math.pi / (180 * 3600)
+
+
+def delta_t(year):
+    """ΔT(TT - UT, 초)를 근사합니다. (Espenak & Meeus, 소수 연도 입력)"""
+    y = year
+    if y < 1800 or y >= 2150:
+        u = (y - 1820) / 100
+        return -20 + 32 * u * u
+    if y < 1860:
+        t = y - 1800
+        return (
+            13.72
+            - 0.332447 * t
+            + 0.0068612 * t**2
+            + 0.0041116 * t**3
+            - 0.00037436 * t**4
+            + 0.0000121272 * t**5
+            - 0.0000001699 * t**6
+            + 0.000000000875 * t**7
+        )
+    if y < 1900:
+        t = y - 1860
+        return 7.62 + 0.5737 * t - 0.251754 * t**2 + 0.01680668 * t**3 - 0.0004473624 * t**4 + t**5 / 233174
+    if y < 1920:
+        t = y - 1900
+        return -2.79 + 1.494119 * t - 0.0598939 * t**2 + 0.0061966 * t**3 - 0.000197 * t**4
+    if y < 1941:
+        t = y - 1920
+        return 21.20 + 0.84493 * t - 0.0761 * t**2 + 0.0020936 * t**3
+    if y < 1961:
+        t = y - 1950
+        return 29.07 + 0.407 * t - t**2 / 233 + t**3 / 2547
+    if y < 1986:
+        t = y - 1975
+        return 45.45 + 1.067 * t - t**2 / 260 - t**3 / 718
+    if y < 2005:
+        t = y - 2000
+        return 63.86 + 0.3345 * t - 0.060374 * t**2 + 0.0017275 * t**3 + 0.000651814 * t**4 + 0.00002373599 * t**5
+    if y < 2050:
+        t = y - 2000
+        return 62.92 + 0.32217 * t + 0.005589 * t**2
+    u = (y - 1820) / 100
+    return -20 + 32 * u * u - 0.5628 * (2150 - y)
+
+
+def _series(series, tau):
+    total = 0.0
+    power = 1.0
+    for terms in series:
+        total += power * sum(a * math.cos(b + c * tau) for a, b, c in terms)
+        power *= tau
+    return total * 1e-8
+
+
+def apparent_solar_longitude(jde):
+    """역학시(JDE) 기준 태양의 시황경(도, 0~360)을 반환합니다."""
+    tau = (jde - _J2000) / 365250
+    t = tau * 10
+
+    # 지구 일심 황경 → 태양 지심 기하 황경 (+180°), FK5 보정
+    sun = _series(_L_SERIES, tau) + math.pi
+    sun += -0.09033 * _ARCSEC
+    radius = _series(_R_SERIES, tau)
+
+    # 장동 (Meeus 22장 저정밀 식)
+    omega = math.radians(125.04452 - 1934.136261 * t)
+    mean_sun = math.radians(280.4665 + 36000.7698 * t)
+    mean_moon = math.radians(218.3165 + 481267.8813 * t)
+    nutation = (
+        -17.20 * math.sin(omega)
+        - 1.32 * math.sin(2 * mean_sun)
+        - 0.23 * math.sin(2 * mean_moon)
+        + 0.21 * math.sin(2 * omega)
+    )
+
+    # 광행차
+    aberration = -20.4898 / radius
+
+    longitude = math.degrees(sun) + (nutation + aberration) / 3600
+    return longitude % 360
+
+
+def _jde_from_epoch(epoch):
+    jd = epoch / 86400 + _UNIX_EPOCH_JD
+    year = 2000 + (jd - _J2000) / 365.25
+    return jd + delta_t(year) / 86400
+
+
+def solar_longitude_crossing(target_longitude, guess_epoch):
+    """`guess_epoch` 부근에서 시황경이 `target_longitude`(도)가 되는 시각(UTC epoch 초)을 구합니다."""
+    epoch = guess_epoch
+    for _ in range(20):
+        diff = (target_longitude - apparent_solar_longitude(_jde_from_epoch(epoch)) + 180) % 360 - 180
+        step = diff / 360 * _TROPICAL_YEAR_DAYS * 86400
+        epoch += step
+        if abs(step) < 0.1:
+            break
+    return epoch
+
+
+@lru_cache(maxsize=512)
+def solar_term_epochs(year):
+    """
+    해당 연도 24절기의 시각(UTC epoch 초)을 소한(코드 0)부터 동지(코드 23)까지 순서대로 반환합니다.
+
+    코드 k의 황경은 (285 + 15k) mod 360 입니다. 연도별로 LRU 캐시됩니다.
+    """
+    start = (datetime.datetime(year, 1, 1, tzinfo=datetime.timezone.utc) - datetime.datetime(
+        1970, 1, 1, tzinfo=datetime.timezone.utc
+    )).total_seconds()
+    start_longitude = apparent_solar_longitude(_jde_from_epoch(start))
+
+    epochs = []
+    for code in range(24):
+        target = (285 + 15 * code) % 360
+        guess = start + (target - start_longitude) % 360 / 360 * _TROPICAL_YEAR_DAYS * 86400
+        epochs.append(round(solar_longitude_crossing(target, guess)))
+    return tuple(epochs)
@@ -0,0 +1,517 @@
+import asyncio
+import bisect
+import datetime
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+from array import array
+from typing import NamedTuple
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from api.v1.solar_longitude import solar_term_epochs
+from db.database import get_session_factory, get_sync_engine
+from models.solar_term import SolarTerm, SolarTermKindChoices, SolarTermNameChoices
+
+KST = ZoneInfo("Asia/Seoul")
+UTC = datetime.timezone.utc
+
+# 24절기 코드: 황경 순서대로 소한(0)부터 동지(23)까지, 짝수는 절기 / 홀수는 중기
+solar_term_names = (
+    "소한",
+    "대한",
+    "입춘",
+    "우수",
+    "경칩",
+    "춘분",
+    "청명",
+    "곡우",
+    "입하",
+    "소만",
+    "망종",
+    "하지",
+    "소서",
+    "대서",
+    "입추",
+    "처서",
+    "백로",
+    "추분",
+    "한로",
+    "상강",
+    "입동",
+    "소설",
+    "대설",
+    "동지",
+)
+solar_term_codes = {name: code for code, name in enumerate(solar_term_names)}
+IPCHUN_CODE = solar_term_codes[SolarTermNameChoices.IPCHUN.value]
+
+# 천문 계산(solar_longitude) 결과가 바뀌면 올립니다. (HTTP 캐시 무효화)
+ASTRONOMICAL_VERSION = 1
+
+# 절기 스냅샷 파일 (scripts/build_solar_term_snapshot.py 로 생성)
+SNAPSHOT_PATH = os.getenv(
+    "SOLAR_TERM_SNAPSHOT_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "data", "solar_terms.bin"),
+)
+SNAPSHOT_MAGIC = b"SAJUSTS\0"
+SNAPSHOT_VERSION = 1
+# 헤더(64바이트): magic, version(u16), reserved(u16), count(u32), sha256(payload), padding
+# 본문: count x int64(LE) epoch 초 + count x uint8 절기 코드
+_snapshot_header = struct.Struct("<8sHHI32s16x")
+
+
+class SolarTermEntry(NamedTuple):
+    """인메모리 인덱스에서 조회한 절기 (SolarTerm 레코드와 같은 name/kind/at 속성 제공)"""
+
+    name: str
+    kind: str
+    at: datetime.datetime
+
+
+class SolarTermIndex:
+    """
+    `solar_terms` 테이블의 불변 인메모리 인덱스
+
+    - 시각(epoch 초) 오름차순 배열과 절기 코드 배열을 bisect로 조회합니다. (O(log n), I/O 없음)
+    - 연도별 입춘 시각은 로드 시 한 번만 계산해 둡니다. (연도는 KST 기준)
+    """
+
+    __slots__ = ("_epochs", "_codes", "_ipchun_by_year", "_version")
+
+    def __init__(self, epochs, codes):
+        self._epochs = epochs
+        self._codes = codes
+        self._version = None
+        self._ipchun_by_year = {}
+        for epoch, code in zip(epochs, codes):
+            if code == IPCHUN_CODE:
+                year = datetime.datetime.fromtimestamp(epoch, KST).year
+                self._ipchun_by_year.setdefault(year, epoch)
+
+    @classmethod
+    def from_rows(cls, rows):
+        """(name, at) 목록으로 인덱스를 만듭니다. 알 수 없는 절기 이름은 건너뜁니다."""
+        pairs = sorted(
+            (int(at.timestamp()), solar_term_codes[name]) for name, at in rows if name in solar_term_codes
+        )
+        return cls(array("q", (epoch for epoch, _ in pairs)), bytes(code for _, code in pairs))
+
+    def __len__(self):
+        return len(self._epochs)
+
+    @property
+    def version(self):
+        """인덱스 내용(절기 시각/코드)의 해시 (처음 접근할 때 한 번만 계산)"""
+        if self._version is None:
+            digest = hashlib.sha256(memoryview(self._epochs).cast("B"))
+            digest.update(self._codes)
+            self._version = digest.hexdigest()[:16]
+        return self._version
+
+    def covers(self, dt):
+        """`dt`가 인덱스에 저장된 기간 안에 있는지 확인합니다."""
+        return len(self._epochs) > 0 and self._epochs[0] <= dt.timestamp() <= self._epochs[-1]
+
+    def _entry(self, i):
+        return SolarTermEntry(
+            name=solar_term_names[self._codes[i]],
+            kind=SolarTermKindChoices.JEOLGI.value,
+            at=datetime.datetime.fromtimestamp(self._epochs[i], UTC),
+        )
+
+    def previous_jeolgi(self, before_dt):
+        """`before_dt` 이전(미포함)의 가장 가까운 절기를 반환합니다."""
+        i = bisect.bisect_left(self._epochs, before_dt.timestamp()) - 1
+        while i >= 0 and self._codes[i] % 2:
+            i -= 1
+        return self._entry(i) if i >= 0 else None
+
+    def next_jeolgi(self, after_dt):
+        """`after_dt` 이후(미포함)의 가장 가까운 절기를 반환합니다."""
+        i = bisect.bisect_right(self._epochs, after_dt.timestamp())
+        while i < len(self._epochs) and self._codes[i] % 2:
+            i += 1
+        return self._entry(i) if i < len(self._epochs) else None
+
+    def bracketing_jeolgi(self, dt):
+        """`dt` 직전/직후(모두 미포함)의 절기를 한 번의 이진 탐색으로 반환합니다. (previous, next)"""
+        t = dt.timestamp()
+        i = bisect.bisect_left(self._epochs, t)
+        prev = i - 1
+        while prev >= 0 and self._codes[prev] % 2:
+            prev -= 1
+        following = i
+        while following < len(self._epochs) and (self._epochs[following] <= t or self._codes[following] % 2):
+            following += 1
+        return (
+            self._entry(prev) if prev >= 0 else None,
+            self._entry(following) if following < len(self._epochs) else None,
+        )
+
+    def ipchun_for_year(self, year):
+        """해당 연도(KST)의 입춘을 반환합니다."""
+        epoch = self._ipchun_by_year.get(year)
+        if epoch is None:
+            return None
+        return SolarTermEntry(
+            name=SolarTermNameChoices.IPCHUN.value,
+            kind=SolarTermKindChoices.JEOLGI.value,
+            at=datetime.datetime.fromtimestamp(epoch, UTC),
+        )
+
+
+class AstronomicalSolarTermSource:
+    """
+    천문 계산(`solar_longitude`)으로 절기를 구하는 소스
+
+    `SolarTermIndex`와 같은 인터페이스를 제공하며, 테이블 범위 밖의 날짜나
+    테이블을 사용할 수 없을 때 사용합니다. 연도별 계산 결과는 LRU 캐시됩니다.
+    """
+
+    def previous_jeolgi(self, before_dt):
+        """`before_dt` 이전(미포함)의 가장 가까운 절기를 반환합니다."""
+        t = before_dt.timestamp()
+        year = datetime.datetime.fromtimestamp(t, UTC).year
+        for y in (year + 1, year, year - 1):
+            epochs = solar_term_epochs(y)
+            for code in range(22, -1, -2):
+                if epochs[code] < t:
+                    return _astronomical_entry(code, epochs[code])
+        return None
+
+    def next_jeolgi(self, after_dt):
+        """`after_dt` 이후(미포함)의 가장 가까운 절기를 반환합니다."""
+        t = after_dt.timestamp()
+        year = datetime.datetime.fromtimestamp(t, UTC).year
+        for y in (year - 1, year, year + 1):
+            epochs = solar_term_epochs(y)
+            for code in range(0, 24, 2):
+                if epochs[code] > t:
+                    return _astronomical_entry(code, epochs[code])
+        return None
+
+    def ipchun_for_year(self, year):
+        """해당 연도의 입춘을 반환합니다."""
+        return _astronomical_entry(IPCHUN_CODE, solar_term_epochs(year)[IPCHUN_CODE])
+
+
+def _astronomical_entry(code, epoch):
+    return SolarTermEntry(
+        name=solar_term_names[code],
+        kind=SolarTermKindChoices.JEOLGI.value,
+        at=datetime.datetime.fromtimestamp(epoch, UTC),
+    )
+
+
+astronomical_source = AstronomicalSolarTermSource()
+
+
+def write_snapshot(index, path):
+    """인덱스를 버전/체크섬이 포함된 바이너리 스냅샷 파일로 저장합니다."""
+    epochs = array("q", index._epochs)
+    if sys.byteorder != "little":
+        epochs.byteswap()
+    payload = epochs.tobytes() + bytes(index._codes)
+    header = _snapshot_header.pack(
+        SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 0, len(epochs), hashlib.sha256(payload).digest()
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+def load_snapshot(path):
+    """
+    스냅샷 파일을 읽기 전용으로 메모리 매핑해 인덱스를 만듭니다.
+
+    배열을 파싱하지 않고 mmap 위의 memoryview를 그대로 bisect 하므로 콜드 스타트 비용이 거의 없습니다.
+    형식/버전/체크섬이 맞지 않으면 ValueError를 발생시킵니다.
+    """
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if len(mm) < _snapshot_header.size:
+        raise ValueError("스냅샷 헤더가 손상되었습니다.")
+    magic, version, _, count, checksum = _snapshot_header.unpack_from(mm, 0)
+    if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+        raise ValueError(f"지원하지 않는 스냅샷 형식입니다. (version={version})")
+    start = _snapshot_header.size
+    end = start + count * 9
+    if len(mm) != end:
+        raise ValueError("스냅샷 크기가 헤더와 일치하지 않습니다.")
+    view = memoryview(mm)
+    if hashlib.sha256(view[start:end]).digest() != checksum:
+        raise ValueError("스냅샷 체크섬이 일치하지 않습니다.")
+
+    if sys.byteorder == "little":
+        epochs = view[start : start + count * 8].cast("q")
+    else:
+        epochs = array("q", view[start : start + count * 8].tobytes())
+        epochs.byteswap()
+    codes = view[start + count * 8 : end]
+    return SolarTermIndex(epochs, codes)
+
+
+def _load_index_from_snapshot():
+    if not os.path.exists(SNAPSHOT_PATH):
+        return None
+    try:
+        index = load_snapshot(SNAPSHOT_PATH)
+    except (OSError, ValueError) as e:
+        print(f"⚠️  [절기] 스냅샷 로드 실패, DB 조회로 대체합니다: {e}")
+        return None
+    print(f"✅ [절기] 스냅샷 로드 완료 ({len(index)}건, {SNAPSHOT_PATH})")
+    return index
+
+
+# 스냅샷이 있으면 import 시점에 바로 매핑하고, 없으면 첫 조회 때 DB에서 로드합니다.
+_index = _load_index_from_snapshot()
+_index_lock = threading.Lock()
+# DB 로드 실패 시 재시도까지 대기 (그동안은 천문 계산 사용)
+_INDEX_RETRY_SECONDS = 60
+_index_retry_at = 0.0
+
+# 요청 경로에서 인덱스 로드를 기다리는 최대 시간 (초). 넘으면 로드는 백그라운드에서 계속하고 천문 계산을 사용합니다.
+SOLAR_TERM_INDEX_WAIT_SECONDS = float(os.getenv("SOLAR_TERM_INDEX_WAIT_SECONDS", "0.5"))
+# 진행 중인 비동기 인덱스 로드 (동시에 하나만 실행)과 요청이 그 로드를 기다리는 기한 (loop.time() 기준)
+_index_task = None
+_index_wait_until = 0.0
+
+
+def _index_rows_statement():
+    return (
+        select(SolarTerm.name, SolarTerm.at)
+        .where(SolarTerm.kind == SolarTermKindChoices.JEOLGI.value)
+        .order_by(SolarTerm.at.asc())
+    )
+
+
+def ipchun_statement(year):
+    """
+    해당 연도(KST) 입춘 1건을 조회하는 쿼리
+
+    `extract(year from at)` 대신 [해당 연도 1월 1일, 다음 해 1월 1일) 반열림 구간으로 거르므로
+    (name, at) 복합 인덱스 범위 스캔을 그대로 사용합니다.
+    """
+    return (
+        select(SolarTerm.name, SolarTerm.at)
+        .where(
+            SolarTerm.name == SolarTermNameChoices.IPCHUN.value,
+            SolarTerm.at >= datetime.datetime(year, 1, 1, tzinfo=KST),
+            SolarTerm.at < datetime.datetime(year + 1, 1, 1, tzinfo=KST),
+        )
+        .order_by(SolarTerm.at.asc())
+        .limit(1)
+    )
+
+
+def _load_index_from_db():
+    sync_engine = get_sync_engine()
+    if sync_engine is None:
+        raise Exception("동기 데이터베이스 엔진이 초기화되지 않았습니다. psycopg2-binary를 설치하세요.")
+    with Session(sync_engine) as session:
+        return SolarTermIndex.from_rows(session.execute(_index_rows_statement()).all())
+
+
+async def _load_index_from_db_async():
+    async with get_session_factory()() as session:
+        result = await session.execute(_index_rows_statement())
+        return SolarTermIndex.from_rows(result.all())
+
+
+def get_solar_term_index():
+    """
+    절기 인덱스를 반환합니다.
+
+    스냅샷 파일이 없으면 최초 호출 시 `solar_terms` 테이블 전체를 한 번만 읽어 인덱스를 만들고,
+    이후에는 DB에 접근하지 않습니다. (테이블이 비어 있으면 캐시하지 않습니다.)
+    """
+    global _index
+    if _index is not None:
+        return _index
+    with _index_lock:
+        if _index is None:
+            index = _load_index_from_db()
+            if not len(index):
+                return index
+            _index = index
+            print(f"✅ [절기] 인메모리 인덱스 로드 완료 ({len(index)}건)")
+    return _index
+
+
+async def _load_index_async():
+    global _index, _index_retry_at, _index_task
+    try:
+        index = await _load_index_from_db_async()
+    except Exception as e:
+        _index_retry_at = time.monotonic() + _INDEX_RETRY_SECONDS
+        print(f"⚠️  [절기] 인덱스 로드 실패, 천문 계산으로 대체합니다: {e}")
+        return
+    finally:
+        if _index_task is asyncio.current_task():
+            _index_task = None
+    if not len(index):
+        _index_retry_at = time.monotonic() + _INDEX_RETRY_SECONDS
+        print("⚠️  [절기] solar_terms 테이블이 비어 있어 천문 계산으로 대체합니다.")
+        return
+    if _index is None:
+        _index = index
+        print(f"✅ [절기] 인메모리 인덱스 로드 완료 ({len(index)}건)")
+
+
+async def ensure_solar_term_index(timeout=SOLAR_TERM_INDEX_WAIT_SECONDS):
+    """
+    비동기 엔진(asyncpg)으로 절기 인덱스를 준비합니다. (이미 로드되었으면 I/O 없이 바로 반환)
+
+    로드는 백그라운드 태스크 하나에서만 실행하고, 요청은 로드 시작 후 최대 `timeout`초까지만 기다립니다.
+    DB가 느리거나 응답하지 않아도 그 이후의 요청은 기다리지 않고 천문 계산으로 응답합니다. (`timeout=None`이면 끝까지 대기)
+    로드에 실패하거나 테이블이 비어 있으면 일정 시간 동안 재시도하지 않으며, 그동안은 천문 계산을 사용합니다.
+
+    Returns:
+        SolarTermIndex | None: 로드된 인덱스 (아직 없으면 None)
+    """
+    global _index_task, _index_wait_until
+    if _index is not None or time.monotonic() < _index_retry_at:
+        return _index
+    loop = asyncio.get_running_loop()
+    if _index_task is None or _index_task.get_loop() is not loop:
+        _index_task = loop.create_task(_load_index_async())
+        _index_wait_until = loop.time() + (timeout or 0.0)
+    if timeout is not None:
+        timeout = min(timeout, _index_wait_until - loop.time())
+        if timeout <= 0:
+            return _index
+    try:
+        # shield: 대기 시간이 지나도 로드 태스크는 취소하지 않습니다.
+        await asyncio.wait_for(asyncio.shield(_index_task), timeout)
+    except asyncio.TimeoutError:
+        pass
+    return _index
+
+
+def solar_term_dataset_version():
+    """
+    사주 결과에 영향을 주는 절기 데이터의 버전 (HTTP 캐시 검증용)
+
+    로드된 인메모리 인덱스의 내용 해시와 천문 계산 버전을 합친 값입니다.
+    인덱스가 없으면(천문 계산으로만 대체 중) None을 반환합니다. 이때의 결과는 절기 경계 근처에서 달라질 수 있어 캐시하면 안 됩니다.
+    DB 조회는 하지 않으므로 `ensure_solar_term_index()` 이후에 호출합니다.
+    """
+    if _index is None or not len(_index):
+        return None
+    return f"{_index.version}.a{ASTRONOMICAL_VERSION}"
+
+
+def _get_index_or_none():
+    """
+    인덱스를 사용할 수 없으면 None을 반환합니다.
+
+    로드 실패 후 일정 시간 동안, 또는 비동기 로드(`ensure_solar_term_index`)가 진행 중이면 동기 로드를 하지 않습니다.
+    """
+    global _index_retry_at
+    if _index is not None:
+        return _index
+    if _index_task is not None or time.monotonic() < _index_retry_at:
+        return None
+    try:
+        index = get_solar_term_index()
+    except Exception as e:
+        _index_retry_at = time.monotonic() + _INDEX_RETRY_SECONDS
+        print(f"⚠️  [절기] 인덱스 로드 실패, 천문 계산으로 대체합니다: {e}")
+        return None
+    return index if len(index) else None
+
+
+def jeolgi_table(first_year, last_year):
+    """
+    first_year~last_year(UTC 연도) 구간의 절기를 시각 오름차순으로 반환합니다. (벡터 연산용)
+
+    `get_previous_jeolgi` 등과 같은 소스를 사용합니다. (연도, 절기 코드)마다 인덱스 값을 우선 쓰고,
+    인덱스에 없는 절기만 천문 계산 값으로 채웁니다. (인덱스가 12절기를 모두 가진 연도는 천문 계산을 하지 않음)
+
+    Returns:
+        tuple: (epoch 초 목록, 절기 코드 목록)
+    """
+    index = _get_index_or_none()
+    pairs = []
+    for year in range(first_year, last_year + 1):
+        terms = {}
+        if index is not None:
+            epochs, codes = index._epochs, index._codes
+            lo = bisect.bisect_left(epochs, datetime.datetime(year, 1, 1, tzinfo=UTC).timestamp())
+            hi = bisect.bisect_left(epochs, datetime.datetime(year + 1, 1, 1, tzinfo=UTC).timestamp(), lo)
+            terms = {codes[i]: epochs[i] for i in range(lo, hi) if codes[i] % 2 == 0}
+        if len(terms) < 12:
+            astronomical = solar_term_epochs(year)
+            for code in range(0, 24, 2):
+                terms.setdefault(code, astronomical[code])
+        pairs.extend((epoch, code) for code, epoch in terms.items())
+    pairs.sort()
+    return [epoch for epoch, _ in pairs], [code for _, code in pairs]
+
+
+class ChartSolarTerms(NamedTuple):
+    """사주 1건에 필요한 절기"""
+
+    ipchun: SolarTermEntry  # 출생 연도의 입춘
+    previous: SolarTermEntry | None  # 출생 직전 절기
+    next: SolarTermEntry | None  # 출생 직후 절기
+
+
+def resolve_chart_terms(birth):
+    """
+    사주 1건에 필요한 절기(출생 연도의 입춘, 출생 직전/직후 절기)를 한 번에 구합니다.
+
+    인덱스 조회는 한 번만 하고 직전/직후 절기는 같은 이진 탐색 위치에서 구합니다.
+    (각 항목의 소스 선택은 `get_ipchun_for_year`, `get_previous_jeolgi`, `get_next_jeolgi`와 같습니다.)
+    """
+    index = _get_index_or_none()
+    previous = following = ipchun = None
+    if index is not None:
+        ipchun = index.ipchun_for_year(birth.year)
+        if index.covers(birth):
+            previous, following = index.bracketing_jeolgi(birth)
+    return ChartSolarTerms(
+        ipchun=ipchun or astronomical_source.ipchun_for_year(birth.year),
+        previous=previous or astronomical_source.previous_jeolgi(birth),
+        next=following or astronomical_source.next_jeolgi(birth),
+    )
+
+
+def get_ipchun_for_year(year):
+    """해당 연도의 입춘을 반환합니다. (테이블 인덱스 우선, 없으면 천문 계산)"""
+    index = _get_index_or_none()
+    if index is not None:
+        entry = index.ipchun_for_year(year)
+        if entry is not None:
+            return entry
+    return astronomical_source.ipchun_for_year(year)
+
+
+def get_previous_jeolgi(before_dt):
+    """`before_dt` 이전의 가장 가까운 절기를 반환합니다. (테이블 범위 밖이면 천문 계산)"""
+    index = _get_index_or_none()
+    if index is not None and index.covers(before_dt):
+        entry = index.previous_jeolgi(before_dt)
+        if entry is not None:
+            return entry
+    return astronomical_source.previous_jeolgi(before_dt)
+
+
+def get_next_jeolgi(after_dt):
+    """`after_dt` 이후의 가장 가까운 절기를 반환합니다. (테이블 범위 밖이면 천문 계산)"""
+    index = _get_index_or_none()
+    if index is not None and index.covers(after_dt):
+        entry = index.next_jeolgi(after_dt)
+        if entry is not None:
+            return entry
+    return astronomical_source.next_jeolgi(after_dt)
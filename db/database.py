@@ -6,84 +6,139 @@ from sqlalchemy.engine.url import make_url
 from sqlalchemy.exc import SQLAlchemyError, OperationalError
 from fastapi import HTTPException, status
 import os
+import threading
 from dotenv import load_dotenv
 
-# asyncpg 예외 처리
-try:
-    import asyncpg
-    ASYNCPG_AVAILABLE = True
-except ImportError:
-    ASYNCPG_AVAILABLE = False
+from db.pool import engine_options, install_pool_stats, pool_settings
+from db.query_log import install_query_log, query_log_settings
 
 # 환경 변수 로드
 load_dotenv()
 
-# 데이터베이스 URL 구성 (비동기용 asyncpg 드라이버 사용)
-DATABASE_URL_ORIGINAL = os.getenv(
-    "DATABASE_URL",
-)
-
-# 원본 URL 저장 (동기 엔진용)
-SYNC_DATABASE_URL = DATABASE_URL_ORIGINAL
-
-# 비동기용 URL 변환 (postgresql:// → postgresql+asyncpg://)
-DATABASE_URL = DATABASE_URL_ORIGINAL
-if DATABASE_URL.startswith("postgresql://"):
-    DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
-
-# DATABASE_URL 마스킹하여 출력
-try:
-    _url = make_url(DATABASE_URL)
-    print("🔌 [DB] URL =", _url.set(password="***"))
-except Exception:
-    print("🔌 [DB] URL 파싱 실패(형식 확인 필요)")
-
-# 비동기 SQLAlchemy 엔진 생성
-engine = create_async_engine(
-    DATABASE_URL,
-    pool_pre_ping=True,  # 연결이 끊어졌을 때 자동으로 재연결
-    pool_size=10,
-    max_overflow=20,
-    echo=True  # SQL 쿼리 로깅 활성화
-)
-
-# 동기 SQLAlchemy 엔진 생성 (saju.py 등에서 사용)
-# postgresql+asyncpg:// → postgresql+psycopg2:// 변환
-sync_database_url = SYNC_DATABASE_URL
-if sync_database_url.startswith("postgresql+asyncpg://"):
-    sync_database_url = sync_database_url.replace("postgresql+asyncpg://", "postgresql+psycopg2://", 1)
-elif sync_database_url.startswith("postgresql://"):
-    # psycopg2 사용 시도
+# Base 클래스 생성 (모델들이 상속받을 클래스)
+Base = declarative_base()
+
+# 엔진/세션 팩토리는 처음 사용할 때 생성합니다.
+# (DB를 쓰지 않는 요청만 처리하는 서버리스 인스턴스는 드라이버 import와 엔진 생성 비용을 내지 않음)
+_engine = None
+_sync_engine = None
+_sync_engine_created = False
+_session_factory = None
+_pool_stats = {}
+_engine_lock = threading.Lock()
+
+
+def get_database_url():
+    """비동기용 URL (postgresql:// → postgresql+asyncpg://)"""
+    url = os.getenv("DATABASE_URL")
+    if url.startswith("postgresql://"):
+        url = url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    return url
+
+
+def get_sync_database_url():
+    """동기용 URL (postgresql+asyncpg:// → postgresql+psycopg2://)"""
+    url = os.getenv("DATABASE_URL")
+    if url.startswith("postgresql+asyncpg://"):
+        url = url.replace("postgresql+asyncpg://", "postgresql+psycopg2://", 1)
+    elif url.startswith("postgresql://"):
+        # psycopg2 사용 시도
+        try:
+            import psycopg2
+            url = url.replace("postgresql://", "postgresql+psycopg2://", 1)
+        except ImportError:
+            # psycopg2가 없으면 기본 postgresql:// 사용 (psycopg2 설치 필요)
+            print("⚠️  [DB] psycopg2가 설치되지 않았습니다. 동기 엔진 사용을 위해 'pip install psycopg2-binary'를 실행하세요.")
+    return url
+
+
+def get_engine():
+    """비동기 SQLAlchemy 엔진 (최초 호출 시 생성)"""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                database_url = get_database_url()
+                # DATABASE_URL 마스킹하여 출력
+                try:
+                    print("🔌 [DB] URL =", make_url(database_url).set(password="***"))
+                except Exception:
+                    print("🔌 [DB] URL 파싱 실패(형식 확인 필요)")
+
+                # 풀 설정은 배포 형태별 프로필(db.pool)에서 결정
+                engine = create_async_engine(
+                    database_url,
+                    echo=query_log_settings.echo,  # 모든 SQL 출력은 로컬 디버깅용 (기본은 db.query_log의 샘플링/느린 쿼리 로그)
+                    **engine_options(is_async=True)
+                )
+                install_query_log(engine.sync_engine)
+                _pool_stats["async"] = (engine.sync_engine, install_pool_stats(engine.sync_engine))
+                _engine = engine
+    return _engine
+
+
+def get_sync_engine():
+    """
+    동기 SQLAlchemy 엔진 (최초 호출 시 생성, 절기 인덱스 로드 등에서 사용)
+
+    생성에 실패하면 None을 반환합니다.
+    """
+    global _sync_engine, _sync_engine_created
+    if not _sync_engine_created:
+        with _engine_lock:
+            if not _sync_engine_created:
+                try:
+                    _sync_engine = create_engine(
+                        get_sync_database_url(),
+                        echo=query_log_settings.echo,
+                        **engine_options(is_async=False)
+                    )
+                    install_query_log(_sync_engine)
+                    _pool_stats["sync"] = (_sync_engine, install_pool_stats(_sync_engine))
+                except Exception as e:
+                    print(f"⚠️  [DB] 동기 엔진 생성 실패: {e}")
+                    _sync_engine = None
+                _sync_engine_created = True
+    return _sync_engine
+
+
+def get_session_factory():
+    """비동기 세션 팩토리 (최초 호출 시 생성)"""
+    global _session_factory
+    if _session_factory is None:
+        _session_factory = async_sessionmaker(
+            get_engine(),
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autocommit=False,
+            autoflush=False
+        )
+    return _session_factory
+
+
+def _import_asyncpg():
+    # asyncpg 예외 처리용 (연결 오류가 났을 때만 import)
     try:
-        import psycopg2
-        sync_database_url = sync_database_url.replace("postgresql://", "postgresql+psycopg2://", 1)
+        import asyncpg
+        return asyncpg
     except ImportError:
-        # psycopg2가 없으면 기본 postgresql:// 사용 (psycopg2 설치 필요)
-        print("⚠️  [DB] psycopg2가 설치되지 않았습니다. 동기 엔진 사용을 위해 'pip install psycopg2-binary'를 실행하세요.")
-
-try:
-    sync_engine = create_engine(
-        sync_database_url,
-        pool_pre_ping=True,
-        pool_size=5,
-        max_overflow=10,
-        echo=False  # 동기 엔진은 로깅 비활성화 (비동기 엔진만 로깅)
-    )
-except Exception as e:
-    print(f"⚠️  [DB] 동기 엔진 생성 실패: {e}")
-    sync_engine = None
-
-# 비동기 세션 팩토리 생성
-AsyncSessionLocal = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False
-)
+        return None
 
-# Base 클래스 생성 (모델들이 상속받을 클래스)
-Base = declarative_base()
+
+def get_pool_stats():
+    """생성된 엔진별 연결 풀 통계 (엔진을 새로 만들지 않음)"""
+    return {
+        "profile": pool_settings.resolved_profile,
+        "engines": {name: stats.snapshot(engine.pool) for name, (engine, stats) in _pool_stats.items()},
+    }
+
+
+async def dispose_engines():
+    """생성된 엔진의 연결 풀을 정리합니다. (생성되지 않은 엔진은 건너뜀)"""
+    if _engine is not None:
+        await _engine.dispose()
+    if _sync_engine is not None:
+        _sync_engine.dispose()
 
 
 # 의존성 주입을 위한 비동기 데이터베이스 세션 생성 함수
@@ -107,7 +162,7 @@ async def get_db():
             return db_item
     """
     try:
-        async with AsyncSessionLocal() as session:
+        async with get_session_factory()() as session:
             try:
                 yield session
             except SQLAlchemyError as e:
@@ -130,7 +185,8 @@ async def get_db():
         error_type = type(e).__name__
         
         # asyncpg 예외 처리
-        if ASYNCPG_AVAILABLE and isinstance(e, (asyncpg.exceptions.InvalidAuthorizationSpecificationError,
+        asyncpg = _import_asyncpg()
+        if asyncpg is not None and isinstance(e, (asyncpg.exceptions.InvalidAuthorizationSpecificationError,
                                                 asyncpg.exceptions.InvalidPasswordError,
                                                 asyncpg.exceptions.InvalidCatalogNameError)):
             if "does not exist" in error_msg or "role" in error_msg.lower():
@@ -171,7 +227,7 @@ async def get_db():
 async def ping_db():
     """데이터베이스 연결 상태를 확인하고 정보를 출력합니다."""
     try:
-        async with engine.begin() as conn:
+        async with get_engine().begin() as conn:
             row = (await conn.execute(text(
                 "select current_user, current_database(), inet_server_addr(), inet_server_port();"
             ))).one()
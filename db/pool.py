@@ -0,0 +1,166 @@
+"""
+DB 연결 풀 프로필
+
+배포 형태에 맞는 연결 풀 설정을 고릅니다.
+
+- serverless: `NullPool` — 인스턴스마다 풀을 유지하지 않고, 요청마다 외부 풀러(PgBouncer, Supavisor 등)에 연결합니다.
+  트랜잭션 모드 풀러에서는 서버 측 prepared statement를 재사용할 수 없으므로 asyncpg 문 캐시를 끕니다.
+- server: `QueuePool` — uvicorn 워커처럼 오래 실행되는 프로세스용. LIFO로 최근 연결을 재사용하고,
+  체크아웃마다 왕복하는 pre-ping 대신 `pool_recycle`과 끊김 오류 시 풀 무효화(SQLAlchemy 기본 동작)로 재연결합니다.
+
+환경 변수:
+    DB_POOL_PROFILE=auto        auto(VERCEL 환경 변수가 있으면 serverless, 아니면 server) / serverless / server
+    DB_POOL_SIZE=5              server: 비동기 엔진 풀 크기
+    DB_POOL_MAX_OVERFLOW=5      server: 비동기 엔진 추가 연결 수
+    DB_POOL_SYNC_SIZE=2         server: 동기 엔진 풀 크기 (절기 인덱스 로드 등 드물게 사용)
+    DB_POOL_SYNC_MAX_OVERFLOW=2 server: 동기 엔진 추가 연결 수
+    DB_POOL_TIMEOUT=10          server: 연결 대기 최대 시간(초)
+    DB_POOL_RECYCLE=1800        server: 이 시간(초)보다 오래된 연결은 체크아웃 시 다시 연결
+    DB_POOL_PRE_PING=false      체크아웃마다 연결 확인 (외부 풀러가 연결을 자주 끊는 경우에만)
+"""
+
+import os
+import threading
+import time
+from typing import Literal
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from sqlalchemy import event
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
+
+
+class PoolSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="DB_POOL_", env_file=".env", extra="ignore")
+
+    profile: Literal["auto", "serverless", "server"] = "auto"
+    size: int = Field(default=5, ge=1)
+    max_overflow: int = Field(default=5, ge=0)
+    sync_size: int = Field(default=2, ge=1)
+    sync_max_overflow: int = Field(default=2, ge=0)
+    timeout: float = Field(default=10.0, gt=0)
+    recycle: int = Field(default=1800, ge=-1)
+    pre_ping: bool = False
+
+    @property
+    def resolved_profile(self):
+        if self.profile != "auto":
+            return self.profile
+        return "serverless" if os.getenv("VERCEL") else "server"
+
+
+pool_settings = PoolSettings()
+
+
+class PoolStats:
+    """엔진 1개의 연결 풀 통계 (체크아웃/체크인/새 연결 수, 연결 대기 시간)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checked_out = 0
+        self.checkouts = 0
+        self.connects = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def record_wait(self, seconds):
+        with self._lock:
+            self.waits += 1
+            self.wait_seconds += seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+
+    def _on_connect(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.connects += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        with self._lock:
+            self.checked_out += 1
+            self.checkouts += 1
+
+    def _on_checkin(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.checked_out -= 1
+
+    def snapshot(self, pool):
+        with self._lock:
+            stats = {
+                "pool": type(pool).__name__,
+                "checked_out": self.checked_out,
+                "checkouts": self.checkouts,
+                "connects": self.connects,
+                "wait_ms_avg": round(self.wait_seconds / self.waits * 1000, 3) if self.waits else 0.0,
+                "wait_ms_max": round(self.max_wait_seconds * 1000, 3),
+            }
+        if isinstance(pool, QueuePool):
+            stats.update(size=pool.size(), checked_in=pool.checkedin(), overflow=pool.overflow())
+        return stats
+
+
+class _TimedGetMixin:
+    # 풀에서 연결을 꺼낼 때까지 걸린 시간(대기 + 새 연결)을 기록합니다.
+    pool_stats = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            if self.pool_stats is not None:
+                self.pool_stats.record_wait(time.perf_counter() - start)
+
+    def recreate(self):
+        # dispose() 이후 새로 만든 풀에도 같은 통계를 이어서 기록합니다.
+        pool = super().recreate()
+        pool.pool_stats = self.pool_stats
+        return pool
+
+
+class TimedQueuePool(_TimedGetMixin, QueuePool):
+    pass
+
+
+class TimedAsyncAdaptedQueuePool(_TimedGetMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def engine_options(is_async):
+    """
+    현재 프로필의 `create_engine` / `create_async_engine` 풀 관련 인자
+
+    Args:
+        is_async: 비동기(asyncpg) 엔진이면 True
+    """
+    if pool_settings.resolved_profile == "serverless":
+        options = {"poolclass": NullPool, "pool_pre_ping": pool_settings.pre_ping}
+        if is_async:
+            # 트랜잭션 모드 외부 풀러에서는 연결마다 백엔드가 바뀌므로 prepared statement 캐시를 끕니다.
+            options["connect_args"] = {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+        return options
+
+    return {
+        "poolclass": TimedAsyncAdaptedQueuePool if is_async else TimedQueuePool,
+        "pool_size": pool_settings.size if is_async else pool_settings.sync_size,
+        "max_overflow": pool_settings.max_overflow if is_async else pool_settings.sync_max_overflow,
+        "pool_timeout": pool_settings.timeout,
+        "pool_recycle": pool_settings.recycle,
+        "pool_use_lifo": True,
+        "pool_pre_ping": pool_settings.pre_ping,
+    }
+
+
+def install_pool_stats(engine):
+    """
+    엔진의 풀에 통계 수집 이벤트를 등록하고 `PoolStats`를 반환합니다.
+
+    Args:
+        engine: 동기 `Engine` (비동기 엔진은 `async_engine.sync_engine`)
+    """
+    stats = PoolStats()
+    if isinstance(engine.pool, _TimedGetMixin):
+        engine.pool.pool_stats = stats
+    event.listen(engine, "connect", stats._on_connect)
+    event.listen(engine, "checkout", stats._on_checkout)
+    event.listen(engine, "checkin", stats._on_checkin)
+    return stats
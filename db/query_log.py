@@ -0,0 +1,130 @@
+"""
+구조화 쿼리 로그
+
+SQLAlchemy `echo`(모든 SQL과 파라미터를 포맷해 출력) 대신, 쿼리 실행 시간을 재서
+느린 쿼리와 샘플링된 쿼리만 JSON 한 줄로 출력합니다.
+
+    {"event": "db.query", "fingerprint": "3f2a9c1e0b7d", "statement": "SELECT ...", "duration_ms": 12.3,
+     "rows": 1, "slow": false, "request_id": "..."}
+
+- fingerprint: 공백을 정리한 SQL 문의 해시 (파라미터는 바인딩 변수이므로 같은 쿼리는 같은 값)
+- request_id: 요청의 `X-Request-ID` 헤더 (없으면 생성) — `RequestIdMiddleware`가 설정
+- rows: 드라이버가 알려주는 영향/반환 행 수 (모르면 null)
+- 파라미터 값은 출력하지 않습니다.
+
+환경 변수 (기본값은 운영 환경용 저비용 설정):
+    DB_QUERY_LOG_ENABLED=true         쿼리 시간 측정/로그 사용 여부
+    DB_QUERY_LOG_SAMPLE_RATE=0.0      느리지 않은 쿼리의 출력 비율 (0.0~1.0)
+    DB_QUERY_LOG_SLOW_MS=200          이 시간(ms) 이상 걸린 쿼리는 항상 출력
+    DB_QUERY_LOG_MAX_STATEMENT=500    출력할 SQL 문 최대 길이
+    DB_QUERY_LOG_ECHO=false           SQLAlchemy echo (로컬 디버깅용, 모든 SQL 출력)
+"""
+
+import hashlib
+import json
+import random
+import re
+import time
+import uuid
+from contextvars import ContextVar
+from functools import lru_cache
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from sqlalchemy import event
+
+
+class QueryLogSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="DB_QUERY_LOG_", env_file=".env", extra="ignore")
+
+    enabled: bool = True
+    sample_rate: float = Field(default=0.0, ge=0.0, le=1.0)
+    slow_ms: float = Field(default=200.0, ge=0.0)
+    max_statement: int = Field(default=500, ge=0)
+    echo: bool = False
+
+
+query_log_settings = QueryLogSettings()
+
+# 현재 요청 ID (요청 밖에서 실행된 쿼리는 None)
+request_id_var: ContextVar = ContextVar("request_id", default=None)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=1024)
+def _fingerprint(statement):
+    normalized = _WHITESPACE.sub(" ", statement).strip()
+    return hashlib.sha1(normalized.encode()).hexdigest()[:12], normalized
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_log_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    duration_ms = (time.perf_counter() - context._query_log_start) * 1000
+    slow = duration_ms >= query_log_settings.slow_ms
+    if not slow and (query_log_settings.sample_rate <= 0.0 or random.random() >= query_log_settings.sample_rate):
+        return
+
+    fingerprint, normalized = _fingerprint(statement)
+    rows = cursor.rowcount
+    record = {
+        "event": "db.query",
+        "fingerprint": fingerprint,
+        "statement": normalized[: query_log_settings.max_statement],
+        "duration_ms": round(duration_ms, 3),
+        "rows": rows if rows >= 0 else None,  # 드라이버가 행 수를 모르면 -1
+        "slow": slow,
+        "request_id": request_id_var.get(),
+    }
+    print(json.dumps(record, ensure_ascii=False))
+
+
+def install_query_log(engine):
+    """
+    엔진에 쿼리 로그 이벤트를 등록합니다.
+
+    Args:
+        engine: 동기 `Engine` (비동기 엔진은 `async_engine.sync_engine`)
+    """
+    if not query_log_settings.enabled:
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class RequestIdMiddleware:
+    """
+    요청마다 `request_id_var`를 설정하고 응답 헤더 `X-Request-ID`로 돌려주는 ASGI 미들웨어
+
+    요청에 `X-Request-ID` 헤더가 있으면 그 값을, 없으면 새 UUID를 사용합니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                request_id = value.decode("latin-1")[:128]
+                break
+        if not request_id:
+            request_id = uuid.uuid4().hex
+        token = request_id_var.set(request_id)
+
+        async def send_with_request_id(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", []), (b"x-request-id", request_id.encode("latin-1"))]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            request_id_var.reset(token)
@@ -1,78 +1,57 @@
-import csv
-import datetime
+import hmac
 import os
+from typing import Annotated, Optional
 
-from fastapi import FastAPI
+from fastapi import APIRouter, Depends, FastAPI, Header, HTTPException, status
 from fastapi.responses import HTMLResponse
 from contextlib import asynccontextmanager
 
-from sqlalchemy import select, func as sa_func
-
-from db.database import engine, Base, ping_db, AsyncSessionLocal
+from db.database import Base, dispose_engines, get_engine, get_pool_stats, ping_db
+from db.query_log import RequestIdMiddleware
+from api.compression import CompressionMiddleware
 from api.v1 import users, items, saju_api
+from api.v1.saju import chart_cache
+from api.v1.solar_terms import ensure_solar_term_index
 
 # 모델들을 import하여 테이블 생성에 포함되도록 함
 from models import user, item, solar_term
 
+# 내부 엔드포인트(/internal/*) 접근 토큰. 설정하지 않으면 내부 엔드포인트는 404를 반환합니다.
+INTERNAL_API_TOKEN = os.getenv("INTERNAL_API_TOKEN", "")
+
 
 async def seed_solar_terms_if_empty():
     """
     애플리케이션 최초 실행 시에만 `solar_term.csv`를 읽어
-    `solar_terms` 테이블을 채웁니다.
+    `solar_terms` 테이블을 채웁니다. (절기 + 중기, COPY로 일괄 적재)
 
     - 테이블에 이미 데이터가 1건이라도 있으면 아무 것도 하지 않습니다.
     - CSV 파일이 없으면 조용히 건너뜁니다.
+    - 데이터 갱신은 `python -m scripts.seed_solar_terms --csv solar_term.csv`로 실행합니다.
     """
     csv_path = os.path.join(os.path.dirname(__file__), "solar_term.csv")
     if not os.path.exists(csv_path):
         print("⚠️  [DB] solar_term.csv 파일을 찾을 수 없어 시드를 건너뜁니다.")
         return
 
-    from models.solar_term import SolarTerm, SolarTermKindChoices
+    from scripts.build_solar_term_snapshot import read_csv_rows
+    from scripts.seed_solar_terms import seed_solar_terms, solar_term_records
 
-    async with AsyncSessionLocal() as session:
-        # 이미 데이터가 있는지 확인
-        result = await session.execute(sa_func.count(SolarTerm.id))
-        count = result.scalar_one()
-        if count and count > 0:
-            print(f"ℹ️  [DB] solar_terms 테이블에 이미 {count}건의 데이터가 있어 시드를 건너뜁니다.")
-            return
-
-        rows = []
-        try:
-            with open(csv_path, newline="", encoding="utf-8") as f:
-                reader = csv.reader(f)
-                for row in reader:
-                    # CSV 컬럼: id, created_at, updated_at, name, kind(절기/중기), at
-                    if len(row) < 6:
-                        continue
-                    _, _created_at, _updated_at, name, kind_kr, at_str = row
-
-                    # 사주 계산에서 사용하는 것은 '절기'만이므로, 우선 절기만 넣습니다.
-                    if kind_kr == "절기":
-                        kind = SolarTermKindChoices.JEOLGI.value
-                    else:
-                        # 필요하면 중기도 나중에 확장 가능
-                        continue
-
-                    try:
-                        at = datetime.datetime.fromisoformat(at_str.strip())
-                    except ValueError:
-                        # 파싱 실패 시 해당 행만 건너뜀
-                        continue
-
-                    rows.append(SolarTerm(name=name, kind=kind, at=at))
-        except Exception as e:
-            print(f"⚠️  [DB] solar_term.csv 읽기 중 오류: {e}")
-            return
+    try:
+        records = solar_term_records(read_csv_rows(csv_path))
+    except Exception as e:
+        print(f"⚠️  [DB] solar_term.csv 읽기 중 오류: {e}")
+        return
 
-        if not rows:
-            print("⚠️  [DB] solar_term.csv 에서 삽입할 유효한 절기 데이터가 없습니다.")
-            return
+    if not records:
+        print("⚠️  [DB] solar_term.csv 에서 삽입할 유효한 절기 데이터가 없습니다.")
+        return
 
-        session.add_all(rows)
-        await session.commit()
-        print(f"✅ [DB] solar_terms 시드 완료 (삽입 {len(rows)}건)")
+    count = await seed_solar_terms(records, if_empty=True)
+    if count:
+        print(f"✅ [DB] solar_terms 시드 완료 (삽입 {count}건)")
+    else:
+        print("ℹ️  [DB] solar_terms 테이블에 이미 데이터가 있어 시드를 건너뜁니다.")
 
 
 # 애플리케이션 시작 시 데이터베이스 테이블 생성 및 초기 데이터 시드
@@ -85,7 +64,7 @@ async def lifespan(app: FastAPI):
     # 2. 비동기 테이블 생성 (연결 성공 시에만)
     if db_connected:
         try:
-            async with engine.begin() as conn:
+            async with get_engine().begin() as conn:
                 print("✅ [DB] 테이블 생성 완료")
                 # await conn.run_sync(Base.metadata.create_all)
 
@@ -93,6 +72,12 @@ async def lifespan(app: FastAPI):
             # await seed_solar_terms_if_empty()
         except Exception as e:
             print(f"⚠️  [DB] 테이블 생성/시드 중 오류: {e}")
+
+        # 4. 절기 인메모리 인덱스 미리 로드 (첫 사주 요청의 DB 왕복 제거)
+        try:
+            await ensure_solar_term_index(timeout=None)
+        except Exception as e:
+            print(f"⚠️  [절기] 인덱스 로드 중 오류: {e}")
     else:
         print("⚠️  [DB] 데이터베이스 연결 실패로 테이블 생성을 건너뜁니다.")
         print("⚠️  [DB] API는 실행되지만 데이터베이스 작업은 실패할 수 있습니다.")
@@ -101,7 +86,7 @@ async def lifespan(app: FastAPI):
     
     # 종료 시 실행
     try:
-        await engine.dispose()
+        await dispose_engines()
         print("✅ [DB] 연결 종료 완료")
     except Exception as e:
         print(f"⚠️  [DB] 연결 종료 중 오류: {e}")
@@ -114,12 +99,55 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# 요청 ID (쿼리 로그와 응답 헤더 X-Request-ID에 사용)
+app.add_middleware(RequestIdMiddleware)
+# 응답 압축 (zstd / br / gzip, Accept-Encoding 협상)
+app.add_middleware(CompressionMiddleware)
+
 # API 라우터 등록
 app.include_router(users.router, prefix="/api/v1")
 app.include_router(items.router, prefix="/api/v1")
 app.include_router(saju_api.router, prefix="/api/v1")
 
 
+def require_internal_token(authorization: Annotated[Optional[str], Header()] = None):
+    """
+    내부 엔드포인트 인증 (`Authorization: Bearer <INTERNAL_API_TOKEN>`)
+
+    토큰이 설정되지 않았으면 엔드포인트가 없는 것처럼 404를, 토큰이 맞지 않으면 401을 반환합니다.
+    """
+    if not INTERNAL_API_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    expected = f"Bearer {INTERNAL_API_TOKEN}".encode()
+    if authorization is None or not hmac.compare_digest(authorization.encode(), expected):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Unauthorized",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+# 운영용 내부 엔드포인트 (OpenAPI 스키마에 노출하지 않음)
+internal_router = APIRouter(
+    prefix="/internal", include_in_schema=False, dependencies=[Depends(require_internal_token)]
+)
+
+
+@internal_router.get("/db/pool")
+def get_db_pool_stats():
+    """DB 연결 풀 프로필과 엔진별 풀 통계 (체크아웃 수, 오버플로, 연결 대기 시간)"""
+    return get_pool_stats()
+
+
+@internal_router.get("/saju/cache")
+def get_chart_cache_stats():
+    """사주 응답 캐시의 크기와 적중/미스 횟수"""
+    return chart_cache.stats()
+
+
+app.include_router(internal_router)
+
+
 @app.get("/api/data")
 def get_sample_data():
     return {
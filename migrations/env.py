@@ -0,0 +1,49 @@
+"""
+Alembic 마이그레이션 환경
+
+DATABASE_URL(.env 포함)을 db.database와 같은 방식으로 읽어 동기(psycopg2) 엔진으로 실행합니다.
+
+사용 예시 (프로젝트 루트에서):
+    alembic upgrade head
+    alembic revision --autogenerate -m "설명"
+"""
+
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine, pool
+
+from db.database import Base, get_sync_database_url
+from models import item, solar_term, user  # noqa: F401 (메타데이터 등록)
+
+config = context.config
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def run_migrations_offline():
+    """DB 연결 없이 SQL 스크립트만 출력합니다. (alembic upgrade head --sql)"""
+    context.configure(
+        url=get_sync_database_url(),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online():
+    connectable = create_engine(get_sync_database_url(), poolclass=pool.NullPool)
+    with connectable.connect() as connection:
+        context.configure(connection=connection, target_metadata=target_metadata)
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,36 @@
+"""solar_terms 복합 인덱스 추가
+
+- (kind, at): 절기 인덱스 로드, 직전/직후 절기 조회 (kind = '절기' AND at < / > :dt ORDER BY at)
+- (name, at): 연도별 입춘 조회 (name = '입춘' AND at >= :year_start AND at < :next_year_start)
+
+solar_terms 테이블이 이미 운영 중이므로 CONCURRENTLY로 잠금 없이 생성하고,
+create_all로 먼저 만들어진 경우를 위해 IF NOT EXISTS를 사용합니다.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+_INDEXES = (
+    ("ix_solar_terms_kind_at", ["kind", "at"]),
+    ("ix_solar_terms_name_at", ["name", "at"]),
+)
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        for name, columns in _INDEXES:
+            op.create_index(name, "solar_terms", columns, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, _ in _INDEXES:
+            op.drop_index(name, table_name="solar_terms", postgresql_concurrently=True, if_exists=True)
@@ -1,6 +1,6 @@
 import enum
 
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import Column, Integer, String, DateTime, Index
 from sqlalchemy.sql import func
 
 from db.database import Base
@@ -10,32 +10,46 @@ class SolarTermKindChoices(str, enum.Enum):
     """
     절기 종류
 
-    - JEOLGI: 24절기(소한, 입춘, 경칩 등)
+    - JEOLGI: 절기 (소한, 입춘, 경칩 등 월의 시작. 사주 월주/대운 계산에 사용)
+    - JUNGGI: 중기 (대한, 우수, 춘분 등 월의 중간)
     """
 
     JEOLGI = "JEOLGI"
+    JUNGGI = "JUNGGI"
 
 
 class SolarTermNameChoices(str, enum.Enum):
     """
     절기 이름
 
-    `saju.py`의 `jeolgi_to_branch`에서 사용하는 절기들만 우선 정의했습니다.
+    24절기를 황경 순서대로 정의했습니다. (절기/중기 교대)
     값(value)은 실제 DB에 저장될 문자열입니다.
     """
 
     SOHAN = "소한"
+    DAEHAN = "대한"
     IPCHUN = "입춘"
+    USU = "우수"
     GYEONGCHIP = "경칩"
+    CHUNBUN = "춘분"
     CHEONGMYEONG = "청명"
+    GOGU = "곡우"
     IPHA = "입하"
+    SOMAN = "소만"
     MANGJONG = "망종"
+    HAJI = "하지"
     SOSEO = "소서"
+    DAESEO = "대서"
     IPCHU = "입추"
+    CHEOSEO = "처서"
     BAEGRO = "백로"
+    CHUBUN = "추분"
     HANRO = "한로"
+    SANGGANG = "상강"
     IPDONG = "입동"
+    SOSEOL = "소설"
     DAESEOL = "대설"
+    DONGJI = "동지"
 
 
 class SolarTerm(Base):
@@ -43,7 +57,7 @@ class SolarTerm(Base):
     사주 계산에 필요한 절기 정보 테이블
 
     - `name` : 절기 이름 (예: '입춘', '소한' …)
-    - `kind` : 절기 종류 (현재는 JEOLGI 만 사용)
+    - `kind` : 절기 종류 (JEOLGI: 절기 / JUNGGI: 중기)
     - `at`   : 절기 발생 시각(UTC 또는 타임존 포함)
     """
 
@@ -54,7 +68,7 @@ class SolarTerm(Base):
     # 절기 이름 (예: '입춘', '소한' …)
     name = Column(String, nullable=False, index=True)
 
-    # 절기 종류 (예: 'JEOLGI')
+    # 절기 종류 (예: 'JEOLGI', 'JUNGGI')
     kind = Column(String, nullable=False, index=True)
 
     # 절기 발생 시각 (timezone 포함)
@@ -63,4 +77,11 @@ class SolarTerm(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    __table_args__ = (
+        # 종류별 시각 순 조회 (인덱스 로드, 직전/직후 절기)
+        Index("ix_solar_terms_kind_at", "kind", "at"),
+        # 이름 + 시각 범위 조회 (연도별 입춘: at >= 해당 연도 1월 1일 AND at < 다음 해 1월 1일)
+        Index("ix_solar_terms_name_at", "name", "at"),
+    )
+
 
@@ -1,7 +1,7 @@
-from datetime import datetime
-from typing import Literal, Dict, Any, List
+from datetime import date, datetime
+from typing import Literal, Dict, Any, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 
 class SajuRequest(BaseModel):
@@ -18,18 +18,107 @@ class SajuRequest(BaseModel):
     birth_longitude: float = Field(..., description="출생지 경도 (도 단위)")
 
 
+# 사주 계산이 지원하는 연도 범위 (`Saju._validate_year`와 같음)
+SAJU_MIN_YEAR = 1000
+SAJU_MAX_YEAR = 2999
+
+# 연운/일진 조회 1회당 최대 기간
+LUCK_MAX_YEARS = 1000
+DAILY_PILLAR_MAX_DAYS = 200 * 366
+
+
+class SajuAnnualLuckRequest(SajuRequest):
+    """
+    연운 조회 요청 스키마
+
+    - start_year, end_year: 조회할 연도 범위 (양끝 포함)
+    """
+
+    start_year: int = Field(..., ge=SAJU_MIN_YEAR, le=SAJU_MAX_YEAR, description="시작 연도")
+    end_year: int = Field(..., ge=SAJU_MIN_YEAR, le=SAJU_MAX_YEAR, description="종료 연도 (포함)")
+
+    @model_validator(mode="after")
+    def check_range(self):
+        if self.end_year < self.start_year:
+            raise ValueError("end_year는 start_year보다 작을 수 없습니다.")
+        if self.end_year - self.start_year >= LUCK_MAX_YEARS:
+            raise ValueError(f"한 번에 최대 {LUCK_MAX_YEARS}년까지 조회할 수 있습니다.")
+        return self
+
+
+class SajuMonthlyLuckRequest(SajuRequest):
+    """
+    월운 조회 요청 스키마
+
+    - year: 조회할 연도
+    - end_year: 여러 해를 조회할 때 종료 연도 (포함, 생략 시 year 한 해)
+    """
+
+    year: int = Field(..., ge=SAJU_MIN_YEAR, le=SAJU_MAX_YEAR, description="연도")
+    end_year: Optional[int] = Field(None, ge=SAJU_MIN_YEAR, le=SAJU_MAX_YEAR, description="종료 연도 (포함)")
+
+    @model_validator(mode="after")
+    def check_range(self):
+        if self.end_year is None:
+            return self
+        if self.end_year < self.year:
+            raise ValueError("end_year는 year보다 작을 수 없습니다.")
+        if self.end_year - self.year >= LUCK_MAX_YEARS:
+            raise ValueError(f"한 번에 최대 {LUCK_MAX_YEARS}년까지 조회할 수 있습니다.")
+        return self
+
+
+class SajuDailyPillarRequest(SajuRequest):
+    """
+    일진 조회 요청 스키마
+
+    - start_date, end_date: 조회할 날짜 범위 (양끝 포함)
+    """
+
+    start_date: date = Field(..., description="시작 날짜")
+    end_date: date = Field(..., description="종료 날짜 (포함)")
+
+    @model_validator(mode="after")
+    def check_range(self):
+        if self.end_date < self.start_date:
+            raise ValueError("end_date는 start_date보다 이를 수 없습니다.")
+        if (self.end_date - self.start_date).days >= DAILY_PILLAR_MAX_DAYS:
+            raise ValueError(f"한 번에 최대 {DAILY_PILLAR_MAX_DAYS}일까지 조회할 수 있습니다.")
+        return self
+
+
 class SajuResponse(BaseModel):
     """
     사주 계산 결과 스키마
 
-    깊이 있는 해석용 전체 정보를 그대로 반환합니다.
+    `fields`를 지정하지 않으면 pillars를 제외한 전체 정보를 반환합니다.
+    `fields`를 지정하면 요청한 항목만 포함합니다. (major_luck → major_luck_start_age, major_luck_set)
     """
 
-    spti: str
-    stem_branch: Dict[str, Any]
-    five_elements: Dict[str, int]
-    yin_yang: Dict[str, int]
-    major_luck_start_age: int
-    major_luck_set: List[Dict[str, Any]]
+    spti: Optional[str] = None
+    pillars: Optional[Dict[str, str]] = Field(None, description="네 기둥 간지 이름 (year, month, day, hour)")
+    stem_branch: Optional[Dict[str, Any]] = None
+    five_elements: Optional[Dict[str, int]] = None
+    yin_yang: Optional[Dict[str, int]] = None
+    major_luck_start_age: Optional[int] = None
+    major_luck_set: Optional[List[Dict[str, Any]]] = None
+
+
+class SajuBatchItem(BaseModel):
+    """
+    일괄 사주 계산의 개별 결과
+
+    - index: 요청 목록에서의 위치
+    - result: 계산 결과 (실패 시 null)
+    - error: 실패 사유 (성공 시 null)
+    """
+
+    index: int
+    result: Optional[SajuResponse] = None
+    error: Optional[str] = None
+
 
+class SajuBatchResponse(BaseModel):
+    """일괄 사주 계산 결과 스키마 (요청 순서와 동일)"""
 
+    items: List[SajuBatchItem]
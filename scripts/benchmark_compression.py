@@ -0,0 +1,110 @@
+"""
+응답 압축 벤치마크 스크립트
+
+세 가지 응답 본문을 인코딩/레벨별로 압축해 전송 크기(bytes-on-wire)와 압축 CPU 시간을 비교합니다.
+
+- 사주 1건: `POST /api/v1/saju/` 기본 응답 (--charts 건의 평균)
+- 일괄 계산: `POST /api/v1/saju/batch` 응답 (--batch 건)
+- 일진 1년: `GET /api/v1/saju/daily-pillars` NDJSON 365줄
+  (한 번에 압축 + 미들웨어와 같은 `StreamCompressor` 줄 단위 스트리밍 압축, `COMPRESSION_STREAM_FLUSH_BYTES`마다 flush)
+
+`*` 표시는 현재 설정(`COMPRESSION_*` 환경 변수) 레벨입니다. brotli/zstandard가 없으면 해당 인코딩은 건너뜁니다.
+
+사용 예시 (프로젝트 루트에서):
+    python -m scripts.benchmark_compression
+    python -m scripts.benchmark_compression --batch 10000 --charts 500
+"""
+
+import argparse
+import datetime
+import time
+
+from api import compression
+from api.compression import StreamCompressor, compress, compression_settings
+from api.v1.saju import Saju
+from api.v1.saju_api import _ndjson, _render_batch, saju_response_json
+from schemas.saju import SajuRequest
+from scripts.benchmark_saju_batch import random_births
+
+_LEVELS = {"gzip": (1, 6, 9), "br": (1, 4, 6), "zstd": (1, 3, 9)}
+
+
+def _configured_levels():
+    return {
+        "gzip": compression_settings.gzip_level,
+        "br": compression_settings.brotli_quality,
+        "zstd": compression_settings.zstd_level,
+    }
+
+
+def _encodings():
+    installed = {"gzip": True, "br": compression.brotli is not None, "zstd": compression.zstandard is not None}
+    configured = _configured_levels()
+    return [
+        (encoding, level, level == configured[encoding])
+        for encoding, levels in _LEVELS.items()
+        if installed[encoding]
+        for level in sorted({*levels, configured[encoding]})
+    ]
+
+
+def _one_shot(body, encoding, level):
+    return len(compress(body, encoding, level))
+
+
+def _stream(chunks, encoding, level):
+    # CompressionMiddleware의 스트리밍 경로와 같음 (StreamingResponse는 마지막에 빈 청크를 보냄)
+    encoder = StreamCompressor(encoding, level)
+    return sum(len(encoder.feed(chunk)) for chunk in chunks) + len(encoder.feed(b"", last=True))
+
+
+def _measure(bodies, encode):
+    # 본문 1개당 평균 전송 크기와 CPU 시간
+    start = time.process_time()
+    total = sum(encode(body) for body in bodies)
+    return total / len(bodies), (time.process_time() - start) / len(bodies)
+
+
+def _report(title, bodies, encode_one, raw_size):
+    print(f"\n[{title}] 원본 {raw_size:,.0f} bytes")
+    print(f"{'인코딩':<12} {'전송 bytes':>12} {'비율':>7} {'CPU ms':>10} {'MB/s':>8}")
+    for encoding, level, configured in _encodings():
+        size, seconds = _measure(bodies, lambda body: encode_one(body, encoding, level))
+        label = f"{encoding}-{level}{' *' if configured else ''}"
+        throughput = raw_size / seconds / 1e6 if seconds else float("inf")
+        print(f"{label:<12} {size:>12,.0f} {size / raw_size:>7.1%} {seconds * 1000:>10.3f} {throughput:>8.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="응답 압축 벤치마크")
+    parser.add_argument("--charts", type=int, default=200, help="사주 1건 측정에 사용할 출생 건수")
+    parser.add_argument("--batch", type=int, default=10000, help="일괄 계산 건수")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    births = [SajuRequest(**payload) for payload in random_births(max(args.charts, args.batch), args.seed)]
+
+    charts = [
+        saju_response_json(Saju(birth=request.birth, gender=request.gender, birth_longitude=request.birth_longitude))
+        for request in births[: args.charts]
+    ]
+    batch = _render_batch(births[: args.batch])
+
+    request = births[0]
+    saju = Saju(birth=request.birth, gender=request.gender, birth_longitude=request.birth_longitude)
+    lines = list(_ndjson(saju.iter_daily_pillars(datetime.date(2024, 1, 1), datetime.date(2024, 12, 31))))
+    daily = b"".join(lines)
+
+    _report(f"사주 1건 (평균, {args.charts}건)", charts, _one_shot, sum(map(len, charts)) / len(charts))
+    _report(f"일괄 계산 {args.batch}건", [batch], _one_shot, len(batch))
+    _report("일진 1년 (한 번에 압축)", [daily], _one_shot, len(daily))
+    _report(
+        f"일진 1년 (줄 단위 스트리밍, flush {compression_settings.stream_flush_bytes} bytes)",
+        [lines],
+        _stream,
+        len(daily),
+    )
+
+
+if __name__ == "__main__":
+    main()
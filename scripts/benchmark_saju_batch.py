@@ -0,0 +1,80 @@
+"""
+사주 일괄 계산 벤치마크 스크립트
+
+- 단건: POST /api/v1/saju/ 를 출생 건수만큼 호출
+- 일괄: POST /api/v1/saju/batch 를 --chunk 건씩 나누어 호출
+- 두 결과가 요청 순서대로 일치하는지도 확인합니다.
+
+TestClient(인프로세스)로 호출하므로 네트워크 왕복 비용은 포함되지 않습니다.
+각 측정 전에 응답 캐시를 비웁니다.
+
+사용 예시 (프로젝트 루트에서):
+    python -m scripts.benchmark_saju_batch
+    python -m scripts.benchmark_saju_batch -n 10000 --chunk 5000
+"""
+
+import argparse
+import datetime
+import json
+import random
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.v1 import saju_api
+from api.v1.saju import chart_cache
+
+KST = datetime.timezone(datetime.timedelta(hours=9))
+
+
+def random_births(n, seed):
+    rng = random.Random(seed)
+    start = datetime.datetime(1940, 1, 1, tzinfo=KST)
+    span = int((datetime.datetime(2020, 1, 1, tzinfo=KST) - start).total_seconds())
+    return [
+        {
+            "birth": (start + datetime.timedelta(seconds=rng.randrange(span))).isoformat(),
+            "gender": rng.choice(("male", "female")),
+            "birth_longitude": round(rng.uniform(124.0, 131.0), 2),
+        }
+        for _ in range(n)
+    ]
+
+
+def _report(label, n, seconds):
+    print(f"{label:<24} {seconds:>8.2f} s {n / seconds:>10.0f} 건/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="사주 일괄 계산 벤치마크")
+    parser.add_argument("-n", type=int, default=10000, help="출생 건수")
+    parser.add_argument("--chunk", type=int, default=saju_api.SAJU_BATCH_MAX_ITEMS, help="일괄 요청 1회당 건수")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    app = FastAPI()
+    app.include_router(saju_api.router, prefix="/api/v1")
+    client = TestClient(app)
+    births = random_births(args.n, args.seed)
+
+    chart_cache.clear()
+    start = time.perf_counter()
+    single = [client.post("/api/v1/saju/", json=b).json() for b in births]
+    _report("단건 엔드포인트", args.n, time.perf_counter() - start)
+
+    chart_cache.clear()
+    start = time.perf_counter()
+    batch = []
+    for i in range(0, args.n, args.chunk):
+        batch.extend(client.post("/api/v1/saju/batch", json=births[i : i + args.chunk]).json()["items"])
+    _report("일괄 엔드포인트", args.n, time.perf_counter() - start)
+
+    mismatches = sum(
+        json.dumps(s, sort_keys=True) != json.dumps(b["result"], sort_keys=True) for s, b in zip(single, batch)
+    )
+    print(f"결과 불일치 {mismatches}건 / 캐시 {chart_cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
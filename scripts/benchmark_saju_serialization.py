@@ -0,0 +1,80 @@
+"""
+사주 응답 직렬화 벤치마크 스크립트
+
+계산이 끝난 사주(모든 속성 캐시됨) 1건을 응답 bytes로 만드는 시간만 비교합니다.
+
+- FastAPI 기본 경로: 응답 dict로 `SajuResponse` 생성(검증) → response_model 재검증 → `jsonable_encoder` → `json.dumps`
+- pydantic 직렬화: 응답 dict로 `SajuResponse(...).model_dump_json(exclude_unset=True)`
+- orjson 직접 직렬화: `saju_response_json()` (현재 API 경로, 결과 구조체를 그대로 직렬화)
+
+pydantic 경로에 넣을 dict는 측정 전에 미리 만들어 둡니다.
+
+세 결과가 같은 JSON인지도 확인합니다.
+
+사용 예시 (프로젝트 루트에서):
+    python -m scripts.benchmark_saju_serialization
+    python -m scripts.benchmark_saju_serialization -n 5000
+"""
+
+import argparse
+import json
+import time
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+
+from api.v1.saju import Saju
+from api.v1.saju_api import saju_response_json
+from schemas.saju import SajuRequest, SajuResponse
+from scripts.benchmark_saju_batch import random_births
+
+
+def fastapi_default(fields):
+    # 핸들러가 모델을 반환하면 FastAPI가 response_model로 다시 검증한 뒤 jsonable_encoder + json.dumps로 직렬화
+    content = SajuResponse.model_validate(SajuResponse(**fields).model_dump(exclude_unset=True))
+    return json.dumps(
+        jsonable_encoder(content, exclude_unset=True), ensure_ascii=False, separators=(",", ":")
+    ).encode()
+
+
+def pydantic_dump(fields):
+    return SajuResponse(**fields).model_dump_json(exclude_unset=True).encode()
+
+
+def _report(label, n, seconds):
+    print(f"{label:<24} {seconds / n * 1e6:>10.1f} µs/건")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="사주 응답 직렬화 벤치마크")
+    parser.add_argument("-n", type=int, default=2000, help="사주 건수")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    charts = []
+    fields = []
+    for payload in random_births(args.n, args.seed):
+        request = SajuRequest(**payload)
+        saju = Saju(birth=request.birth, gender=request.gender, birth_longitude=request.birth_longitude)
+        # 계산 결과를 미리 캐시해 직렬화 시간만 측정
+        fields.append(orjson.loads(saju_response_json(saju)))
+        charts.append(saju)
+
+    results = {}
+    for label, serialize, inputs in (
+        ("FastAPI 기본 경로", fastapi_default, fields),
+        ("pydantic model_dump_json", pydantic_dump, fields),
+        ("orjson 직접 직렬화", saju_response_json, charts),
+    ):
+        start = time.perf_counter()
+        results[label] = [serialize(item) for item in inputs]
+        _report(label, args.n, time.perf_counter() - start)
+
+    parsed = [[json.loads(body) for body in bodies] for bodies in results.values()]
+    mismatches = sum(any(p != parsed[0][i] for p in (other[i] for other in parsed[1:])) for i in range(args.n))
+    identical = sum(a == b for a, b in zip(results["pydantic model_dump_json"], results["orjson 직접 직렬화"]))
+    print(f"결과 불일치 {mismatches}건 / model_dump_json과 bytes 동일 {identical}/{args.n}건")
+
+
+if __name__ == "__main__":
+    main()
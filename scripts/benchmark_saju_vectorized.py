@@ -0,0 +1,101 @@
+"""
+벡터화 사주 계산 벤치마크 / 교차 검증 스크립트
+
+- 교차 검증: 무작위 출생(여러 타임존, 서머타임 포함)에 대해 `Saju`와 결과가 같은지 확인합니다.
+- 처리량: `compute_pillars`의 초당 계산 건수를 측정합니다.
+
+사용 예시 (프로젝트 루트에서, numpy 필요):
+    python -m scripts.benchmark_saju_vectorized
+    python -m scripts.benchmark_saju_vectorized --check 20000 -n 1000000
+"""
+
+import argparse
+import datetime
+import random
+import time
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+from api.v1.saju import Saju
+from api.v1.saju_vectorized import compute_pillars
+
+ZONES = ("Asia/Seoul", "Asia/Tokyo", "America/New_York", "Europe/London", "Australia/Sydney", "Asia/Kathmandu")
+
+
+def random_births(n, seed, first_year=1901, last_year=2099):
+    rng = random.Random(seed)
+    start = datetime.datetime(first_year, 1, 1, tzinfo=datetime.timezone.utc).timestamp()
+    end = datetime.datetime(last_year, 12, 31, tzinfo=datetime.timezone.utc).timestamp()
+    births = []
+    for _ in range(n):
+        zone = ZoneInfo(rng.choice(ZONES))
+        birth = datetime.datetime.fromtimestamp(rng.randrange(int(start), int(end)), zone)
+        births.append((birth, rng.choice(("male", "female")), rng.uniform(-180.0, 180.0)))
+    return births
+
+
+def to_arrays(births):
+    return (
+        [b.timestamp() for b, _, _ in births],
+        [b.utcoffset().total_seconds() for b, _, _ in births],
+        [(b.dst() or datetime.timedelta(0)).total_seconds() for b, _, _ in births],
+        [lon for _, _, lon in births],
+        [gender == "male" for _, gender, _ in births],
+    )
+
+
+def cross_check(n, seed):
+    births = random_births(n, seed)
+    result = compute_pillars(*to_arrays(births))
+    mismatches = 0
+    for i, (birth, gender, lon) in enumerate(births):
+        saju = Saju(birth, gender, lon)
+        expected = (*saju.pillars, saju.is_forward, saju.major_luck_start_age)
+        actual = (
+            result.year[i],
+            result.month[i],
+            result.day[i],
+            result.hour[i],
+            bool(result.is_forward[i]),
+            result.major_luck_start_age[i],
+        )
+        if tuple(int(v) for v in actual) != tuple(int(v) for v in expected):
+            mismatches += 1
+            if mismatches <= 10:
+                print(f"  불일치: {birth.isoformat()} {gender} {lon:.2f} -> {actual} != {expected}")
+    print(f"교차 검증: {n}건 중 불일치 {mismatches}건")
+
+
+def bench(n, seed):
+    rng = np.random.default_rng(seed)
+    start = datetime.datetime(1930, 1, 1, tzinfo=datetime.timezone.utc).timestamp()
+    end = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc).timestamp()
+    arrays = (
+        rng.uniform(start, end, n),
+        np.full(n, 9 * 3600.0),
+        np.zeros(n),
+        rng.uniform(124.0, 131.0, n),
+        rng.random(n) < 0.5,
+    )
+    compute_pillars(*arrays)  # 절기 배열 준비 (연도 구간별 캐시)
+    t = time.perf_counter()
+    compute_pillars(*arrays)
+    elapsed = time.perf_counter() - t
+    print(f"compute_pillars: {n}건 {elapsed:.3f} s ({n / elapsed:,.0f} 건/s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="벡터화 사주 계산 벤치마크")
+    parser.add_argument("--check", type=int, default=5000, help="Saju와 교차 검증할 건수")
+    parser.add_argument("-n", type=int, default=1000000, help="처리량 측정 건수")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.check:
+        cross_check(args.check, args.seed)
+    bench(args.n, args.seed)
+
+
+if __name__ == "__main__":
+    main()
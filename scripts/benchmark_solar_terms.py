@@ -0,0 +1,120 @@
+"""
+절기 소스 벤치마크 / 교차 검증 스크립트
+
+- 천문 계산: 연도별 24절기 계산 비용 (LRU 캐시 미적중 / 적중)
+- 인메모리 인덱스: 스냅샷(있을 경우) 조회 비용
+- DB: 기존 방식의 절기 1건 / 연도별 입춘 조회 비용 (--db 지정 시, DATABASE_URL 필요)
+- --csv 지정 시 천문 계산 결과와 CSV 절기 시각의 오차를 보고합니다.
+
+사용 예시 (프로젝트 루트에서):
+    python -m scripts.benchmark_solar_terms
+    python -m scripts.benchmark_solar_terms --db --csv solar_term.csv
+"""
+
+import argparse
+import datetime
+import statistics
+import time
+
+from api.v1.solar_longitude import solar_term_epochs
+from api.v1.solar_terms import (
+    SolarTermIndex,
+    _load_index_from_snapshot,
+    astronomical_source,
+    ipchun_statement,
+    solar_term_codes,
+)
+from scripts.build_solar_term_snapshot import read_csv_rows
+
+
+def _timeit(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def _report(label, seconds):
+    print(f"{label:<40} {seconds * 1e6:>12.1f} µs")
+
+
+def bench_astronomical(years):
+    solar_term_epochs.cache_clear()
+    start = time.perf_counter()
+    for year in years:
+        solar_term_epochs(year)
+    _report("천문 계산 (연도별, 캐시 미적중)", (time.perf_counter() - start) / len(years))
+
+    birth = datetime.datetime(1997, 1, 1, 3, 30, tzinfo=datetime.timezone.utc)
+    _report("천문 계산 previous_jeolgi (캐시 적중)", _timeit(lambda: astronomical_source.previous_jeolgi(birth), 10000))
+
+
+def bench_index(index, label):
+    birth = datetime.datetime(1997, 1, 1, 3, 30, tzinfo=datetime.timezone.utc)
+    _report(f"{label} previous_jeolgi", _timeit(lambda: index.previous_jeolgi(birth), 10000))
+    _report(f"{label} ipchun_for_year", _timeit(lambda: index.ipchun_for_year(1997), 10000))
+
+
+def bench_db(repeat):
+    from sqlalchemy import select
+    from sqlalchemy.orm import Session
+
+    from db.database import get_sync_engine
+    from models.solar_term import SolarTerm, SolarTermKindChoices
+
+    sync_engine = get_sync_engine()
+    birth = datetime.datetime(1997, 1, 1, 3, 30, tzinfo=datetime.timezone.utc)
+
+    def query():
+        with Session(sync_engine) as session:
+            stmt = (
+                select(SolarTerm)
+                .where(SolarTerm.kind == SolarTermKindChoices.JEOLGI.value, SolarTerm.at < birth)
+                .order_by(SolarTerm.at.desc())
+            )
+            session.execute(stmt).scalars().first()
+
+    query()  # 연결 워밍업
+    _report("DB previous_jeolgi (Session 1회)", _timeit(query, repeat))
+
+    def query_ipchun():
+        with Session(sync_engine) as session:
+            session.execute(ipchun_statement(1997)).first()
+
+    _report("DB ipchun_for_year (Session 1회)", _timeit(query_ipchun, repeat))
+
+
+def cross_check(csv_path):
+    index = SolarTermIndex.from_rows(read_csv_rows(csv_path))
+    diffs = []
+    for epoch, code in zip(index._epochs, index._codes):
+        year = datetime.datetime.fromtimestamp(epoch, datetime.timezone.utc).year
+        computed = solar_term_epochs(year)[code]
+        diffs.append(computed - epoch)
+    abs_diffs = [abs(d) for d in diffs]
+    print(f"CSV 교차 검증: {len(diffs)}건 ({len(solar_term_codes)}종)")
+    print(f"  평균 오차 {statistics.mean(abs_diffs):.1f}s / 최대 오차 {max(abs_diffs)}s")
+    print(f"  60초 초과 {sum(d > 60 for d in abs_diffs)}건")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="절기 소스 벤치마크")
+    parser.add_argument("--db", action="store_true", help="DB 조회 비용도 측정")
+    parser.add_argument("--csv", help="천문 계산과 비교할 solar_term.csv 경로")
+    args = parser.parse_args()
+
+    bench_astronomical(range(1900, 2101))
+
+    snapshot_index = _load_index_from_snapshot()
+    if snapshot_index is not None:
+        bench_index(snapshot_index, "스냅샷 인덱스")
+    if args.csv:
+        bench_index(SolarTermIndex.from_rows(read_csv_rows(args.csv)), "CSV 인덱스")
+    if args.db:
+        bench_db(200)
+    if args.csv:
+        cross_check(args.csv)
+
+
+if __name__ == "__main__":
+    main()
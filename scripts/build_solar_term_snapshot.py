@@ -0,0 +1,53 @@
+"""
+절기 스냅샷 빌드 스크립트
+
+`solar_term.csv` 또는 `solar_terms` 테이블을 읽어 `api/v1/saju.py`가 import 시점에
+메모리 매핑하는 바이너리 스냅샷 파일(기본: data/solar_terms.bin)을 생성합니다.
+
+사용 예시 (프로젝트 루트에서):
+    python -m scripts.build_solar_term_snapshot --csv solar_term.csv
+    python -m scripts.build_solar_term_snapshot --db
+"""
+
+import argparse
+import csv
+import datetime
+
+from api.v1.solar_terms import SNAPSHOT_PATH, SolarTermIndex, _load_index_from_db, load_snapshot, write_snapshot
+
+
+def read_csv_rows(csv_path):
+    """CSV(id, created_at, updated_at, name, kind, at)에서 (name, at) 목록을 읽습니다. 절기/중기 모두 포함합니다."""
+    rows = []
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        for row in csv.reader(f):
+            if len(row) < 6:
+                continue
+            _, _created_at, _updated_at, name, _kind_kr, at_str = row
+            try:
+                at = datetime.datetime.fromisoformat(at_str.strip())
+            except ValueError:
+                continue
+            rows.append((name, at))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="절기 바이너리 스냅샷 생성")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--csv", help="solar_term.csv 경로")
+    source.add_argument("--db", action="store_true", help="solar_terms 테이블에서 읽기 (DATABASE_URL 필요)")
+    parser.add_argument("--out", default=SNAPSHOT_PATH, help=f"출력 경로 (기본: {SNAPSHOT_PATH})")
+    args = parser.parse_args()
+
+    index = SolarTermIndex.from_rows(read_csv_rows(args.csv)) if args.csv else _load_index_from_db()
+    if not len(index):
+        raise SystemExit("⚠️  스냅샷에 기록할 절기 데이터가 없습니다.")
+
+    write_snapshot(index, args.out)
+    # 기록한 파일을 다시 읽어 체크섬까지 검증
+    print(f"✅ 스냅샷 생성 완료: {args.out} ({len(load_snapshot(args.out))}건)")
+
+
+if __name__ == "__main__":
+    main()
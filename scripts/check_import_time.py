@@ -0,0 +1,68 @@
+"""
+`import main` 시간 예산 검사 스크립트 (콜드 스타트 회귀 방지)
+
+새 인터프리터에서 `import main`을 --repeat 회 실행해 가장 빠른 시간을 예산과 비교하고,
+import만으로 DB 엔진이 생성되지 않았는지도 확인합니다. 실패하면 종료 코드 1을 반환하므로 CI에서 사용할 수 있습니다.
+
+사용 예시 (프로젝트 루트에서, DATABASE_URL 필요 — 연결은 하지 않음):
+    python -m scripts.check_import_time
+    python -m scripts.check_import_time --budget-ms 400 --repeat 5
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+_PROBE = """
+import json, time
+start = time.perf_counter()
+import main
+elapsed = time.perf_counter() - start
+import db.database as database
+print(json.dumps({
+    "ms": elapsed * 1000,
+    "engines": [name for name in ("_engine", "_sync_engine") if getattr(database, name) is not None],
+}))
+"""
+
+
+def _probe():
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE], capture_output=True, text=True, check=True, cwd=os.getcwd()
+    )
+    # main import 중 출력되는 로그는 건너뛰고 마지막 줄(JSON)만 읽습니다.
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="import main 시간 예산 검사")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=float(os.getenv("IMPORT_TIME_BUDGET_MS", "500")),
+        help="허용 시간(ms, 기본: IMPORT_TIME_BUDGET_MS 또는 500)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="측정 횟수 (가장 빠른 값 사용)")
+    args = parser.parse_args()
+
+    probes = [_probe() for _ in range(args.repeat)]
+    best = min(probe["ms"] for probe in probes)
+    engines = probes[-1]["engines"]
+
+    failed = False
+    if engines:
+        print(f"❌ import 시점에 DB 엔진이 생성되었습니다: {', '.join(engines)}")
+        failed = True
+    if best > args.budget_ms:
+        print(f"❌ import main {best:.1f} ms > 예산 {args.budget_ms:.0f} ms")
+        failed = True
+    else:
+        print(f"✅ import main {best:.1f} ms (예산 {args.budget_ms:.0f} ms)")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+절기 테이블 시드/갱신 스크립트
+
+`solar_term.csv`의 24절기(절기 + 중기)를 asyncpg `copy_records_to_table`로 `solar_terms` 테이블에 적재합니다.
+
+- CSV 전체를 임시 스테이징 테이블에 COPY한 뒤, 한 트랜잭션에서 본 테이블을 DELETE로 비우고 스테이징 내용으로 교체합니다.
+  (다른 연결은 교체 중에도 기다리지 않고 커밋 전까지 기존 데이터를 읽으며, 몇 번을 다시 실행해도 결과가 같습니다)
+- TRUNCATE는 ACCESS EXCLUSIVE 잠금으로 읽기까지 막으므로 사용하지 않습니다. (약 4,800건이라 DELETE 비용은 작음)
+- `kind`는 CSV의 종류 컬럼 대신 절기 이름으로 결정합니다. (짝수 코드 = 절기, 홀수 코드 = 중기)
+- 행 단위 ORM INSERT가 없으므로 200년치(약 4,800건)도 1초 이내에 끝납니다.
+
+사용 예시 (프로젝트 루트에서, DATABASE_URL 필요):
+    python -m scripts.seed_solar_terms --csv solar_term.csv
+    python -m scripts.seed_solar_terms --csv solar_term.csv --if-empty
+"""
+
+import argparse
+import asyncio
+import time
+
+import asyncpg
+from sqlalchemy.engine.url import make_url
+
+from api.v1.solar_terms import solar_term_codes
+from db.database import get_database_url
+from models.solar_term import SolarTerm, SolarTermKindChoices
+from scripts.build_solar_term_snapshot import read_csv_rows
+
+_TABLE = SolarTerm.__tablename__
+_STAGING_TABLE = f"{_TABLE}_staging"
+_COLUMNS = ("name", "kind", "at")
+
+
+def solar_term_records(rows):
+    """(name, at) 목록을 COPY용 (name, kind, at) 레코드로 바꿉니다. 알 수 없는 절기 이름과 중복 행은 건너뜁니다."""
+    records = {}
+    for name, at in rows:
+        code = solar_term_codes.get(name)
+        if code is None:
+            continue
+        kind = SolarTermKindChoices.JUNGGI if code % 2 else SolarTermKindChoices.JEOLGI
+        records[(name, at)] = (name, kind.value, at)
+    return sorted(records.values(), key=lambda record: record[2])
+
+
+def _asyncpg_dsn():
+    # asyncpg는 SQLAlchemy 드라이버 표기(postgresql+asyncpg://)를 이해하지 못하므로 순수 DSN으로 바꿉니다.
+    return make_url(get_database_url()).set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+async def seed_solar_terms(records, if_empty=False):
+    """
+    `solar_terms` 테이블을 records로 교체합니다.
+
+    Args:
+        records: `solar_term_records()`가 만든 (name, kind, at) 목록
+        if_empty: True면 테이블에 데이터가 있을 때 아무 것도 하지 않습니다.
+
+    Returns:
+        int: 적재한 행 수 (건너뛰었으면 0)
+    """
+    conn = await asyncpg.connect(_asyncpg_dsn())
+    try:
+        async with conn.transaction():
+            if if_empty and await conn.fetchval(f"SELECT EXISTS (SELECT 1 FROM {_TABLE})"):
+                return 0
+
+            await conn.execute(
+                f"CREATE TEMP TABLE {_STAGING_TABLE} (name text NOT NULL, kind text NOT NULL, at timestamptz NOT NULL) "
+                "ON COMMIT DROP"
+            )
+            await conn.copy_records_to_table(_STAGING_TABLE, records=records, columns=_COLUMNS)
+
+            # 교체: DELETE는 MVCC로 처리되므로 커밋 전까지 다른 연결은 잠금 대기 없이 기존 데이터를 읽습니다.
+            await conn.execute(f"DELETE FROM {_TABLE}")
+            await conn.execute(
+                f"INSERT INTO {_TABLE} (name, kind, at) SELECT name, kind, at FROM {_STAGING_TABLE} ORDER BY at"
+            )
+        return len(records)
+    finally:
+        await conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="solar_terms 테이블 시드/갱신 (COPY)")
+    parser.add_argument("--csv", required=True, help="solar_term.csv 경로")
+    parser.add_argument("--if-empty", action="store_true", help="테이블이 비어 있을 때만 적재")
+    args = parser.parse_args()
+
+    records = solar_term_records(read_csv_rows(args.csv))
+    if not records:
+        raise SystemExit("⚠️  적재할 절기 데이터가 없습니다.")
+
+    start = time.perf_counter()
+    count = asyncio.run(seed_solar_terms(records, if_empty=args.if_empty))
+    elapsed = time.perf_counter() - start
+    if count:
+        print(f"✅ [DB] solar_terms 적재 완료 ({count}건, {elapsed:.3f}s)")
+    else:
+        print("ℹ️  [DB] solar_terms 테이블에 이미 데이터가 있어 적재를 건너뜁니다.")
+
+
+if __name__ == "__main__":
+    main()